@@ -4,10 +4,12 @@ from textual.widgets import Static, Button, Input
 from textual.events import Click
 from textual.message import Message
 from textual.reactive import reactive
+from textual.worker import get_current_worker
 from rich.text import Text
 from datetime import datetime
 from utils.logger import Logger
 from components.sidebar import Sidebar
+from functools import partial
 
 class AccountList(Widget):
     selected_index = reactive(0)
@@ -239,7 +241,24 @@ class AccountManagementWidget(Vertical):
 
     def switch_to_account(self, username):
         self.logger.info(f"Switching to account: {username}")
-        if self.reddit_service.switch_account(username):
+        # Instant with a warmed-up session, otherwise it has to authenticate first
+        self.run_worker(
+            partial(self._switch_account, username),
+            name=f"switch_{username}",
+            group="switch_account",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _switch_account(self, username):
+        switched = self.reddit_service.switch_account(username)
+        if not get_current_worker().is_cancelled:
+            self.post_message(self.SwitchFinished(username, switched))
+
+    def on_account_management_widget_switch_finished(self, message: "AccountManagementWidget.SwitchFinished"):
+        message.stop()
+        username = message.username
+        if message.switched:
             current_account = self.reddit_service.get_current_account()
             if current_account:
                 sidebar = self.app.query_one(Sidebar)
@@ -258,6 +277,12 @@ class AccountManagementWidget(Vertical):
     def on_add_account_form_cancelled(self, message: AddAccountForm.Cancelled):
         self.show_account_list()
 
+    class SwitchFinished(Message):
+        def __init__(self, username, switched):
+            super().__init__()
+            self.username = username
+            self.switched = switched
+
     class AccountSwitched(Message):
         def __init__(self, username):
             super().__init__()
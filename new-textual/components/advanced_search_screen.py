@@ -214,9 +214,10 @@ class AdvancedSearchScreen(ModalScreen):
                 self.notify("No results found", severity="warning")
                 return
 
-            self.parent_content.remove_children()
-            header = Static(self.get_search_header(sort_value, time_value, type_value), id="search_header")
-            post_list = PostList(posts=self.search_results, id="content")
+            self.parent_content.park()
+            # No id, the header of an earlier search may still be parked next to it
+            header = Static(self.get_search_header(sort_value, time_value, type_value))
+            post_list = PostList(posts=self.search_results)
             self.parent_content.mount(header)
             self.parent_content.mount(post_list)
             self.app.active_widget = "content"
@@ -126,15 +126,8 @@ class PostCreationScreen(Widget):
             self.restore_post_list()
 
     def restore_post_list(self):
-        content = self.app.query_one("#content")
-        from components.post_list import PostList
-        posts = self.app.current_posts if hasattr(self.app, "current_posts") else []
-        content.remove_children()
-        post_list = PostList(posts=posts, id="content")
-        content.mount(post_list)
         self.app.active_widget = "content"
-        post_list.focus()
-        self.app.query_one("Sidebar").update_status("Home Feed")
+        self.app.show_previous_view()
 
     def submit_post(self):
         try:
@@ -1,42 +1,102 @@
-from textual.widgets import Static
-from textual.containers import Vertical, ScrollableContainer
-from textual.widget import Widget
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.reactive import reactive
 from textual.binding import Binding
+from textual.message import Message
+from textual.worker import get_current_worker
 from rich.text import Text
-from datetime import datetime
+from rich.cells import cell_len
+from rich._wrap import divide_line
+import time
+from functools import partial
 from utils.logger import Logger
-from textual.geometry import Region
+from utils.lru_cache import LRUCache
+from utils.row_offsets import RowOffsets
+from services.request_scheduler import CancellationToken
+from textual.geometry import Size
+
+class PostList(ScrollView):
+    """The posts of a feed, drawn with the line API.
+
+    Only the rows in view are rendered. _rows holds the height of every post
+    at the current width, so finding the first row of a post or the post on a
+    row is O(log n) and moving the cursor repaints just the two posts involved.
+    """
+
+    DEFAULT_CSS = """
+    PostList {
+        overflow-y: scroll;
+        overflow-x: hidden;
+        padding: 1;
+    }
+    """
 
-class PostList(Widget):
     BINDINGS = [
         Binding("up", "cursor_up", "Up", show=True),
         Binding("down", "cursor_down", "Down", show=True),
     ]
 
-    selected_index = reactive(0)
+    # Start fetching the next page once the cursor is this many rows from the end
+    PREFETCH_THRESHOLD = 5
+    # Seconds between refreshes of the scores of the visible posts
+    REFRESH_INTERVAL = 60
+    # Comments are prefetched for the selected post and the ones after it once
+    # the cursor has rested for COMMENT_PREFETCH_DELAY seconds
+    COMMENT_PREFETCH_DELAY = 0.4
+    COMMENT_PREFETCH_AHEAD = 2
+    # Posts whose rendered rows are kept, see _post_strips
+    ROW_CACHE_SIZE = 512
+    # Measured post heights kept, see _post_height
+    HEIGHT_CACHE_SIZE = 20000
+
+    # Cursor moves repaint only the rows they touch, see watch_selected_index
+    selected_index = reactive(0, repaint=False)
+
+    class PageLoaded(Message):
+        def __init__(self, after, posts):
+            super().__init__()
+            self.after = after
+            self.posts = posts
 
-    def __init__(self, posts=None, id=None):
+    class PostsRefreshed(Message):
+        def __init__(self, posts):
+            super().__init__()
+            self.posts = posts
+
+    def __init__(self, posts=None, id=None, page_loader=None, after=None, post_filter=None, post_refresher=None,
+                 comment_prefetcher=None):
+        """page_loader(after) returns the raw page of posts following the given
+        fullname. post_filter, if given, is applied to every loaded page before
+        it is appended. after defaults to the fullname of the last post.
+        post_refresher(fullnames) returns {id: post} with the current state of
+        the given posts and is used to keep the visible scores up to date.
+        comment_prefetcher(post, cancel_token) warms the comment cache for a
+        post; it runs in a worker thread."""
         Logger().info("Initializing PostList widget")
         super().__init__(id=id)
         self.posts = posts or []
-        self.visible_posts = 10
         self.can_focus = True
-        self._post_list_static = None
-        self._post_container = None
-
-    def compose(self):
-        Logger().info("Composing PostList UI")
-        with ScrollableContainer(id="post_container") as container:
-            self._post_container = container
-            with Vertical(id="post_content"):
-                yield Static(id="post_list")
+        self._rows = RowOffsets()
+        self._rows_width = 0
+        self._row_cache = LRUCache(max_entries=self.ROW_CACHE_SIZE)
+        self._height_cache = LRUCache(max_entries=self.HEIGHT_CACHE_SIZE)
+        self.page_loader = page_loader
+        self.post_filter = post_filter
+        self.after = after or self._last_fullname(self.posts)
+        self.has_more = page_loader is not None and self.after is not None
+        self._loading_page = False
+        self.post_refresher = post_refresher
+        self._refreshing = False
+        self.comment_prefetcher = comment_prefetcher
+        self._comment_prefetch_timer = None
+        self._comment_prefetch_token = None
 
     def on_mount(self):
         Logger().info("PostList mounted")
-        self._post_list_static = self.query_one("#post_list", Static)
-        self._post_container = self.query_one("#post_container", ScrollableContainer)
-        self.update_posts(self.posts)
+        self.update_posts(self.posts, after=self.after)
+        self._maybe_prefetch()
+        if self.post_refresher:
+            self.set_interval(self.REFRESH_INTERVAL, self._refresh_visible_posts)
 
     def on_focus(self, event):
         self.refresh()
@@ -44,71 +104,375 @@ class PostList(Widget):
     def on_blur(self, event):
         self.refresh()
 
-    def update_posts(self, posts):
+    def update_posts(self, posts, after=None):
         Logger().info(f"Updating posts in PostList: {len(posts)} posts")
         self.posts = posts
+        self.after = after or self._last_fullname(posts)
+        self.has_more = self.page_loader is not None and self.after is not None
+        self._loading_page = False
         self.selected_index = 0
+        self._rebuild_rows()
+        self.scroll_to(y=0, animate=False)
+        self.refresh()
+        self.watch_selected_index(0, 0)
+
+    def reconcile_posts(self, posts, after=None):
+        """Replace the posts with a refreshed listing, keeping the selected post
+        selected when it is still part of the listing."""
+        selected = self.get_selected_post()
+        self.posts = posts
+        self.after = after or self._last_fullname(posts)
+        self.has_more = self.page_loader is not None and self.after is not None
+        self._loading_page = False
+        index = 0
+        if selected is not None:
+            index = next((i for i, post in enumerate(posts) if post.id == selected.id), 0)
+        self.selected_index = min(index, max(len(posts) - 1, 0))
+        self._rebuild_rows()
+        self.refresh()
+        self._scroll_to_selected()
+
+    def append_posts(self, posts, after=None):
+        """Add a page to the end of the list, keeping the current selection."""
+        Logger().info(f"Appending {len(posts)} posts to PostList")
+        start = len(self.posts)
+        self.posts.extend(posts)
+        self.after = after or self._last_fullname(posts) or self.after
+        if self._rows_width:
+            for post in self.posts[start:]:
+                self._rows.append(self._post_height(post))
+            self._update_virtual_size()
         self.refresh()
 
-    def render(self):
-        if self._post_list_static:
-            if not self.posts:
-                self._post_list_static.update(Text("No posts to display"))
-                return Text("")
-
-            content = []
-            for i, post in enumerate(self.posts):
-
-                prefix = "▶ " if i == self.selected_index else "  "
-                title = post.title
-                subreddit = post.subreddit.display_name
-                author = post.author.name if post.author else "[deleted]"
-                score = post.score
-                comments = post.num_comments
-                created = datetime.fromtimestamp(post.created_utc)
-                age = self._get_age(created)
-
-                # Title line
-                title_line = Text()
-                title_line.append(prefix, "bold blue" if i == self.selected_index else "white")
-                title_line.append(f"{title}\n", "bold white" if i == self.selected_index else "white")
-
-                # Metadata line
-                meta_line = Text()
-                meta_line.append("    ")  # Indent to align with title
-                meta_line.append(f"r/{subreddit} ", "green")
-                meta_line.append(f"• u/{author} ", "yellow")
-                meta_line.append(f"• {score} points ", "cyan")
-                meta_line.append(f"• {comments} comments ", "magenta")
-                meta_line.append(f"• {age}\n", "blue")
-
-                # Add a blank line between posts
-                content.extend([title_line, meta_line, Text("\n")])
-
-            # Update the content of the Static widget
-            self._post_list_static.update(Text.assemble(*content))
-
-        # Return an empty Text as this widget is a container
-        return Text("")
-
-    def _get_age(self, created):
-        now = datetime.now()
-        diff = now - created
-        if diff.days > 0:
-            return f"{diff.days}d ago"
-        elif diff.seconds >= 3600:
-            return f"{diff.seconds // 3600}h ago"
-        elif diff.seconds >= 60:
-            return f"{diff.seconds // 60}m ago"
+    def index_of(self, post_id):
+        return next((i for i, post in enumerate(self.posts) if post.id == post_id), None)
+
+    def update_post(self, post):
+        """Replace the post with the same id, if it is listed."""
+        index = self.index_of(post.id)
+        if index is None:
+            return False
+        self.posts[index] = post
+        if self._rows_width:
+            self._rows.set(index, self._post_height(post))
+            self._update_virtual_size()
+        self.refresh()
+        return True
+
+    def remove_post(self, post_id):
+        """Remove a post by id, keeping the cursor on the same row, which then
+        holds the next post. Returns the index it had, or None."""
+        index = self.index_of(post_id)
+        if index is None:
+            return None
+        del self.posts[index]
+        if index < self.selected_index or self.selected_index >= len(self.posts):
+            self.selected_index = max(self.selected_index - 1, 0)
+        if self._rows_width:
+            self._rows.delete(index)
+            self._update_virtual_size()
+        self.refresh()
+        return index
+
+    def insert_post(self, index, post):
+        """Insert a post at index unless it is already listed, keeping the
+        selected post selected."""
+        if self.index_of(post.id) is not None:
+            return False
+        index = min(index, len(self.posts))
+        self.posts.insert(index, post)
+        if index <= self.selected_index and len(self.posts) > 1:
+            self.selected_index += 1
+        if self._rows_width:
+            self._rows.insert(index, self._post_height(post))
+            self._update_virtual_size()
+        self.refresh()
+        return True
+
+    def _last_fullname(self, posts):
+        if not posts:
+            return None
+        return getattr(posts[-1], "fullname", None)
+
+    def _maybe_prefetch(self):
+        if not self.has_more or self._loading_page:
+            return
+        if self.selected_index < len(self.posts) - self.PREFETCH_THRESHOLD:
+            return
+        Logger().info(f"Prefetching next page after {self.after}")
+        self._loading_page = True
+        self.run_worker(
+            partial(self._fetch_next_page, self.after),
+            name="next_page",
+            group="page",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_next_page(self, after):
+        worker = get_current_worker()
+        try:
+            posts = self.page_loader(after)
+        except Exception as e:
+            Logger().error(f"Error loading next page: {str(e)}", exc_info=True)
+            posts = None
+        if not worker.is_cancelled:
+            self.post_message(self.PageLoaded(after, posts))
+
+    def on_post_list_page_loaded(self, message: "PostList.PageLoaded"):
+        message.stop()
+        if message.after != self.after:
+            Logger().info("Discarding page for a replaced listing")
+            return
+        self._loading_page = False
+        if message.posts is None:
+            return
+        if not message.posts:
+            Logger().info("Reached the end of the listing")
+            self.has_more = False
+            return
+
+        page_after = self._last_fullname(message.posts)
+        known_ids = {post.id for post in self.posts}
+        new_posts = [post for post in message.posts if post.id not in known_ids]
+        if self.post_filter:
+            new_posts = self.post_filter(new_posts)
+        if page_after is None or page_after == self.after:
+            self.has_more = False
+        self.append_posts(new_posts, after=page_after)
+        self._maybe_prefetch()
+
+    def watch_selected_index(self, old_index, index):
+        if not self.is_mounted:
+            return
+        self._refresh_post(old_index)
+        self._refresh_post(index)
+        if not self.comment_prefetcher:
+            return
+        # Only prefetch once the cursor rests, not for every post scrolled past
+        if self._comment_prefetch_timer is not None:
+            self._comment_prefetch_timer.stop()
+        self._comment_prefetch_timer = self.set_timer(self.COMMENT_PREFETCH_DELAY, self._prefetch_comments)
+
+    def _prefetch_comments(self):
+        self._comment_prefetch_timer = None
+        if self._comment_prefetch_token is not None:
+            # Drop prefetches still queued for posts the cursor has left
+            self._comment_prefetch_token.cancel()
+        token = self._comment_prefetch_token = CancellationToken()
+        start = self.selected_index
+        for post in self.posts[start:start + 1 + self.COMMENT_PREFETCH_AHEAD]:
+            self.run_worker(
+                partial(self._fetch_comments, post, token),
+                name=f"comments_{post.id}",
+                group="comment_prefetch",
+                thread=True,
+            )
+
+    def _fetch_comments(self, post, token):
+        try:
+            self.comment_prefetcher(post, token)
+        except Exception as e:
+            if not token.cancelled:
+                Logger().error(f"Error prefetching comments for {post.id}: {str(e)}", exc_info=True)
+
+    def on_unmount(self):
+        if self._comment_prefetch_token is not None:
+            self._comment_prefetch_token.cancel()
+
+    def _visible_range(self):
+        """Indexes of the posts currently scrolled into view."""
+        if not self.posts or not self._rows_width:
+            return range(0)
+        top = int(self.scroll_offset.y)
+        first = self._post_at_row(top)
+        last = self._post_at_row(top + self.scrollable_content_region.height - 1)
+        return range(first, last + 1)
+
+    def _refresh_visible_posts(self):
+        if self._refreshing or not self.display or not self.screen.is_current:
+            return
+        fullnames = [self.posts[i].fullname for i in self._visible_range()]
+        if not fullnames:
+            return
+        self._refreshing = True
+        self.run_worker(
+            partial(self._fetch_refreshed_posts, fullnames),
+            name="refresh_posts",
+            group="refresh",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_refreshed_posts(self, fullnames):
+        worker = get_current_worker()
+        try:
+            posts = self.post_refresher(fullnames)
+        except Exception as e:
+            Logger().error(f"Error refreshing visible posts: {str(e)}", exc_info=True)
+            posts = {}
+        if not worker.is_cancelled:
+            self.post_message(self.PostsRefreshed(posts))
+
+    def on_post_list_posts_refreshed(self, message: "PostList.PostsRefreshed"):
+        message.stop()
+        self._refreshing = False
+        self.patch_posts(message.posts)
+
+    def patch_posts(self, fresh_posts):
+        """Copy the live counters of fresh_posts ({id: post}) onto the matching
+        posts, leaving the rest of the list and the selection untouched."""
+        changed = 0
+        for i, post in enumerate(self.posts):
+            fresh = fresh_posts.get(post.id)
+            if fresh is None:
+                continue
+            if (fresh.score, fresh.num_comments, fresh.likes) != (post.score, post.num_comments, post.likes):
+                self.posts[i] = post.replace(score=fresh.score, num_comments=fresh.num_comments, likes=fresh.likes)
+                if self._rows_width:
+                    self._rows.set(i, self._post_height(self.posts[i]))
+                changed += 1
+        if changed:
+            Logger().info(f"Updated {changed} refreshed posts")
+            if self._rows_width:
+                self._update_virtual_size()
+            self.refresh()
+
+    def on_resize(self, event):
+        width = self.scrollable_content_region.width
+        if width != self._rows_width:
+            # Titles wrap differently, every post may change height
+            self._rows_width = width
+            self._rebuild_rows()
+            self._scroll_to_selected()
+
+    def _rebuild_rows(self):
+        """Measure every post again, e.g. after the list or the width changed."""
+        if not self._rows_width:
+            return
+        self._rows.reset(self._post_height(post) for post in self.posts)
+        self._update_virtual_size()
+
+    def _update_virtual_size(self):
+        self.virtual_size = Size(self._rows_width, self._rows.total if self.posts else 1)
+
+    def _post_at_row(self, row):
+        return self._rows.find(row)
+
+    def _refresh_post(self, index):
+        if 0 <= index < len(self._rows):
+            self.refresh_lines(self._rows.offset(index), self._rows.height(index))
+
+    def _post_height(self, post):
+        """Rows the post takes at the current width. Measured by wrapping its
+        plain text, without rendering it, so measuring a whole list neither
+        costs a render per post nor evicts the rows in view from _row_cache.
+        The cursor only changes colors, so the height does not depend on it."""
+        width = self._rows_width
+        title, meta = self._post_plain(post, self._get_age(post.created_utc))
+        key = (post.id, width)
+        cached = self._height_cache.get(key)
+        if cached is not None and cached[0] == (title, meta):
+            return cached[1]
+        height = self._wrapped_height(title, width) + self._wrapped_height(meta, width) + 1
+        self._height_cache.put(key, ((title, meta), height))
+        return height
+
+    def _wrapped_height(self, plain, width):
+        if "\n" in plain or "\t" in plain:
+            return len(Text(plain).wrap(self.app.console, width))
+        if cell_len(plain) <= width:
+            return 1
+        # The breaks Text.wrap would make, without dividing the text
+        return len(divide_line(plain, width)) + 1
+
+    def _post_strips(self, post, selected, width):
+        """The rows of a post, cached by (post id, width, selected, theme). An
+        entry is reused as long as the post shows the same score, comment count
+        and age, so moving the cursor only renders the two posts it touches."""
+        age = self._get_age(post.created_utc)
+        stamp = (post.title, post.author, post.score, post.num_comments, age)
+        key = (post.id, width, selected, self.app.theme)
+        cached = self._row_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        strips = [strip.apply_style(self.rich_style) for strip in self._render_post(post, selected, width, age)]
+        self._row_cache.put(key, (stamp, strips))
+        return strips
+
+    def _post_plain(self, post, age):
+        """The title and metadata lines of a post as plain text, see _post_texts."""
+        author = post.author or "[deleted]"
+        return (
+            f"  {post.title}",
+            f"    r/{post.subreddit} • u/{author} • {post.score} points "
+            f"• {post.num_comments} comments • {age}",
+        )
+
+    def _post_texts(self, post, selected, age):
+        """The title and metadata lines of a post, before wrapping."""
+        author = post.author or "[deleted]"
+
+        # Title line
+        title_line = Text()
+        title_line.append("▶ " if selected else "  ", "bold blue" if selected else "white")
+        title_line.append(post.title, "bold white" if selected else "white")
+
+        # Metadata line
+        meta_line = Text()
+        meta_line.append("    ")  # Indent to align with title
+        meta_line.append(f"r/{post.subreddit} ", "green")
+        meta_line.append(f"• u/{author} ", "yellow")
+        meta_line.append(f"• {post.score} points ", "cyan")
+        meta_line.append(f"• {post.num_comments} comments ", "magenta")
+        meta_line.append(f"• {age}", "blue")
+        return title_line, meta_line
+
+    def _render_post(self, post, selected, width, age):
+        """The rows of a post: its title and metadata, wrapped to width, and a
+        blank row between posts."""
+        title_line, meta_line = self._post_texts(post, selected, age)
+        console = self.app.console
+        options = console.options.update_width(width)
+        strips = [
+            Strip(line, width)
+            for text in (title_line, meta_line)
+            for line in console.render_lines(text, options, pad=True)
+        ]
+        strips.append(Strip.blank(width))
+        return strips
+
+    def render_line(self, y):
+        width = self.scrollable_content_region.width
+        row = int(self.scroll_offset.y) + y
+        if not self.posts:
+            if row != 0:
+                return Strip.blank(width, self.rich_style)
+            console = self.app.console
+            line = console.render_lines(Text("No posts to display"), console.options.update_width(width), pad=True)[0]
+            return Strip(line, width).apply_style(self.rich_style)
+        if not self._rows_width or not len(self._rows) or row >= self._rows.total:
+            return Strip.blank(width, self.rich_style)
+        index = self._post_at_row(row)
+        strips = self._post_strips(self.posts[index], index == self.selected_index, width)
+        return strips[min(row - self._rows.offset(index), len(strips) - 1)]
+
+    def _get_age(self, created_utc):
+        seconds = max(int(time.time() - created_utc), 0)
+        if seconds >= 86400:
+            return f"{seconds // 86400}d ago"
+        elif seconds >= 3600:
+            return f"{seconds // 3600}h ago"
+        elif seconds >= 60:
+            return f"{seconds // 60}m ago"
         else:
-            return f"{diff.seconds}s ago"
+            return f"{seconds}s ago"
 
     def action_cursor_up(self):
         Logger().debug("Cursor up in PostList")
         if self.selected_index > 0:
             self.selected_index -= 1
             Logger().debug(f"Scrolling to post index {self.selected_index}")
-            self.refresh()
             self._scroll_to_selected()
 
     def action_cursor_down(self):
@@ -116,35 +480,39 @@ class PostList(Widget):
         if self.selected_index < len(self.posts) - 1:
             self.selected_index += 1
             Logger().debug(f"Scrolling to post index {self.selected_index}")
-            self.refresh()
             self._scroll_to_selected()
+        self._maybe_prefetch()
 
     def _scroll_to_selected(self):
-        if not self._post_container or not self.posts:
+        if not self.posts or self.selected_index >= len(self._rows):
             return
         
         try:
-            # Calculate the position of the selected post
-            post_height = 4  # Each post takes roughly 4 lines
-            target_y = self.selected_index * post_height
+            target_y = self._rows.offset(self.selected_index)
+            post_height = self._rows.height(self.selected_index)
             
-            # Get current scroll position and container height
-            current_scroll = self._post_container.scroll_offset.y
-            container_height = self._post_container.size.height
+            # Get current scroll position and viewport height
+            current_scroll = self.scroll_offset.y
+            container_height = self.scrollable_content_region.height
             
             # Calculate if the selected post is outside the visible area
             if target_y < current_scroll:
                 # Post is above visible area, scroll up
-                self._post_container.scroll_to(target_y)
+                self.scroll_to(y=target_y, animate=False)
             elif target_y + post_height > current_scroll + container_height:
                 # Post is below visible area, scroll down
-                self._post_container.scroll_to(target_y - container_height + post_height)
+                self.scroll_to(y=target_y - container_height + post_height, animate=False)
         except Exception as e:
             Logger().error(f"Error scrolling to selected post: {str(e)}", exc_info=True)
 
     def on_scroll(self, event):
         Logger().info(f"Scroll event received: {event}")
 
+    def select_index(self, index):
+        """Move the cursor to index, e.g. to restore where the user left off."""
+        self.selected_index = min(max(index, 0), max(len(self.posts) - 1, 0))
+        self._scroll_to_selected()
+
     def get_selected_post(self):
         if 0 <= self.selected_index < len(self.posts):
             Logger().info(f"Selected post at index {self.selected_index}")
@@ -1,15 +1,31 @@
 from textual.widget import Widget
 from textual.widgets import Static, Button, Select
 from textual.containers import Vertical, Horizontal, ScrollableContainer
+from textual.message import Message
+from textual.worker import get_current_worker
 from utils.logger import Logger
 from datetime import datetime
-from components.post_list import PostList
 from rich.text import Text
+from rich.style import Style
 from rich.panel import Panel
 from rich import box
 from services.reddit_service import RedditService
+from services.models import CommentRecord, MoreRecord, splice_comments
+from functools import partial
 
 class PostViewScreen(Widget):
+    class CommentsLoaded(Message):
+        def __init__(self, sort, comments):
+            super().__init__()
+            self.sort = sort
+            self.comments = comments
+
+    class MoreCommentsLoaded(Message):
+        def __init__(self, key, comments):
+            super().__init__()
+            self.key = key
+            self.comments = comments
+
     def __init__(self, post, parent_content, posts):
         super().__init__()
         self.post = post
@@ -36,6 +52,9 @@ class PostViewScreen(Widget):
             ("Q&A", "qa")
         ]
         self.reddit_service = None
+        # Keys of the MoreRecords currently being fetched
+        self._loading_more = set()
+        self._loading_comments = False
 
     def compose(self):
         self.logger.info("Composing PostViewScreen UI")
@@ -49,23 +68,115 @@ class PostViewScreen(Widget):
     def on_mount(self):
         self.logger.info("PostViewScreen mounted")
         self.reddit_service = self.app.reddit_service
+        self.comment_sort_mode = self.app.default_comment_sort()
         self.load_comments()
 
     def load_comments(self):
+        """Fetch the comments in the current sort in the background and show
+        them when they arrive, replacing those of an earlier sort."""
         self.logger.info("Loading comments")
+        if not self.reddit_service:
+            self.logger.error("RedditService not initialized")
+            return
+        self.logger.info(f"Loading comments for post: {self.post.title}")
+        self._loading_comments = True
+        self.query_one("#comments_section").update(self._get_comments())
+        self.run_worker(
+            partial(self._fetch_comments, self.comment_sort_mode),
+            name="comments",
+            group="comments",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_comments(self, sort):
+        worker = get_current_worker()
         try:
-            if not self.reddit_service:
-                self.logger.error("RedditService not initialized")
-                return
-            self.logger.info(f"Loading comments for post: {self.post.title}")
-            self.comments = self.reddit_service.get_post_comments(self.post, sort=self.comment_sort_mode)
-            self.logger.info(f"Loaded {len(self.comments)} comments")
-            if not self.comments:
-                self.logger.warning("No comments found for post")
-            self.query_one("#comments_section").update(self._get_comments())
+            comments = tuple(self.reddit_service.get_post_comments(self.post, sort=sort))
         except Exception as e:
             self.logger.error(f"Error loading comments: {str(e)}", exc_info=True)
-            self.comments = []
+            comments = ()
+        if not worker.is_cancelled:
+            self.post_message(self.CommentsLoaded(sort, comments))
+
+    def on_post_view_screen_comments_loaded(self, message: "PostViewScreen.CommentsLoaded"):
+        message.stop()
+        if message.sort != self.comment_sort_mode:
+            # Sorted differently meanwhile, that sort's comments are on their way
+            return
+        self._loading_comments = False
+        self.comments = message.comments
+        self._loading_more.clear()
+        self.logger.info(f"Loaded {len(self.comments)} comments")
+        if not self.comments:
+            self.logger.warning("No comments found for post")
+        self.query_one("#comments_section").update(self._get_comments())
+
+    def _find_more(self, key, comments=None):
+        for node in self.comments if comments is None else comments:
+            if isinstance(node, MoreRecord):
+                if node.key == key:
+                    return node
+            elif node.replies:
+                found = self._find_more(key, node.replies)
+                if found is not None:
+                    return found
+        return None
+
+    def _first_more(self, comments=None):
+        """The first MoreRecord in reading order that is not already loading."""
+        for node in self.comments if comments is None else comments:
+            if isinstance(node, MoreRecord):
+                if node.key not in self._loading_more:
+                    return node
+            elif node.replies:
+                found = self._first_more(node.replies)
+                if found is not None:
+                    return found
+        return None
+
+    def load_more(self, key):
+        """Fetch the comments behind the "load more" stub with the given key in
+        the background and splice them into the tree when they arrive."""
+        more = self._find_more(key)
+        if more is None or key in self._loading_more or not self.reddit_service:
+            return
+        self._loading_more.add(key)
+        self.query_one("#comments_section").update(self._get_comments())
+        self.run_worker(
+            partial(self._fetch_more, more),
+            name=f"more_comments_{key}",
+            group="more_comments",
+            thread=True,
+        )
+
+    def load_next_more(self):
+        more = self._first_more()
+        if more is None:
+            self.notify("All comments are loaded", severity="information")
+            return
+        self.load_more(more.key)
+
+    def _fetch_more(self, more):
+        worker = get_current_worker()
+        comments = self.reddit_service.load_more_comments(self.post, more, sort=self.comment_sort_mode)
+        if not worker.is_cancelled:
+            self.post_message(self.MoreCommentsLoaded(more.key, comments))
+
+    def on_post_view_screen_more_comments_loaded(self, message: "PostViewScreen.MoreCommentsLoaded"):
+        message.stop()
+        if message.key not in self._loading_more:
+            # The comments were reloaded meanwhile
+            return
+        self._loading_more.discard(message.key)
+        more = self._find_more(message.key)
+        if message.comments is None:
+            self.notify("Failed to load more comments", severity="error")
+        elif more is not None:
+            self.logger.info(f"Loaded {len(message.comments)} comments for {message.key}")
+            self.comments = splice_comments(self.comments, more, message.comments)
+            self.reddit_service.cache_comments(self.post, self.comment_sort_mode, self.comments)
+        self.query_one("#comments_section").update(self._get_comments())
 
     def _get_title_panel(self):
         title = self.post.title
@@ -76,8 +187,8 @@ class PostViewScreen(Widget):
         )
 
     def _get_metadata(self):
-        subreddit = self.post.subreddit.display_name
-        author = self.post.author.name if self.post.author else "[deleted]"
+        subreddit = self.post.subreddit
+        author = self.post.author or "[deleted]"
         score = self.post.score
         comments = self.post.num_comments
         created = datetime.fromtimestamp(self.post.created_utc)
@@ -112,6 +223,12 @@ class PostViewScreen(Widget):
         )
 
     def _get_comments(self):
+        if not self.comments and self._loading_comments:
+            return Panel(
+                Text("Loading comments..."),
+                border_style="blue",
+                box=box.ROUNDED
+            )
         if not self.comments:
             self.logger.debug("No comments to display")
             return Panel(
@@ -126,15 +243,7 @@ class PostViewScreen(Widget):
                     return None
 
                 try:
-                    author = getattr(comment, 'author', '[deleted]')
-                    if author is None or author == '[deleted]':
-                        author_str = '[deleted]'
-                    else:
-                        try:
-                            author_str = author.name
-                        except Exception as e:
-                            self.logger.error(f"Error getting author name: {str(e)}", exc_info=True)
-                            author_str = '[unknown]'
+                    author_str = comment.author or '[deleted]'
                     score = getattr(comment, 'score', 0)
                     created = getattr(comment, 'created_utc', None)
                     age = self._get_age(datetime.fromtimestamp(created)) if created else "unknown"
@@ -162,19 +271,33 @@ class PostViewScreen(Widget):
                     self.logger.error(f"Error formatting comment: {str(e)}", exc_info=True)
                     return None
 
+            def format_more(more, depth=0):
+                indent = "  " * depth
+                thread_line = "└─ " if depth > 0 else ""
+                if more.key in self._loading_more:
+                    label = "loading more comments..."
+                elif more.is_continue_thread:
+                    label = "continue this thread ›"
+                else:
+                    label = f"load {more.count} more {'reply' if more.count == 1 else 'replies'} ›"
+                # Clicking the line expands it; Enter expands the first one
+                style = Style(color="cyan", underline=True, meta={"@click": f"app.load_more_comments({more.key!r})"})
+                return Text.assemble(Text(f"{indent}{thread_line}", style="blue"), Text(label, style=style), "\n")
+
             def process_comments(comments, depth=0):
                 comment_texts = []
                 for comment in comments:
-                    if hasattr(comment, 'body') and comment.body:
+                    if isinstance(comment, MoreRecord):
+                        comment_texts.append(format_more(comment, depth))
+                        comment_texts.append(Text("\n"))
+                    elif hasattr(comment, 'body') and comment.body:
                         comment_text = format_comment(comment, depth)
                         if comment_text:
                             comment_texts.append(comment_text)
                             comment_texts.append(Text("\n"))
                         
-                        if hasattr(comment, 'replies') and comment.replies:
-                            replies = list(comment.replies)
-                            if replies:
-                                comment_texts.extend(process_comments(replies, depth + 1))
+                        if comment.replies:
+                            comment_texts.extend(process_comments(comment.replies, depth + 1))
                 return comment_texts
 
             comment_texts = process_comments(self.comments)
@@ -216,29 +339,21 @@ class PostViewScreen(Widget):
         try:
             if event.button.id == "back_button":
                 self.logger.info("Back button pressed")
-                self.parent_content.remove_children()
-                post_list = PostList(posts=self.posts, id="content")
-                self.parent_content.mount(post_list)
-                self.app.active_widget = "content"
-                post_list.focus()
+                self.app.action_back()
             elif event.button.id == "upvote_button":
                 self.logger.info("Upvote button pressed")
-                try:
-                    self.post.upvote()
+                if self.reddit_service.vote_post(self.post, "upvote"):
                     self.notify("Post upvoted!", severity="information")
                     self.logger.info(f"Upvoted post: {self.post.title}")
-                except Exception as e:
-                    self.logger.error(f"Error upvoting post: {str(e)}", exc_info=True)
-                    self.notify(f"Error upvoting post: {str(e)}", severity="error")
+                else:
+                    self.notify("Failed to upvote post", severity="error")
             elif event.button.id == "downvote_button":
                 self.logger.info("Downvote button pressed")
-                try:
-                    self.post.downvote()
+                if self.reddit_service.vote_post(self.post, "downvote"):
                     self.notify("Post downvoted!", severity="information")
                     self.logger.info(f"Downvoted post: {self.post.title}")
-                except Exception as e:
-                    self.logger.error(f"Error downvoting post: {str(e)}", exc_info=True)
-                    self.notify(f"Error downvoting post: {str(e)}", severity="error")
+                else:
+                    self.notify("Failed to downvote post", severity="error")
             elif event.button.id == "copy_link_button":
                 import pyperclip
                 pyperclip.copy(self.post.url)
@@ -252,4 +367,5 @@ class PostViewScreen(Widget):
 
     def sort_comments(self, sort_mode):
         self.comment_sort_mode = sort_mode
+        self.comments = ()
         self.load_comments() 
\ No newline at end of file
@@ -20,6 +20,7 @@ class RateLimitScreen(Widget):
                     yield Static(id="current_usage")
                     yield Static(id="historical_usage")
                     yield Static(id="reset_info")
+                    yield Static(id="request_queues")
                     yield Static(id="recommendations")
                 yield Button("Refresh", id="refresh_button")
 
@@ -51,6 +52,8 @@ class RateLimitScreen(Widget):
             used = rate_info.get('used', 0)
             reset_time = rate_info.get('time_until_reset', 0)
             total_calls = (remaining or 0) + (used or 0)
+            queued_interactive = rate_info.get('queued_interactive', 0)
+            queued_background = rate_info.get('queued_background', 0)
 
             self.logger.info(f"Rate limit stats - Remaining: {remaining}, Used: {used}, Reset time: {reset_time}")
 
@@ -62,6 +65,7 @@ class RateLimitScreen(Widget):
 Remaining API calls: [class={remaining_class}]{remaining}[/]
 Used API calls: {used}
 Total calls made: {total_calls}
+Queued requests: {queued_interactive} interactive, {queued_background} background
 """
             current_usage_widget.update(current_usage)
 
@@ -98,6 +102,22 @@ Next reset at: {(datetime.now() + timedelta(seconds=reset_time)).strftime('%H:%M
 
             recommendations_widget.update(recommendations)
 
+            request_queues = "[bold]Request Queues[/bold]\n-------------------\n"
+            for lane, lane_stats in self.reddit_service.get_scheduler_stats().items():
+                request_queues += (
+                    f"{lane}: {lane_stats['queued']} queued, {lane_stats['active']}/{lane_stats['limit']} running, "
+                    f"avg wait {lane_stats['avg_wait']:.2f}s\n"
+                )
+            flight_stats = self.reddit_service.get_single_flight_stats()
+            request_queues += (
+                f"Duplicate requests avoided: {flight_stats['shared']} "
+                f"({flight_stats['waiting']} waiting on {flight_stats['in_flight']} in flight)\n"
+            )
+            for endpoint, breaker in self.reddit_service.get_circuit_breaker_stats().items():
+                if breaker["state"] != "closed":
+                    request_queues += f"{endpoint} requests paused ({breaker['state']}), retry in {breaker['retry_in']:.0f}s\n"
+            self.query_one("#request_queues").update(request_queues)
+
         except Exception as e:
             self.logger.error(f"Error updating rate limit info: {str(e)}", exc_info=True)
             self.notify(f"Error updating rate limit info: {str(e)}", severity="error") 
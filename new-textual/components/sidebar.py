@@ -10,6 +10,7 @@ class Sidebar(Widget):
         self.status = "Not Logged In"
         self.account = "Not Logged In"
         self.is_logged_in = False
+        self.offline = False
         self._sidebar_content = None
 
     def compose(self):
@@ -40,6 +41,11 @@ class Sidebar(Widget):
             self.status = "Not Logged In"
         self.refresh()
 
+    def update_offline_status(self, offline: bool):
+        Logger().info(f"Updating offline status: {offline}")
+        self.offline = offline
+        self.refresh()
+
     def render(self):
         Logger().debug("Sidebar render called, updating static content")
         if self._sidebar_content:
@@ -50,6 +56,9 @@ class Sidebar(Widget):
                 content.append(f"{self.account}\n\n", style="white")
                 content.append("Current View:\n\n", style="bold blue")
                 content.append(f"{self.status}\n\n", style="white")
+                if self.offline:
+                    content.append("Offline\n\n", style="bold yellow")
+                    content.append("Showing saved content, changes are sent once back online\n\n", style="yellow")
             else:
                 content.append(f"Authentication Status:\n\n", style="bold red")
                 content.append(f"Not Logged In\n\n", style="red")
@@ -76,6 +85,9 @@ class Sidebar(Widget):
             content.append("? - Help\n", style="white")
             content.append("c - Settings\n", style="white")
             content.append("u - My Profile\n", style="white")
+            content.append("o - Offline Mode\n", style="white")
+            content.append("[ - Back\n", style="white")
+            content.append("] - Forward\n", style="white")
             content.append("q - Quit\n", style="white")
             self._sidebar_content.update(content)
 
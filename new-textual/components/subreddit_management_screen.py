@@ -179,11 +179,11 @@ class SubredditManagementScreen(Widget):
             posts = self.reddit_service.get_subreddit_posts(subreddit_name)
             if posts:
                 app = self.app
-                setattr(app, "current_posts", posts)
                 content = app.query_one("#content")
-                content.remove_children()
+                content.park()
+                setattr(app, "current_posts", posts)
                 from components.post_list import PostList
-                post_list = PostList(posts=posts, id="content")
+                post_list = PostList(posts=posts)
                 content.mount(post_list)
                 post_list.focus()
                 from components.sidebar import Sidebar
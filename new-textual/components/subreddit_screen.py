@@ -6,8 +6,11 @@ from textual.reactive import reactive
 from textual.binding import Binding
 from textual.message import Message
 from utils.logger import Logger
+from utils.row_offsets import RowOffsets
 from services.reddit_service import RedditService
+from services.request_scheduler import LANE_PREFETCH
 from rich.text import Text
+from functools import partial
 from components.post_list import PostList
 
 class SubredditList(Widget):
@@ -16,6 +19,12 @@ class SubredditList(Widget):
             super().__init__()
             self.sender = sender
 
+    DEFAULT_CSS = """
+    SubredditList {
+        height: auto;
+    }
+    """
+
     BINDINGS = [
         Binding("up", "cursor_up", "Up", show=True),
         Binding("down", "cursor_down", "Down", show=True),
@@ -26,33 +35,52 @@ class SubredditList(Widget):
         super().__init__(id=id)
         self.subreddits = subreddits or []
         self.can_focus = True
+        # Rendered height of every subreddit at _rows_width, for scrolling
+        self._rows = RowOffsets()
+        self._rows_width = 0
 
     def update_subreddits(self, subreddits):
         self.subreddits = subreddits
         self.selected_index = 0
+        self._rebuild_rows()
         self.refresh()
 
+    def on_resize(self, event):
+        if self.size.width != self._rows_width:
+            self._rows_width = self.size.width
+            self._rebuild_rows()
+
+    def _rebuild_rows(self):
+        if not self._rows_width:
+            return
+        console = self.app.console
+        heights = []
+        for i, subreddit in enumerate(self.subreddits):
+            entry = self._render_entry(i, subreddit)
+            heights.append(0 if entry is None else len(entry.wrap(console, self._rows_width)))
+        self._rows.reset(heights)
+
+    def _render_entry(self, i, subreddit):
+        if subreddit.display_name == "feminineboys":
+            return None
+
+        prefix = "▶ " if i == self.selected_index else "  "
+        name = f"r/{subreddit.display_name}"
+        subs = f"👥 {subreddit.subscribers:,}"
+        desc = subreddit.public_description or subreddit.description or "No description"
+        desc = desc[:80] + ("..." if len(desc) > 80 else "")
+        line = Text()
+        line.append(prefix, "bold blue" if i == self.selected_index else "white")
+        line.append(name, "bold white" if i == self.selected_index else "white")
+        line.append(f" | {subs}\n", "green")
+        line.append(f"    {desc}", "white")
+        return line
+
     def render(self):
         if not self.subreddits:
             return Text("No subreddits found")
-        content = []
-        for i, subreddit in enumerate(self.subreddits):
-
-            if subreddit.display_name == "feminineboys":
-                continue
-
-            prefix = "▶ " if i == self.selected_index else "  "
-            name = f"r/{subreddit.display_name}"
-            subs = f"👥 {subreddit.subscribers:,}"
-            desc = subreddit.public_description or subreddit.description or "No description"
-            desc = desc[:80] + ("..." if len(desc) > 80 else "")
-            line = Text()
-            line.append(prefix, "bold blue" if i == self.selected_index else "white")
-            line.append(name, "bold white" if i == self.selected_index else "white")
-            line.append(f" | {subs}\n", "green")
-            line.append(f"    {desc}\n", "white")
-            content.append(line)
-        return Text.assemble(*content)
+        entries = (self._render_entry(i, subreddit) for i, subreddit in enumerate(self.subreddits))
+        return Text("\n").join(entry for entry in entries if entry is not None)
 
     def action_cursor_up(self):
         if self.selected_index > 0:
@@ -68,8 +96,15 @@ class SubredditList(Widget):
 
     def scroll_visible(self):
         parent = self.parent
-        if parent and hasattr(parent, "scroll_to"):
-            parent.scroll_to(self.selected_index * 4)
+        if not parent or not hasattr(parent, "scroll_to") or self.selected_index >= len(self._rows):
+            return
+        top = self._rows.offset(self.selected_index)
+        height = self._rows.height(self.selected_index)
+        viewport = parent.scrollable_content_region.height
+        if top < parent.scroll_offset.y:
+            parent.scroll_to(y=top, animate=False)
+        elif top + height > parent.scroll_offset.y + viewport:
+            parent.scroll_to(y=top + height - viewport, animate=False)
 
     def action_select(self):
         self.post_message(self.SubredditSelected(self))
@@ -130,6 +165,9 @@ class SubredditScreen(Widget):
     def action_select(self):
         self.query_one("#subreddit_list").action_select()
 
+    def _load_page(self, subreddit_name, after):
+        return self.reddit_service.get_subreddit_posts(subreddit_name, sort="hot", limit=25, after=after, lane=LANE_PREFETCH)
+
     def load_subreddit_posts(self):
         sublist = self.query_one("#subreddit_list")
         subreddit = sublist.get_selected_subreddit()
@@ -144,9 +182,15 @@ class SubredditScreen(Widget):
             )
             self.logger.info(f"Loaded {len(posts)} posts for r/{subreddit.display_name}")
             
-            self.parent_content.remove_children()
-            header = Static(f"r/{subreddit.display_name} - Hot", id="subreddit_header")
-            post_list = PostList(posts=posts, id="content")
+            self.parent_content.park()
+            # No id, the header of an earlier subreddit may still be parked next to it
+            header = Static(f"r/{subreddit.display_name} - Hot")
+            post_list = PostList(
+                posts=posts,
+                page_loader=partial(self._load_page, subreddit.display_name),
+                post_refresher=self.reddit_service.refresh_posts,
+                comment_prefetcher=self.app.prefetch_comments,
+            )
             
             self.parent_content.mount(header)
             self.parent_content.mount(post_list)
@@ -2,7 +2,6 @@ from textual.widget import Widget
 from textual.widgets import Static, Input, Button
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from utils.logger import Logger
-from components.post_list import PostList
 import json
 import os
 import sys
@@ -124,10 +123,7 @@ class ThemeCreationScreen(Widget):
         if event.button.id == "save_theme":
             self._save_theme()
         elif event.button.id == "cancel":
-            self.parent_content.remove_children()
-            post_list = PostList(posts=self.current_posts, id="content")
-            self.parent_content.mount(post_list)
-            post_list.focus()
+            self.app.show_previous_view()
 
     def _save_theme(self) -> None:
         if not self.theme_name:
@@ -153,10 +149,7 @@ class ThemeCreationScreen(Widget):
                 json.dump(self.theme_data, f, indent=4)
             self.notify("Theme saved successfully!", severity="information")
             if self.parent_content:
-                self.parent_content.remove_children()
-                post_list = PostList(posts=self.current_posts, id="content")
-                self.parent_content.mount(post_list)
-                post_list.focus()
+                self.app.show_previous_view()
         except Exception as e:
             self.logger.error(f"Error saving theme: {str(e)}", exc_info=True)
             self.notify(f"Error saving theme: {str(e)}", severity="error") 
\ No newline at end of file
@@ -7,7 +7,6 @@ from rich.text import Text
 from rich.panel import Panel
 from rich import box
 from services.reddit_service import RedditService
-from components.post_list import PostList
 
 class UserProfileScreen(Widget):
     def __init__(self, username, parent_content, posts):
@@ -51,15 +50,18 @@ class UserProfileScreen(Widget):
                 self.logger.error("RedditService not initialized")
                 return
 
-            self.user = self.reddit_service.reddit.redditor(self.username)
-            self.user_posts = list(self.user.submissions.new(limit=25))
-            self.user_comments = list(self.user.comments.new(limit=25))
+            self.user = self.reddit_service.get_user_profile(self.username)
+            if self.user is None:
+                self.notify(f"Could not load u/{self.username}", severity="error")
+                return
+            self.user_posts = self.reddit_service.get_user_posts(self.username)
+            self.user_comments = self.reddit_service.get_user_comments(self.username)
             
             # Get karma breakdown
             self.karma_breakdown = {
                 "post_karma": self.user.link_karma,
                 "comment_karma": self.user.comment_karma,
-                "total_karma": self.user.link_karma + self.user.comment_karma
+                "total_karma": self.user.total_karma
             }
 
             self.update_header()
@@ -92,7 +94,7 @@ class UserProfileScreen(Widget):
         else:
             for post in self.user_posts:
                 content.append(f"▶ {post.title}\n", style="bold white")
-                content.append(f"    r/{post.subreddit.display_name} • {post.score} points • {post.num_comments} comments\n\n", style="white")
+                content.append(f"    r/{post.subreddit} • {post.score} points • {post.num_comments} comments\n\n", style="white")
         self.query_one("#user_content").update(content)
 
     def show_comments(self):
@@ -103,7 +105,7 @@ class UserProfileScreen(Widget):
         else:
             for comment in self.user_comments:
                 content.append(f"▶ {comment.body[:100]}...\n", style="bold white")
-                content.append(f"    r/{comment.subreddit.display_name} • {comment.score} points • {self._get_age(datetime.fromtimestamp(comment.created_utc))}\n\n", style="white")
+                content.append(f"    r/{comment.subreddit} • {comment.score} points • {self._get_age(datetime.fromtimestamp(comment.created_utc))}\n\n", style="white")
         self.query_one("#user_content").update(content)
 
     def _get_age(self, created):
@@ -166,10 +168,8 @@ class UserProfileScreen(Widget):
         elif event.button.id == "block_button":
             self.action_block_user()
         elif event.button.id == "back_button":
-            self.parent_content.remove_children()
-            self.parent_content.mount(PostList(posts=self.posts, id="content"))
             self.app.active_widget = "content"
-            self.query_one(PostList).focus()
+            self.app.show_previous_view()
 
     def action_message_user(self):
         try:
@@ -0,0 +1,142 @@
+import time
+from textual.containers import Container
+from textual.message import Message
+from utils.logger import Logger
+
+class View:
+    """Widgets that made up one view of the content area, hidden while the user
+    is elsewhere, and the app state (see ViewStack) that went with them."""
+
+    __slots__ = ("widgets", "focused", "state", "size", "visited")
+
+    def __init__(self, widgets, focused, state):
+        self.widgets = widgets
+        self.focused = focused
+        self.state = state
+        self.size = sum(1 + len(list(widget.walk_children())) for widget in widgets)
+        self.visited = time.monotonic()
+
+    @property
+    def alive(self):
+        return any(widget.is_mounted for widget in self.widgets)
+
+    def remove(self):
+        for widget in self.widgets:
+            if widget.is_mounted:
+                widget.remove()
+
+class ViewStack(Container):
+    """The content area. Navigating parks the view on screen (the visible
+    children) instead of removing it, so back and forward show it again as it
+    was, without fetching or composing anything.
+
+    Parked views stay mounted but hidden. When there are more than MAX_VIEWS
+    of them, or they hold more than MAX_WIDGETS widgets together, the least
+    recently visited ones are removed.
+
+    get_state() is stored with a view when it is parked and comes back in a
+    Restored message when the view is shown again, for the app to restore the
+    feed and sidebar that belong to it.
+    """
+
+    MAX_VIEWS = 10
+    MAX_WIDGETS = 2000
+    # Shown while something loads, not worth coming back to
+    TRANSIENT_IDS = {"loading_placeholder"}
+
+    class Restored(Message):
+        def __init__(self, state):
+            super().__init__()
+            self.state = state
+
+    def __init__(self, id=None, get_state=None):
+        super().__init__(id=id)
+        self.get_state = get_state or (lambda: None)
+        self._back = []
+        self._forward = []
+
+    @property
+    def can_go_back(self):
+        return bool(self._back)
+
+    @property
+    def can_go_forward(self):
+        return bool(self._forward)
+
+    def park(self):
+        """Hide the current view to make room for a new one. The forward
+        history is dropped, as the new view starts a new branch."""
+        view = self._take_current()
+        for forward in self._forward:
+            forward.remove()
+        self._forward.clear()
+        if view is not None:
+            self._back.append(view)
+            self._evict()
+
+    def back(self) -> bool:
+        """Show the previous view, keeping the current one for forward()."""
+        return self._go(self._back, self._forward)
+
+    def forward(self) -> bool:
+        return self._go(self._forward, self._back)
+
+    def reset(self):
+        """Remove every view, e.g. when the account changes."""
+        self._back.clear()
+        self._forward.clear()
+        self.remove_children()
+
+    def _go(self, source, target):
+        while source:
+            view = source.pop()
+            if not view.alive:
+                continue
+            current = self._take_current()
+            if current is not None:
+                target.append(current)
+            self._show(view)
+            self._evict()
+            return True
+        return False
+
+    def _take_current(self):
+        widgets = [child for child in self.children if child.display]
+        if not widgets:
+            return None
+        transient = [widget for widget in widgets if widget.id in self.TRANSIENT_IDS]
+        for widget in transient:
+            widget.remove()
+        widgets = [widget for widget in widgets if widget not in transient]
+        if not widgets:
+            return None
+
+        focused = self.app.focused
+        if focused is not None and not any(focused is widget or widget in focused.ancestors for widget in widgets):
+            focused = None
+        view = View(widgets, focused, self.get_state())
+        for widget in widgets:
+            widget.display = False
+        return view
+
+    def _show(self, view):
+        for widget in view.widgets:
+            widget.display = True
+        view.visited = time.monotonic()
+        focus = view.focused if view.focused is not None and view.focused.is_mounted else None
+        if focus is None:
+            focus = next((widget for widget in view.widgets if widget.focusable), None)
+        if focus is not None:
+            focus.focus()
+        self.post_message(self.Restored(view.state))
+
+    def _evict(self):
+        views = self._back + self._forward
+        total = sum(view.size for view in views)
+        while views and (len(views) > self.MAX_VIEWS or total > self.MAX_WIDGETS):
+            oldest = min(views, key=lambda view: view.visited)
+            views.remove(oldest)
+            total -= oldest.size
+            (self._back if oldest in self._back else self._forward).remove(oldest)
+            Logger().info(f"Dropping view from history: {[type(widget).__name__ for widget in oldest.widgets]}")
+            oldest.remove()
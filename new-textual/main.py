@@ -4,31 +4,25 @@ from textual.widgets import Header, Footer, Static, Button
 from textual.binding import Binding
 from textual.screen import Screen, ModalScreen
 from textual.theme import Theme
+from textual.message import Message
+from textual.worker import get_current_worker
 from services.reddit_service import RedditService
+from services.request_scheduler import CancellationToken, LANE_PREFETCH
+from services.mutation_queue import VOTE, SAVE, HIDE, SUBSCRIBE
+from services.resilience import RedditUnavailableError
 from components.post_list import PostList
 from components.sidebar import Sidebar
+from components.view_stack import ViewStack
 
 from components.post_view_screen import PostViewScreen
-from components.settings_screen import SettingsScreen
-from components.user_profile_screen import UserProfileScreen
-from components.comment_screen import CommentScreen
-from components.qr_screen import QRScreen
-from components.subreddit_screen import SubredditScreen
-from components.post_creation_screen import PostCreationScreen
-from components.credits_screen import CreditsScreen
-from components.rate_limit_screen import RateLimitScreen
-from components.theme_creation_screen import ThemeCreationScreen
-from components.messages_screen import MessagesScreen
-from components.account_management_screen import AccountManagementWidget
-from components.advanced_search_screen import AdvancedSearchScreen
-from components.subreddit_management_screen import SubredditManagementScreen
-from components.help_screen import HelpScreen
 from utils.logger import Logger
+import argparse
 import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
+from functools import partial
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -55,12 +49,20 @@ class ReportReasonScreen(ModalScreen):
             self.dismiss(event.button.label)
 
 class RedditTUI(App):
-    def __init__(self):
+    def __init__(self, account=None, feed=None):
         Logger().info("RedditTUI app initializing")
         super().__init__()
         self.reddit_service = None
+        # Account and feed to start with, from the command line
+        self.start_account = account
+        self.start_feed = feed
         self.current_feed = "hot"
         self.current_posts = []
+        self._revalidating_feed = None
+        self._feed_token = None
+        self._logging_in = False
+        # Posts hidden optimistically, by id, with their index to restore on failure
+        self._hidden_posts = {}
         self.settings = self.load_settings()
         self.logger = Logger()
         Logger().info("Registered bindings: " + str(self.BINDINGS))
@@ -97,16 +99,6 @@ class RedditTUI(App):
         overflow-y: scroll;
     }
 
-    #post_content {
-        height: auto;
-        padding: 1;
-    }
-
-    #post_list {
-        width: 100%;
-        height: auto;
-    }
-
     #login_container {
         width: 100%;
         height: 100%;
@@ -968,6 +960,30 @@ class RedditTUI(App):
     }
     """
 
+    FEEDS = {
+        "hot": ("get_hot_posts", "Home Feed"),
+        "new": ("get_new_posts", "New Feed"),
+        "top": ("get_top_posts", "Top Feed"),
+        "saved": ("get_saved_posts", "Saved Posts"),
+    }
+
+    class FeedLoaded(Message):
+        def __init__(self, feed, posts):
+            super().__init__()
+            self.feed = feed
+            self.posts = posts
+
+    class FeedFailed(Message):
+        def __init__(self, feed, error):
+            super().__init__()
+            self.feed = feed
+            self.error = error
+
+    class LoginFinished(Message):
+        def __init__(self, succeeded):
+            super().__init__()
+            self.succeeded = succeeded
+
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
         Binding("enter", "select", "Select", show=True),
@@ -990,6 +1006,9 @@ class RedditTUI(App):
         Binding("v", "subreddit_management", "Subreddit Management", show=True),
         Binding("f", "search_subreddits", "Search Subreddits", show=True),
         Binding("g", "search_users", "Search Users", show=True),
+        Binding("o", "toggle_offline", "Offline Mode", show=True),
+        Binding("left_square_bracket", "history_back", "Back", show=True),
+        Binding("right_square_bracket", "history_forward", "Forward", show=True),
     ]
 
     async def on_mount(self) -> None:
@@ -1012,24 +1031,90 @@ class RedditTUI(App):
         Logger().info(f"Attempting auto-login")
         if self.reddit_service is None:
             self.reddit_service = RedditService()
+        self.reddit_service.add_mutation_listener(self._on_mutation_finished)
+        self.reddit_service.add_offline_listener(self._on_offline_changed)
+        if self.settings.get("offline_mode", False):
+            self.reddit_service.set_offline(True)
         
+        if self.start_account is not None and self.start_account not in self.reddit_service.accounts:
+            Logger().warning(f"Account {self.start_account} from the command line is not saved")
+            self.notify(f"No saved account named {self.start_account}, using the most recent one", severity="warning")
+            self.start_account = None
+
         if len(self.reddit_service.accounts) > 0:
             Logger().info(f"Found {len(self.reddit_service.accounts)} accounts, attempting auto-login")
-            if self.reddit_service.auto_login():
-                self.action_home()
-                current_account = self.reddit_service.get_current_account()
-                if current_account:
-                    self.query_one(Sidebar).update_sidebar_account(current_account)
-                Logger().info(f"Auto-login successful")
-            else:
-                Logger().info(f"Auto-login failed")
-                self.query_one(Sidebar).update_auth_status(False)
+            self._show_feed_snapshot()
+            # Logging in can take a round-trip, keep it out of the way of the first frame
+            self._logging_in = True
+            self.run_worker(self._auto_login, name="auto_login", group="login", thread=True)
         else:
             Logger().info("No accounts found, app started without login")
             self.query_one(Sidebar).update_auth_status(False)
 
+    def _auto_login(self):
+        self.post_message(self.LoginFinished(self.reddit_service.auto_login(self.start_account)))
+
+    def on_reddit_tui_login_finished(self, message: "RedditTUI.LoginFinished") -> None:
+        self._logging_in = False
+        sidebar = self.query_one(Sidebar)
+        if not message.succeeded:
+            Logger().info(f"Auto-login failed")
+            sidebar.update_auth_status(False)
+            if self._revalidating_feed is not None:
+                # Drop the snapshot, it cannot be refreshed
+                self._revalidating_feed = None
+                self.current_posts = []
+                self.query_one("#content").reset()
+            return
+
+        Logger().info(f"Auto-login successful")
+        current_account = self.reddit_service.get_current_account()
+        if current_account:
+            sidebar.update_sidebar_account(current_account)
+        feed = self._revalidating_feed
+        if feed is not None and self.query_one("#content").query(PostList):
+            # The snapshot of the last session is on screen, refresh it in place
+            self._start_feed_fetch(feed, self.settings.get("posts_per_page", 25))
+        else:
+            self.load_feed(self.start_feed or "hot")
+
+    def _show_feed_snapshot(self):
+        """Show the feed that was on screen when the app was last closed, so
+        the first frame has posts while logging in and fetching happen in the
+        background. The sidebar marks it as stale until the refresh lands."""
+        snapshot = self.reddit_service.load_feed_snapshot(self.start_account or self.reddit_service.most_recent_account())
+        if snapshot is None or snapshot["feed"] not in self.FEEDS:
+            return
+        if self.start_feed is not None and snapshot["feed"] != self.start_feed:
+            return
+        feed = snapshot["feed"]
+        Logger().info(f"Showing snapshot of the {feed} feed from the last session")
+        self.current_feed = feed
+        self._revalidating_feed = feed
+        post_list = self._show_feed(feed, snapshot["posts"])
+        post_list.call_later(post_list.select_index, snapshot["selected_index"])
+        sidebar = self.query_one(Sidebar)
+        sidebar.update_sidebar_account(snapshot["account"])
+        sidebar.update_status(f"{self.FEEDS[feed][1]} (last session, refreshing)")
+
+    def _save_feed_snapshot(self):
+        if not self.reddit_service or not self.is_authenticated() or not self.current_posts:
+            return
+        index = 0
+        post_list = next((pl for pl in self.query(PostList) if pl.posts is self.current_posts), None)
+        if post_list is not None:
+            index = post_list.selected_index
+        else:
+            post_view = next(iter(self.query(PostViewScreen)), None)
+            if post_view is not None:
+                index = next((i for i, p in enumerate(self.current_posts) if p.id == post_view.post.id), 0)
+        self.reddit_service.save_feed_snapshot(self.current_feed, self.current_posts, index)
+
     async def show_account_management_if_not_authenticated(self):
         Logger().info("================================ On_mount finished ==================================")
+        if self._logging_in:
+            self.notify("Logging in, please wait...", severity="information")
+            return
         if not self.reddit_service or not self.reddit_service.user:
             Logger().info("User not authenticated, showing account management")
             await self.action_account_management()
@@ -1044,11 +1129,12 @@ class RedditTUI(App):
         yield Header()
         with Horizontal():
             yield Sidebar(id="sidebar")
-            yield PostList(id="content")
+            yield ViewStack(id="content", get_state=self._view_state)
         yield Footer()
 
     def action_quit(self) -> None:
         Logger().debug("App quitting.")
+        self._save_feed_snapshot()
         Logger().send_logs()
         self.exit()
 
@@ -1064,17 +1150,20 @@ class RedditTUI(App):
             return
         
         content = self.query_one("#content")
-        children = list(content.children)
+        view = self._active_view()
         
-        if len(children) == 1:
-            if isinstance(children[0], PostList):
-                post = children[0].get_selected_post()
+        if view is not None:
+            if isinstance(view, PostList):
+                post = view.get_selected_post()
                 if post:
                     Logger().info(f"Selected post: {getattr(post, 'title', str(post))}")
-                    content.remove_children()
+                    # The list is kept, so going back keeps its cursor and scroll position
+                    content.park()
                     content.mount(PostViewScreen(post, content, self.current_posts))
                 else:
                     self.notify("No post selected", severity="warning")
+            elif isinstance(view, PostViewScreen):
+                view.load_next_more()
             else:
                 self.notify("Select not available on this screen", severity="information")
         else:
@@ -1089,27 +1178,7 @@ class RedditTUI(App):
         if not self.reddit_service:
             self.notify("Reddit service not initialized", severity="error")
             return
-        try:
-            self.current_feed = "hot"
-            posts = self.reddit_service.get_hot_posts()
-            self.current_posts = posts
-            
-            content = self.query_one("#content")
-            content.remove_children()
-            post_list = PostList(posts=posts)
-            content.mount(post_list)
-            
-            self.query_one(Sidebar).update_status("Home Feed")
-            post_list.focus()
-        except ConnectionError as e:
-            Logger().error(f"Network connection error: {str(e)}", exc_info=True)
-            self.notify("Error: No internet connection", severity="error")
-        except TimeoutError as e:
-            Logger().error(f"Request timeout: {str(e)}", exc_info=True)
-            self.notify("Error: Request timed out. Please try again.", severity="error")
-        except Exception as e:
-            Logger().error(f"Error loading home feed: {str(e)}", exc_info=True)
-            self.notify(f"Error loading home feed: {str(e)}", severity="error")
+        self.load_feed("hot")
 
     def action_new(self) -> None:
         Logger().info("Action: new feed")
@@ -1120,27 +1189,7 @@ class RedditTUI(App):
         if not self.reddit_service:
             self.notify("Reddit service not initialized", severity="error")
             return
-        try:
-            self.current_feed = "new"
-            posts = self.reddit_service.get_new_posts()
-            self.current_posts = posts
-            
-            content = self.query_one("#content")
-            content.remove_children()
-            post_list = PostList(posts=posts)
-            content.mount(post_list)
-            
-            self.query_one(Sidebar).update_status("New Feed")
-            post_list.focus()
-        except ConnectionError as e:
-            Logger().error(f"Network connection error: {str(e)}", exc_info=True)
-            self.notify("Error: No internet connection", severity="error")
-        except TimeoutError as e:
-            Logger().error(f"Request timeout: {str(e)}", exc_info=True)
-            self.notify("Error: Request timed out. Please try again.", severity="error")
-        except Exception as e:
-            Logger().error(f"Error loading new feed: {str(e)}", exc_info=True)
-            self.notify(f"Error loading new feed: {str(e)}", severity="error")
+        self.load_feed("new")
 
     def action_top(self) -> None:
         Logger().info("Action: top feed")
@@ -1151,31 +1200,160 @@ class RedditTUI(App):
         if not self.reddit_service:
             self.notify("Reddit service not initialized", severity="error")
             return
+        self.load_feed("top")
+
+    def load_feed(self, feed: str) -> None:
+        """Show a loading placeholder and fetch the feed in a background worker.
+
+        Workers share the "feed" group and are exclusive, so starting a new
+        load cancels whichever fetch is still in flight.
+        """
+        _, status = self.FEEDS[feed]
+        Logger().info(f"Loading feed: {feed}")
+        content = self.query_one("#content")
+        placeholders = content.query("#loading_placeholder")
+        if not placeholders:
+            # Park the view on screen while it still matches current_feed and current_posts
+            content.park()
+        self.current_feed = feed
+
+        limit = self.settings.get("posts_per_page", 25)
+        cached_posts, is_fresh = self.reddit_service.peek_feed_posts(feed, limit)
+        if cached_posts:
+            # Render the cached listing right away, then revalidate it if it is stale
+            self._show_feed(feed, cached_posts)
+            if is_fresh:
+                self.query_one(Sidebar).update_status(status)
+                return
+            self._revalidating_feed = feed
+            self.query_one(Sidebar).update_status(f"{status} (refreshing)")
+        else:
+            self._revalidating_feed = None
+            if placeholders:
+                # Still waiting for (or failed) a previous load, reuse its placeholder
+                placeholders.first().update(f"Loading {status}...")
+            else:
+                content.mount(Static(f"Loading {status}...", id="loading_placeholder"))
+            self.query_one(Sidebar).update_status(status)
+
+        self._start_feed_fetch(feed, limit)
+
+    def _start_feed_fetch(self, feed, limit):
+        method_name, _ = self.FEEDS[feed]
+        # Drop the previous fetch if it is still waiting for a free request slot
+        if self._feed_token is not None:
+            self._feed_token.cancel()
+        self._feed_token = CancellationToken()
+        fetch = partial(getattr(self.reddit_service, method_name), cancel_token=self._feed_token)
+        self.run_worker(
+            partial(self._fetch_feed, feed, fetch, limit),
+            name=f"feed_{feed}",
+            group="feed",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_feed(self, feed, fetch, limit):
+        worker = get_current_worker()
         try:
-            self.current_feed = "top"
-            posts = self.reddit_service.get_top_posts()
+            posts = fetch(limit=limit)
+        except Exception as e:
+            if not worker.is_cancelled:
+                self.post_message(self.FeedFailed(feed, e))
+            return
+        if worker.is_cancelled:
+            Logger().info(f"Discarding stale {feed} feed result")
+            return
+        self.post_message(self.FeedLoaded(feed, posts))
+
+    def on_reddit_tui_feed_loaded(self, message: "RedditTUI.FeedLoaded") -> None:
+        content = self.query_one("#content")
+        if message.feed != self.current_feed:
+            Logger().info(f"Ignoring {message.feed} feed result, view has changed")
+            return
+
+        if content.query("#loading_placeholder"):
+            self._show_feed(message.feed, message.posts)
+        elif self._revalidating_feed == message.feed:
+            self._revalidating_feed = None
+            self.query_one(Sidebar).update_status(self.FEEDS[message.feed][1])
+            post_list = next((pl for pl in content.query(PostList) if pl.posts is self.current_posts), None)
+            if post_list is None:
+                return
+            after = getattr(message.posts[-1], "fullname", None) if message.posts else None
+            posts = self._filter_posts(message.posts)
             self.current_posts = posts
-            
-            content = self.query_one("#content")
-            content.remove_children()
-            post_list = PostList(posts=posts)
-            content.mount(post_list)
-            
-            self.query_one(Sidebar).update_status("Top Feed")
-            post_list.focus()
-        except ConnectionError as e:
-            Logger().error(f"Network connection error: {str(e)}", exc_info=True)
+            post_list.reconcile_posts(posts, after=after)
+        else:
+            Logger().info(f"Ignoring {message.feed} feed result, view has changed")
+
+    def _show_feed(self, feed, posts):
+        after = getattr(posts[-1], "fullname", None) if posts else None
+        posts = self._filter_posts(posts)
+        self.current_posts = posts
+
+        content = self.query_one("#content")
+        content.park()
+        post_list = PostList(
+            posts=posts,
+            after=after,
+            page_loader=partial(self._load_feed_page, feed),
+            post_filter=self._filter_posts,
+            post_refresher=self.reddit_service.refresh_posts,
+            comment_prefetcher=self.prefetch_comments,
+        )
+        content.mount(post_list)
+        post_list.focus()
+        return post_list
+
+    def _load_feed_page(self, feed, after):
+        method_name, _ = self.FEEDS[feed]
+        fetch = getattr(self.reddit_service, method_name)
+        return fetch(limit=self.settings.get("posts_per_page", 25), after=after, lane=LANE_PREFETCH)
+
+    def default_comment_sort(self):
+        sort = str(self.settings.get("sort_comments_by", "best")).lower()
+        return sort if sort in RedditService.COMMENT_SORTS else "best"
+
+    def prefetch_comments(self, post, cancel_token=None):
+        """Load a post's comments into the comment cache in the prefetch lane,
+        unless offline or the rate limit budget is needed for interactive requests."""
+        if not self.is_authenticated() or self.reddit_service.offline or not self.reddit_service.has_prefetch_budget():
+            return
+        self.reddit_service.get_post_comments(
+            post, sort=self.default_comment_sort(), lane=LANE_PREFETCH, cancel_token=cancel_token
+        )
+
+    def _filter_posts(self, posts):
+        if self.settings.get("show_nsfw", False):
+            return list(posts)
+        return [post for post in posts if not getattr(post, "over_18", False)]
+
+    def on_reddit_tui_feed_failed(self, message: "RedditTUI.FeedFailed") -> None:
+        if message.feed != self.current_feed:
+            return
+        error = message.error
+        content = self.query_one("#content")
+        for placeholder in content.query("#loading_placeholder"):
+            placeholder.update("Failed to load feed")
+
+        if isinstance(error, RedditUnavailableError):
+            Logger().error(f"Reddit unavailable: {str(error)}", exc_info=error)
+            self.notify(f"Error: {str(error)}", severity="error")
+        elif isinstance(error, ConnectionError):
+            Logger().error(f"Network connection error: {str(error)}", exc_info=error)
             self.notify("Error: No internet connection", severity="error")
-        except TimeoutError as e:
-            Logger().error(f"Request timeout: {str(e)}", exc_info=True)
+        elif isinstance(error, TimeoutError):
+            Logger().error(f"Request timeout: {str(error)}", exc_info=error)
             self.notify("Error: Request timed out. Please try again.", severity="error")
-        except Exception as e:
-            Logger().error(f"Error loading top feed: {str(e)}", exc_info=True)
-            self.notify(f"Error loading top feed: {str(e)}", severity="error")
+        else:
+            Logger().error(f"Error loading {message.feed} feed: {str(error)}", exc_info=error)
+            self.notify(f"Error loading {message.feed} feed: {str(error)}", severity="error")
 
     async def action_search(self) -> None:
         Logger().info("Action: search")
         try:
+            from components.advanced_search_screen import AdvancedSearchScreen
             screen = AdvancedSearchScreen(self.query_one("#content"), self.current_posts)
             await self.push_screen(screen)
             self.query_one(Sidebar).update_status("Search Feed")
@@ -1190,6 +1368,7 @@ class RedditTUI(App):
     async def action_help(self) -> None:
         Logger().info("Action: help")
         try:
+            from components.help_screen import HelpScreen
             help_screen = HelpScreen()
             await self.push_screen(help_screen)
         except Exception as e:
@@ -1199,6 +1378,7 @@ class RedditTUI(App):
     async def action_settings(self) -> None:
         Logger().info("Action: settings")
         try:
+            from components.settings_screen import SettingsScreen
             settings_screen = SettingsScreen()
             result = await self.push_screen(settings_screen)
             if result:
@@ -1221,7 +1401,9 @@ class RedditTUI(App):
             "auto_load_comments": True,
             "show_nsfw": False,
             "theme": "dark",
-            "sort_comments_by": "best"
+            "sort_comments_by": "best",
+            "offline_mode": False,
+            "launch_size": "120x40"
         }
 
         try:
@@ -1268,29 +1450,9 @@ class RedditTUI(App):
             # Apply theme
             self.theme = self.settings.get("theme", "dark")
 
-            # Apply posts per page settings
-            if self.current_posts:
-                posts = getattr(self.reddit_service, f"get_{self.current_feed}_posts")(limit=self.settings["posts_per_page"])
-                self.current_posts = posts
-                
-                # Try to update existing PostList if it exists, otherwise skip
-                try:
-                    post_list = self.query_one(PostList)
-                    post_list.update_posts(posts)
-                except:
-                    # PostList doesn't exist, skip updating
-                    pass
-
-            # Apply NSFW filter
-            if not self.settings["show_nsfw"]:
-                self.current_posts = [post for post in self.current_posts if not getattr(post, "over_18", False)]
-                # Try to update existing PostList if it exists, otherwise skip
-                try:
-                    post_list = self.query_one(PostList)
-                    post_list.update_posts(self.current_posts)
-                except:
-                    # PostList doesn't exist, skip updating
-                    pass
+            # Reload the current feed so posts per page and the NSFW filter apply
+            if self.current_posts and self.query(PostList):
+                self.load_feed(self.current_feed)
 
             self.refresh()
             Logger().info("Settings applied successfully")
@@ -1301,17 +1463,16 @@ class RedditTUI(App):
     def get_system_commands(self, screen):
         yield from super().get_system_commands(screen)
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
                     yield SystemCommand("Back", "Return to post list", self.action_back)
                     if post and post.author:
-                        yield SystemCommand("View User Profile", f"View profile of {post.author.name}", self.action_view_user)
+                        yield SystemCommand("View User Profile", f"View profile of {post.author}", self.action_view_user)
                     yield SystemCommand("Save Post", "Save the currently viewed post", self.save_selected_post)
                     yield SystemCommand("Hide Post", "Hide the currently viewed post", self.hide_selected_post)
-                    yield SystemCommand("Subscribe to Subreddit", f"Subscribe to r/{post.subreddit.display_name}", self.subscribe_to_subreddit)
+                    yield SystemCommand("Subscribe to Subreddit", f"Subscribe to r/{post.subreddit}", self.subscribe_to_subreddit)
                     yield SystemCommand("Upvote post", "Upvote the currently viewed post", self.upvote_selected_post)
                     yield SystemCommand("Downvote post", "Downvote the currently viewed post", self.downvote_selected_post)
                     yield SystemCommand("Report post", "Report the currently viewed post", self.report_selected_post)
@@ -1321,20 +1482,21 @@ class RedditTUI(App):
                     yield SystemCommand("Open in Browser", "Open the post in your default browser", self.open_in_browser)
                     yield SystemCommand("Show QR Code", "Display QR code for the post URL", self.show_qr_code)
                     yield SystemCommand("Share Post URL", "Copy post URL for sharing", self.share_post_url)
+                    yield SystemCommand("Load More Comments", "Expand the next collapsed batch of comments", lambda: view.load_next_more())
                     yield SystemCommand("Sort Comments: Best", "Sort comments by best", lambda: self.sort_comments("best"))
                     yield SystemCommand("Sort Comments: Top", "Sort comments by top", lambda: self.sort_comments("top"))
                     yield SystemCommand("Sort Comments: New", "Sort comments by new", lambda: self.sort_comments("new"))
                     yield SystemCommand("Sort Comments: Controversial", "Sort comments by controversial", lambda: self.sort_comments("controversial"))
                     yield SystemCommand("Sort Comments: Old", "Sort comments by old", lambda: self.sort_comments("old"))
                     yield SystemCommand("Sort Comments: Q&A", "Sort comments by Q&A", lambda: self.sort_comments("qa"))
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                     if post and post.author:
-                        yield SystemCommand("View User Profile", f"View profile of {post.author.name}", self.action_view_user)
+                        yield SystemCommand("View User Profile", f"View profile of {post.author}", self.action_view_user)
                     if post:
                         yield SystemCommand("Save Post", "Save the selected post", self.save_selected_post)
                         yield SystemCommand("Hide Post", "Hide the selected post", self.hide_selected_post)
-                        yield SystemCommand("Subscribe to Subreddit", f"Subscribe to r/{post.subreddit.display_name}", self.subscribe_to_subreddit)
+                        yield SystemCommand("Subscribe to Subreddit", f"Subscribe to r/{post.subreddit}", self.subscribe_to_subreddit)
                         yield SystemCommand("Copy Post URL", "Copy the post's URL to clipboard", self.copy_post_url)
                         yield SystemCommand("Copy Post Title", "Copy the post's title to clipboard", self.copy_post_title)
                         yield SystemCommand("Open in Browser", "Open the post in your default browser", self.open_in_browser)
@@ -1349,31 +1511,15 @@ class RedditTUI(App):
             if not self.reddit_service:
                 self.notify("Reddit service not initialized", severity="error")
                 return
-                
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
-                else:
-                    self.notify("No post selected", severity="warning")
-                    return
 
-                if post:
-                    if self.reddit_service.save_post(post):
-                        self.notify("Post saved successfully!", severity="information")
-                        Logger().info(f"Saved post: {post.title}")
-                        # Refresh the current view
-                        if self.query_one(Sidebar).status == "Saved Posts":
-                            posts = self.reddit_service.get_saved_posts()
-                            self.current_posts = posts
-                            self.query_one(PostList).update_posts(posts)
-                    else:
-                        self.notify("Failed to save post", severity="error")
-                else:
-                    self.notify("No post selected", severity="warning")
+            post = self._selected_post()
+            if post:
+                self.reddit_service.queue_mutation(SAVE, post.id, True, original=bool(post.saved), label=post.title)
+                self._update_post(post.replace(saved=True))
+                self.notify("Post saved successfully!", severity="information")
+                Logger().info(f"Saved post: {post.title}")
+            else:
+                self.notify("No post selected", severity="warning")
         except Exception as e:
             Logger().error(f"Error saving post: {str(e)}", exc_info=True)
             self.notify(f"Error saving post: {str(e)}", severity="error")
@@ -1383,43 +1529,18 @@ class RedditTUI(App):
             if not self.reddit_service:
                 self.notify("Reddit service not initialized", severity="error")
                 return
-                
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
-                else:
-                    self.notify("No post selected", severity="warning")
-                    return
 
-                if post:
-                    if self.reddit_service.hide_post(post):
-                        self.notify("Post hidden successfully!", severity="information")
-                        Logger().info(f"Hidden post: {post.title}")
-                        # Remove the post from the current list and refresh
-                        if isinstance(children[0], PostList):
-                            self.current_posts = [p for p in self.current_posts if p.id != post.id]
-                            children[0].update_posts(self.current_posts)
-                            current_status = self.query_one(Sidebar).status
-                            if current_status == "Home Feed":
-                                posts = self.reddit_service.get_hot_posts()
-                                self.current_posts = posts
-                                self.query_one(PostList).update_posts(posts)
-                            elif current_status == "New Feed":
-                                posts = self.reddit_service.get_new_posts()
-                                self.current_posts = posts
-                                self.query_one(PostList).update_posts(posts)
-                            elif current_status == "Top Feed":
-                                posts = self.reddit_service.get_top_posts()
-                                self.current_posts = posts
-                                self.query_one(PostList).update_posts(posts)
-                    else:
-                        self.notify("Failed to hide post", severity="error")
-                else:
-                    self.notify("No post selected", severity="warning")
+            post = self._selected_post()
+            if post:
+                self.reddit_service.queue_mutation(HIDE, post.id, True, original=bool(post.hidden), label=post.title)
+                index = self._remove_post(post.id)
+                if index is not None:
+                    # Remember where the post was in case the hide fails
+                    self._hidden_posts[post.id] = (index, post)
+                self.notify("Post hidden successfully!", severity="information")
+                Logger().info(f"Hidden post: {post.title}")
+            else:
+                self.notify("No post selected", severity="warning")
         except Exception as e:
             Logger().error(f"Error hiding post: {str(e)}", exc_info=True)
             self.notify(f"Error hiding post: {str(e)}", severity="error")
@@ -1429,27 +1550,15 @@ class RedditTUI(App):
             if not self.reddit_service:
                 self.notify("Reddit service not initialized", severity="error")
                 return
-                
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
-                else:
-                    self.notify("No post selected", severity="warning")
-                    return
 
-                if post:
-                    subreddit_name = post.subreddit.display_name
-                    if self.reddit_service.subscribe_subreddit(subreddit_name):
-                        self.notify(f"Subscribed to r/{subreddit_name}!", severity="information")
-                        Logger().info(f"Subscribed to subreddit: {subreddit_name}")
-                    else:
-                        self.notify(f"Failed to subscribe to r/{subreddit_name}", severity="error")
-                else:
-                    self.notify("No post selected", severity="warning")
+            post = self._selected_post()
+            if post:
+                subreddit_name = post.subreddit
+                self.reddit_service.queue_mutation(SUBSCRIBE, subreddit_name, True, label=f"r/{subreddit_name}")
+                self.notify(f"Subscribed to r/{subreddit_name}!", severity="information")
+                Logger().info(f"Subscribed to subreddit: {subreddit_name}")
+            else:
+                self.notify("No post selected", severity="warning")
         except Exception as e:
             Logger().error(f"Error subscribing to subreddit: {str(e)}", exc_info=True)
             self.notify(f"Error subscribing to subreddit: {str(e)}", severity="error")
@@ -1461,16 +1570,7 @@ class RedditTUI(App):
                 self.notify("Please login first", severity="warning")
                 return
 
-            posts = self.reddit_service.get_saved_posts()
-            self.current_posts = posts
-            
-            content = self.query_one("#content")
-            content.remove_children()
-            post_list = PostList(posts=posts)
-            content.mount(post_list)
-            
-            self.query_one(Sidebar).update_status("Saved Posts")
-            post_list.focus()
+            self.load_feed("saved")
         except Exception as e:
             Logger().error(f"Error loading saved posts: {str(e)}", exc_info=True)
             self.notify(f"Error loading saved posts: {str(e)}", severity="error")
@@ -1483,7 +1583,8 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            content.remove_children()
+            content.park()
+            from components.subreddit_screen import SubredditScreen
             subreddit_screen = SubredditScreen(content, self.current_posts)
             content.mount(subreddit_screen)
             subreddit_screen.focus()
@@ -1493,33 +1594,147 @@ class RedditTUI(App):
             self.notify(f"Error loading subscribed subreddits: {str(e)}", severity="error")
 
     def upvote_selected_post(self):
-        post = self.query_one(PostList).get_selected_post()
-        if post:
-            try:
-                post.upvote()
-                self.notify("Upvoted post!", severity="information")
-                Logger().info(f"Upvoted post: {getattr(post, 'title', str(post))}")
-            except Exception as e:
-                Logger().error(f"Error upvoting post: {str(e)}", exc_info=True)
-                self.notify(f"Error upvoting post: {str(e)}", severity="error")
-        else:
-            self.notify("No post selected", severity="warning")
+        self._vote_selected_post(1)
 
     def downvote_selected_post(self):
-        post = self.query_one(PostList).get_selected_post()
-        if post:
+        self._vote_selected_post(-1)
+
+    def _vote_selected_post(self, direction):
+        post = self._selected_post()
+        if not post:
+            self.notify("No post selected", severity="warning")
+            return
+        current = self.VOTE_VALUES[post.likes]
+        # Voting the same way twice takes the vote back
+        value = 0 if current == direction else direction
+        self.reddit_service.queue_mutation(VOTE, post.id, value, original=current, label=post.title)
+        self._update_post(self._with_vote(post, value))
+        action = {1: "Upvoted", -1: "Downvoted", 0: "Removed vote on"}[value]
+        self.notify(f"{action} post!", severity="information")
+        Logger().info(f"{action} post: {post.title}")
+
+    # PostRecord.likes for each vote value and back
+    VOTE_VALUES = {True: 1, False: -1, None: 0}
+    LIKES = {1: True, -1: False, 0: None}
+
+    def _with_vote(self, post, value):
+        score = (post.score or 0) + value - self.VOTE_VALUES[post.likes]
+        return post.replace(likes=self.LIKES[value], score=score)
+
+    def _active_view(self):
+        """The view shown in #content, or None if it shows more than one widget.
+        A PostList stays mounted but hidden while one of its posts is open."""
+        views = [child for child in self.query_one("#content").children if child.display]
+        if len(views) > 1:
+            # A subreddit or search header above its post list
+            views = [view for view in views if isinstance(view, (PostList, PostViewScreen))]
+        return views[0] if len(views) == 1 else None
+
+    def _selected_post(self):
+        """The post being viewed, or the one selected in the post list."""
+        view = self._active_view()
+        if view is not None:
+            if isinstance(view, PostViewScreen):
+                return view.post
+            if isinstance(view, PostList):
+                return view.get_selected_post()
+        return None
+
+    # current_posts is the model of the feed and is usually the very list the
+    # PostList shows, so the helpers below change both by id and are safe to
+    # apply twice to the same list.
+
+    def _update_post(self, post):
+        """Show a changed post wherever it is displayed."""
+        index = next((i for i, p in enumerate(self.current_posts) if p.id == post.id), None)
+        if index is not None:
+            self.current_posts[index] = post
+        content = self.query_one("#content")
+        for post_list in content.query(PostList):
+            post_list.update_post(post)
+        for post_view in content.query(PostViewScreen):
+            if post_view.post.id == post.id:
+                post_view.post = post
+                post_view.query_one("#post_metadata").update(post_view._get_metadata())
+
+    def _remove_post(self, post_id):
+        """Drop a post from the feed and the post list. Returns its index in the feed."""
+        index = next((i for i, p in enumerate(self.current_posts) if p.id == post_id), None)
+        # PostList first, so it can move its cursor before the shared list changes
+        for post_list in self.query_one("#content").query(PostList):
+            post_list.remove_post(post_id)
+        if index is not None and index < len(self.current_posts) and self.current_posts[index].id == post_id:
+            del self.current_posts[index]
+        return index
+
+    def _restore_post(self, index, post):
+        for post_list in self.query_one("#content").query(PostList):
+            post_list.insert_post(index, post)
+        if not any(p.id == post.id for p in self.current_posts):
+            self.current_posts.insert(min(index, len(self.current_posts)), post)
+
+    def _on_mutation_finished(self, mutation, succeeded):
+        # Called from the mutation queue's thread
+        if not succeeded:
             try:
-                post.downvote()
-                self.notify("Downvoted post!", severity="information")
-                Logger().info(f"Downvoted post: {getattr(post, 'title', str(post))}")
-            except Exception as e:
-                Logger().error(f"Error downvoting post: {str(e)}", exc_info=True)
-                self.notify(f"Error downvoting post: {str(e)}", severity="error")
+                self.call_from_thread(self._roll_back_mutation, mutation)
+            except RuntimeError:
+                pass
+        elif mutation.kind == HIDE:
+            self._hidden_posts.pop(mutation.target, None)
+
+    def action_toggle_offline(self) -> None:
+        if not self.reddit_service:
+            return
+        offline = not self.reddit_service.offline
+        Logger().info(f"Action: toggle offline mode ({offline})")
+        self.settings["offline_mode"] = offline
+        self.save_settings()
+        self.reddit_service.set_offline(offline)
+        if not offline and self.is_authenticated():
+            self.load_feed(self.current_feed)
+
+    def _on_offline_changed(self, offline):
+        # Called from whichever thread noticed the change
+        try:
+            self.call_from_thread(self._show_offline_status, offline)
+        except RuntimeError:
+            self._show_offline_status(offline)
+
+    def _show_offline_status(self, offline):
+        try:
+            self.query_one(Sidebar).update_offline_status(offline)
+        except Exception as e:
+            Logger().error(f"Error showing offline status: {str(e)}", exc_info=True)
+            return
+        if offline:
+            pending = self.reddit_service.mutations.pending_count()
+            queued = f", {pending} changes queued" if pending else ""
+            self.notify(f"Offline: showing saved content{queued}", severity="warning")
         else:
-            self.notify("No post selected", severity="warning")
+            self.notify("Back online", severity="information")
+
+    def _roll_back_mutation(self, mutation):
+        action = {VOTE: "vote on", SAVE: "save", HIDE: "hide", SUBSCRIBE: "subscribe to"}[mutation.kind]
+        self.notify(f"Failed to {action} {mutation.label or mutation.target}", severity="error")
+        if self.reddit_service.mutations.pending_value(mutation.account, mutation.kind, mutation.target) is not None:
+            # A newer change of the same state is queued and will settle it
+            return
+        Logger().info(f"Rolling back {mutation}")
+        if mutation.kind == VOTE:
+            post = next((p for p in self.current_posts if p.id == mutation.target), None)
+            if post is not None:
+                self._update_post(self._with_vote(post, mutation.original or 0))
+        elif mutation.kind == SAVE:
+            post = next((p for p in self.current_posts if p.id == mutation.target), None)
+            if post is not None:
+                self._update_post(post.replace(saved=mutation.original))
+        elif mutation.kind == HIDE and mutation.target in self._hidden_posts:
+            index, post = self._hidden_posts.pop(mutation.target)
+            self._restore_post(index, post)
 
     async def report_selected_post(self):
-        post = self.query_one(PostList).get_selected_post()
+        post = self._selected_post()
         if not post:
             self.notify("No post selected", severity="warning")
             return
@@ -1533,20 +1748,19 @@ class RedditTUI(App):
         ]
         reason = await self.push_screen(ReportReasonScreen(reasons))
         if reason and reason != "back":
-            try:
-                post.report(reason)
+            if self.reddit_service.report_post(post, str(reason)):
                 self.notify(f"Reported post for: {reason}", severity="warning")
-                Logger().info(f"Reported post: {getattr(post, 'title', str(post))} for {reason}")
-            except Exception as e:
-                Logger().error(f"Error reporting post: {str(e)}", exc_info=True)
-                self.notify(f"Error reporting post: {str(e)}", severity="error")
+                Logger().info(f"Reported post: {post.title} for {reason}")
+            else:
+                self.notify("Failed to report post", severity="error")
         elif reason == "back":
             self.notify("Report cancelled", severity="information")
 
     def comment_on_selected_post(self):
-        post = self.query_one(PostList).get_selected_post()
+        post = self._selected_post()
         if post:
             self.logger.info(f"Opening comment screen for post: {getattr(post, 'title', str(post))}")
+            from components.comment_screen import CommentScreen
             self.push_screen(CommentScreen(post))
         else:
             self.notify("No post selected", severity="warning")
@@ -1555,19 +1769,20 @@ class RedditTUI(App):
         Logger().info("Action: view user")
         try:
             content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
-                elif isinstance(children[0], PostViewScreen):
-                    post = children[0].post
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostList):
+                    post = view.get_selected_post()
+                elif isinstance(view, PostViewScreen):
+                    post = view.post
                 else:
                     self.notify("Please select a post first", severity="warning")
                     return
 
                 if post and post.author:
-                    username = post.author.name
-                    content.remove_children()
+                    username = post.author
+                    content.park()
+                    from components.user_profile_screen import UserProfileScreen
                     user_screen = UserProfileScreen(username, content, self.current_posts)
                     content.mount(user_screen)
                     user_screen.focus()
@@ -1588,7 +1803,8 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            content.remove_children()
+            content.park()
+            from components.user_profile_screen import UserProfileScreen
             user_screen = UserProfileScreen(self.reddit_service.user, content, self.current_posts)
             content.mount(user_screen)
             user_screen.focus()
@@ -1599,13 +1815,12 @@ class RedditTUI(App):
 
     def copy_post_url(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                 else:
                     self.notify("No post selected", severity="warning")
                     return
@@ -1624,13 +1839,12 @@ class RedditTUI(App):
 
     def copy_post_title(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                 else:
                     self.notify("No post selected", severity="warning")
                     return
@@ -1649,13 +1863,12 @@ class RedditTUI(App):
 
     def open_in_browser(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                 else:
                     self.notify("No post selected", severity="warning")
                     return
@@ -1674,19 +1887,19 @@ class RedditTUI(App):
 
     async def show_qr_code(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                 else:
                     self.notify("No post selected", severity="warning")
                     return
 
                 if post:
                     url = f"https://reddit.com{post.permalink}"
+                    from components.qr_screen import QRScreen
                     qr_screen = QRScreen(url)
                     await self.push_screen(qr_screen)
                     Logger().info(f"Showing QR code for URL: {url}")
@@ -1698,47 +1911,89 @@ class RedditTUI(App):
 
     async def action_advanced_search(self) -> None:
         self.logger.info("Action: advanced search")
+        from components.advanced_search_screen import AdvancedSearchScreen
         screen = AdvancedSearchScreen(self.query_one("#content"), self.current_posts)
         await self.push_screen(screen)
 
     def sort_comments(self, sort_mode):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1 and isinstance(children[0], PostViewScreen):
-                children[0].sort_comments(sort_mode)
+            view = self._active_view()
+            if isinstance(view, PostViewScreen):
+                view.sort_comments(sort_mode)
                 self.notify(f"Comments sorted by {sort_mode}", severity="information")
         except Exception as e:
             Logger().error(f"Error sorting comments: {str(e)}", exc_info=True)
             self.notify(f"Error sorting comments: {str(e)}", severity="error")
 
+    def action_load_more_comments(self, key):
+        try:
+            view = self._active_view()
+            if isinstance(view, PostViewScreen):
+                view.load_more(key)
+        except Exception as e:
+            Logger().error(f"Error loading more comments: {str(e)}", exc_info=True)
+            self.notify(f"Error loading more comments: {str(e)}", severity="error")
+
+    def show_previous_view(self):
+        """Leave the current view for the one before it, as it was, or for the
+        feed's posts if that view fell out of the history."""
+        content = self.query_one("#content")
+        if not content.back():
+            content.park()
+            post_list = PostList(posts=self.current_posts)
+            content.mount(post_list)
+            post_list.focus()
+
     def action_back(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1 and isinstance(children[0], PostViewScreen):
-                content.remove_children()
-                post_list = PostList(posts=self.current_posts)
-                content.mount(post_list)
-                post_list.focus()
+            if isinstance(self._active_view(), PostViewScreen):
+                self.show_previous_view()
                 Logger().info("Returned to post list")
         except Exception as e:
             Logger().error(f"Error returning to post list: {str(e)}", exc_info=True)
             self.notify(f"Error returning to post list: {str(e)}", severity="error")
 
+    def action_history_back(self):
+        Logger().info("Action: history back")
+        if not self.query_one("#content").back():
+            self.notify("Nothing to go back to", severity="information")
+
+    def action_history_forward(self):
+        Logger().info("Action: history forward")
+        if not self.query_one("#content").forward():
+            self.notify("Nothing to go forward to", severity="information")
+
+    def _view_state(self):
+        return {
+            "feed": self.current_feed,
+            "posts": self.current_posts,
+            "status": self.query_one(Sidebar).status,
+        }
+
+    def on_view_stack_restored(self, message: ViewStack.Restored) -> None:
+        # Put back the feed the restored view belongs to
+        state = message.state
+        if not state:
+            return
+        self.current_feed = state["feed"]
+        self.current_posts = state["posts"]
+        self.query_one(Sidebar).update_status(state["status"])
+
     async def action_create_post(self) -> None:
         self.logger.info("Action: create post")
         try:
             content = self.query_one("#content")
-            children = list(content.children)
+            view = self._active_view()
             subreddit = None
-            if len(children) == 1:
-                if isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            if view is not None:
+                if isinstance(view, PostList):
+                    post = view.get_selected_post()
                     if post:
-                        subreddit = post.subreddit.display_name
-            content.remove_children()
+                        subreddit = post.subreddit
+            content.park()
+            from components.post_creation_screen import PostCreationScreen
             screen = PostCreationScreen(subreddit)
+            await content.mount(screen)
             screen.focus()
             self.query_one(Sidebar).update_status("Create Post")
         except Exception as e:
@@ -1748,6 +2003,7 @@ class RedditTUI(App):
     async def action_credits(self) -> None:
         """Show credits screen."""
         Logger().info("Action: credits")
+        from components.credits_screen import CreditsScreen
         await self.push_screen(CreditsScreen())
 
     async def action_rate_limit(self) -> None:
@@ -1758,7 +2014,8 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            content.remove_children()
+            content.park()
+            from components.rate_limit_screen import RateLimitScreen
             rate_limit_screen = RateLimitScreen(self.reddit_service)
             content.mount(rate_limit_screen)
             rate_limit_screen.focus()
@@ -1771,7 +2028,8 @@ class RedditTUI(App):
         Logger().info("Action: create theme")
         try:
             content = self.query_one("#content")
-            content.remove_children()
+            content.park()
+            from components.theme_creation_screen import ThemeCreationScreen
             screen = ThemeCreationScreen(content, self.current_posts)
             content.mount(screen)
             screen.focus()
@@ -1789,21 +2047,14 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            parent = content.parent
-            content.remove()
-            self.call_later(self._mount_messages_screen, parent)
+            content.park()
+            from components.messages_screen import MessagesScreen
+            content.mount(MessagesScreen(self.reddit_service))
             self.query_one(Sidebar).update_status("Messages")
         except Exception as e:
             Logger().error(f"Error showing messages screen: {str(e)}", exc_info=True)
             self.notify(f"Error showing messages: {str(e)}", severity="error")
 
-    async def _mount_messages_screen(self, parent):
-        from textual.containers import Container
-        from components.messages_screen import MessagesScreen
-        new_content = Container(id="content")
-        parent.mount(new_content)
-        new_content.mount(MessagesScreen(self.reddit_service))
-
     async def action_account_management(self) -> None:
         Logger().info("Action: account management")
         try:
@@ -1812,10 +2063,15 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            if content.query("#account_management_wrapper"):
-                return
+            wrapper = next(iter(content.query("#account_management_wrapper")), None)
+            if wrapper is not None:
+                if wrapper.display:
+                    return
+                # Parked earlier, a fresh one lists the accounts as they are now
+                await wrapper.remove()
 
-            content.remove_children()
+            content.park()
+            from components.account_management_screen import AccountManagementWidget
             account_widget = AccountManagementWidget(self.reddit_service)
             content.mount(Container(account_widget, id="account_management_wrapper"))
             account_widget.focus()
@@ -1824,13 +2080,13 @@ class RedditTUI(App):
             Logger().error(f"Error in account management: {str(e)}", exc_info=True)
             self.notify(f"Error: {str(e)}", severity="error")
 
-    def on_account_management_widget_account_switched(self, message: AccountManagementWidget.AccountSwitched):
+    def on_account_management_widget_account_switched(self, message: "AccountManagementWidget.AccountSwitched"):
         account = message.username
         if account:
             Logger().info(f"Account switched to: {account}, reloading current feed")
             
             content = self.query_one("#content")
-            content.remove_children()
+            content.reset()
 
             if self.current_feed == "hot":
                 self.action_home()
@@ -1841,8 +2097,10 @@ class RedditTUI(App):
             else:
                 self.action_home()
 
-    def on_account_management_widget_back_requested(self, message: AccountManagementWidget.BackRequested):
+    def on_account_management_widget_back_requested(self, message: "AccountManagementWidget.BackRequested"):
         content = self.query_one("#content")
+        if content.back():
+            return
         content.remove_children()
         content.focus()
         
@@ -1862,7 +2120,8 @@ class RedditTUI(App):
                 return
 
             content = self.query_one("#content")
-            content.remove_children()
+            content.park()
+            from components.subreddit_management_screen import SubredditManagementScreen
             subreddit_screen = SubredditManagementScreen(self.reddit_service)
             content.mount(subreddit_screen)
             subreddit_screen.focus()
@@ -1878,6 +2137,7 @@ class RedditTUI(App):
                 self.notify("Please login first", severity="warning")
                 return
 
+            from components.advanced_search_screen import AdvancedSearchScreen
             screen = AdvancedSearchScreen(self.query_one("#content"), self.current_posts)
             await self.push_screen(screen)
             self.query_one(Sidebar).update_status("Subreddit Search")
@@ -1892,6 +2152,7 @@ class RedditTUI(App):
                 self.notify("Please login first", severity="warning")
                 return
 
+            from components.advanced_search_screen import AdvancedSearchScreen
             screen = AdvancedSearchScreen(self.query_one("#content"), self.current_posts)
             await self.push_screen(screen)
             self.query_one(Sidebar).update_status("User Search")
@@ -1901,13 +2162,12 @@ class RedditTUI(App):
 
     def share_post_url(self):
         try:
-            content = self.query_one("#content")
-            children = list(content.children)
-            if len(children) == 1:
-                if isinstance(children[0], PostViewScreen):
-                    post = children[0].post
-                elif isinstance(children[0], PostList):
-                    post = children[0].get_selected_post()
+            view = self._active_view()
+            if view is not None:
+                if isinstance(view, PostViewScreen):
+                    post = view.post
+                elif isinstance(view, PostList):
+                    post = view.get_selected_post()
                 else:
                     self.notify("No post selected", severity="warning")
                     return
@@ -1924,46 +2184,86 @@ class RedditTUI(App):
             Logger().error(f"Error copying post URL: {str(e)}", exc_info=True)
             self.notify(f"Error copying URL: {str(e)}", severity="error")
 
+def parse_size(value):
+    """Parse a --size value, "WIDTHxHEIGHT" or "terminal", into (width, height)
+    or None for the terminal's own size."""
+    if value == "terminal":
+        return None
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT or 'terminal', got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive, got {value!r}")
+    return width, height
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="reddit-tui", description="A terminal client for Reddit.")
+    parser.add_argument("--size", help="launch in a fixed size, WIDTHxHEIGHT (default 120x40), or 'terminal' to fill the terminal; remembered for the next start")
+    parser.add_argument("--offline", action=argparse.BooleanOptionalAction, default=None, help="start in (or out of) offline mode; remembered for the next start")
+    parser.add_argument("--send-logs", action=argparse.BooleanOptionalAction, default=None, help="also send regular logs, not only crash reports, to the developer; remembered for the next start")
+    parser.add_argument("--account", help="log in as this saved account instead of the most recently used one")
+    parser.add_argument("--feed", choices=list(RedditTUI.FEEDS), help="feed to open after logging in")
+    parser.add_argument("--profile", nargs="?", const="reddit-tui.prof", metavar="FILE", help="run under cProfile and write the stats to FILE (default reddit-tui.prof)")
+    args = parser.parse_args(argv)
+    if args.size is not None:
+        try:
+            parse_size(args.size)
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"argument --size: {e}")
+    return args
+
 if __name__ == "__main__":
-    if os.path.exists("log_sending.permission.jhna"):
-        with open("log_sending.permission.jhna", "r") as f:
-            data = json.load(f)
-            if data["log_sending"] == "true":
-                Logger().send_logs_to_developer = True
-            else:
-                Logger().info("Logs will not be sent to the developer.")
-    else:
-        print("Before starting RedditTUI, we need to set up the logger.")
-        print("RedditTUI will always log to a file.")
-        print("Any Crash or Exception will be logged and anonimously sent to the developer for debugging purposes.")
-
-        a = input("Do you also want to send every other log anonimously to the developer for debugging purposes? (y/n): ")
-        if a.lower() == "y":
-            Logger().send_logs_to_developer = True
-            soption = True
+    args = parse_args()
+    app = RedditTUI(account=args.account, feed=args.feed)
+
+    changed = {}
+    if args.size is not None:
+        changed["launch_size"] = args.size.lower()
+    if args.offline is not None:
+        changed["offline_mode"] = args.offline
+    if args.send_logs is not None:
+        changed["send_logs"] = args.send_logs
+    elif "send_logs" not in app.settings:
+        # First start, the choice used to be asked for on stdin and kept in this file
+        send_logs = False
+        if os.path.exists("log_sending.permission.jhna"):
+            with open("log_sending.permission.jhna", "r") as f:
+                send_logs = str(json.load(f).get("log_sending")).lower() == "true"
         else:
-            Logger().info("Logs will not be sent to the developer.")
-            soption = False
-        if soption:
-            a = input("Remember choice? (y/n): ")
-            if a.lower() == "y":
-                with open("log_sending.permission.jhna", "w") as f:
-                    if soption == True:
-                        f.write('{"log_sending": true}')
-                    else:
-                        f.write('{"log_sending": false}')
+            print("RedditTUI always logs to a file. Any crash or exception is logged and anonymously sent to the developer for debugging purposes.")
+            print("Start with --send-logs to also send every other log.")
+        changed["send_logs"] = send_logs
+    if changed:
+        app.settings.update(changed)
+        app.save_settings()
+
+    if app.settings["send_logs"]:
+        Logger().send_logs_to_developer = True
+    else:
+        Logger().info("Logs will not be sent to the developer.")
+
     Logger().info(f"=============================================================== Starting RedditTUI app at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ================================================================")
-    app = RedditTUI()
     try:
-        p = input("Launch RedditTUI in predefined size? (highly recommended) (y/n): ")
-        if p.lower() == "y":
-            app.run(size=(120, 40))
+        size = parse_size(str(app.settings.get("launch_size", "120x40")))
+    except argparse.ArgumentTypeError as e:
+        Logger().warning(f"Invalid launch_size setting, using 120x40: {str(e)}")
+        size = (120, 40)
+    profiler = None
+    try:
+        if args.profile:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.runcall(app.run, size=size)
         else:
-            app.run()
+            app.run(size=size)
     except Exception as e:
         Logger().error("Unhandled exception occurred", exc_info=True)
         Logger().send_crash_report(type(e), e, e.__traceback__)
         raise
     finally:
+        if profiler is not None:
+            profiler.dump_stats(args.profile)
+            Logger().info(f"Wrote profile to {args.profile}")
         Logger().send_logs()
         Logger().info(f"=============================================================== RedditTUI app exited at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ================================================================")
\ No newline at end of file
@@ -0,0 +1,203 @@
+import json
+import sqlite3
+import threading
+import time
+from utils.logger import Logger
+
+class ListingCache:
+    """On-disk cache of listing pages.
+
+    Each entry is keyed by (account, feed, subreddit, sort, time filter, after)
+    and stores the page as compact post records together with the time it was
+    fetched, how long it stays fresh and whether the listing ended with it.
+
+    Everything else the app reads from Reddit (comment trees, profiles, the
+    inbox) is kept as documents keyed by (account, kind, name), so it can be
+    shown again while Reddit cannot be reached.
+    """
+
+    DEFAULT_TTL = 300
+
+    def __init__(self, db_path, ttl: float = DEFAULT_TTL):
+        self.logger = Logger()
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS listings (
+                    account TEXT NOT NULL,
+                    feed TEXT NOT NULL,
+                    subreddit TEXT NOT NULL,
+                    sort TEXT NOT NULL,
+                    time_filter TEXT NOT NULL,
+                    after TEXT NOT NULL,
+                    records TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    ttl REAL NOT NULL,
+                    ended INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (account, feed, subreddit, sort, time_filter, after)
+                )
+                """
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(listings)")]
+            if "ended" not in columns:
+                # Caches written before pages recorded whether they ended
+                self._conn.execute("ALTER TABLE listings ADD COLUMN ended INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    account TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (account, kind, name)
+                )
+                """
+            )
+            self._conn.commit()
+            self.logger.info(f"Listing cache opened at {db_path}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to open listing cache: {str(e)}", exc_info=True)
+            self._conn = None
+
+    @staticmethod
+    def make_key(account, feed, subreddit="", sort="", time_filter="", after=None) -> tuple:
+        return (account or "", feed, subreddit or "", sort or "", time_filter or "", after or "")
+
+    def get(self, key: tuple, allow_stale: bool = False):
+        """Return (records, fetched_at, is_fresh, ended) for key, or None on a
+        miss. ended tells whether the listing has nothing after this page.
+
+        Stale entries are only returned when allow_stale is set.
+        """
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT records, fetched_at, ttl, ended FROM listings "
+                    "WHERE account = ? AND feed = ? AND subreddit = ? AND sort = ? AND time_filter = ? AND after = ?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading listing cache: {str(e)}", exc_info=True)
+            return None
+        if row is None:
+            return None
+
+        records, fetched_at, ttl, ended = row
+        is_fresh = time.time() - fetched_at < ttl
+        if not is_fresh and not allow_stale:
+            return None
+        try:
+            return json.loads(records), fetched_at, is_fresh, bool(ended)
+        except ValueError as e:
+            self.logger.error(f"Corrupt listing cache entry for {key}: {str(e)}")
+            return None
+
+    def put(self, key: tuple, records: list, ttl: float = None, ended: bool = False):
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO listings "
+                    "(account, feed, subreddit, sort, time_filter, after, records, fetched_at, ttl, ended) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*key, json.dumps(records), time.time(), self.ttl if ttl is None else ttl, int(ended)),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.error(f"Error writing listing cache: {str(e)}", exc_info=True)
+
+    @staticmethod
+    def make_document_key(account, kind, name) -> tuple:
+        return (account or "", kind, name or "")
+
+    def get_document(self, key: tuple):
+        """Return (data, fetched_at) for key, or None on a miss. Documents never
+        expire, they are only replaced by newer fetches."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM documents WHERE account = ? AND kind = ? AND name = ?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading document store: {str(e)}", exc_info=True)
+            return None
+        if row is None:
+            return None
+
+        data, fetched_at = row
+        try:
+            return json.loads(data), fetched_at
+        except ValueError as e:
+            self.logger.error(f"Corrupt document store entry for {key}: {str(e)}")
+            return None
+
+    def put_document(self, key: tuple, data):
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (account, kind, name, data, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                    (*key, json.dumps(data), time.time()),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.error(f"Error writing document store: {str(e)}", exc_info=True)
+
+    def update_post(self, account, post_id: str, changes: dict) -> int:
+        """Change fields of a post in every cached page of the account it
+        appears in, keeping the pages fresh. Returns how many pages changed."""
+        if self._conn is None:
+            return 0
+        updated = 0
+        try:
+            with self._lock:
+                # The LIKE only narrows the scan, the records decide
+                rows = self._conn.execute(
+                    "SELECT rowid, records FROM listings WHERE account = ? AND records LIKE ?",
+                    (account or "", f'%"{post_id}"%'),
+                ).fetchall()
+                for rowid, data in rows:
+                    records = json.loads(data)
+                    matches = [record for record in records if record.get("id") == post_id]
+                    if not matches:
+                        continue
+                    for record in matches:
+                        record.update(changes)
+                    self._conn.execute("UPDATE listings SET records = ? WHERE rowid = ?", (json.dumps(records), rowid))
+                    updated += 1
+                self._conn.commit()
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.error(f"Error updating listing cache: {str(e)}", exc_info=True)
+        return updated
+
+    def invalidate(self, account=None, feed=None):
+        """Drop cached pages, optionally only those of one account and/or feed."""
+        if self._conn is None:
+            return
+        clauses, params = [], []
+        if account is not None:
+            clauses.append("account = ?")
+            params.append(account)
+        if feed is not None:
+            clauses.append("feed = ?")
+            params.append(feed)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        try:
+            with self._lock:
+                self._conn.execute(f"DELETE FROM listings{where}", params)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error invalidating listing cache: {str(e)}", exc_info=True)
@@ -0,0 +1,234 @@
+from praw.models import MoreComments
+
+class Record:
+    """Base of the immutable records the service hands to the UI."""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            object.__setattr__(self, field, fields.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace() to change {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def replace(self, **changes):
+        """Return a copy of the record with the given fields changed."""
+        return type(self)(**{**self.to_dict(), **changes})
+
+class PostRecord(Record):
+    """Immutable snapshot of a submission as it appeared in a listing.
+
+    The UI only ever reads these records, so rendering can never trigger one of
+    PRAW's lazy fetches. Mutations go through RedditService, which resolves the
+    record to a PRAW Submission on demand.
+    """
+
+    __slots__ = (
+        "id", "name", "title", "subreddit", "author", "score", "num_comments",
+        "created_utc", "permalink", "url", "selftext", "is_self", "over_18",
+        "spoiler", "stickied", "likes", "saved", "hidden",
+    )
+
+    def __repr__(self):
+        return f"PostRecord(id={self.id!r}, title={self.title!r})"
+
+    @property
+    def fullname(self) -> str:
+        return self.name or f"t3_{self.id}"
+
+    @classmethod
+    def from_submission(cls, submission) -> "PostRecord":
+        """Build a record from the data PRAW already holds for a submission,
+        without triggering a fetch."""
+        data = vars(submission)
+        fields = {field: data.get(field) for field in cls.__slots__}
+        fields["subreddit"] = str(data["subreddit"]) if data.get("subreddit") else None
+        fields["author"] = str(data["author"]) if data.get("author") else None
+        return cls(**fields)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PostRecord":
+        fields = dict(data)
+        if fields.get("author") == "[deleted]":
+            fields["author"] = None
+        return cls(**fields)
+
+class CommentRecord(Record):
+    """Immutable snapshot of a comment and the replies that came with it.
+
+    replies holds CommentRecords and MoreRecords for the parts of the thread
+    Reddit left out of the response.
+    """
+
+    __slots__ = (
+        "id", "name", "parent_id", "author", "body", "score", "created_utc",
+        "likes", "stickied", "subreddit", "replies",
+    )
+
+    def __repr__(self):
+        return f"CommentRecord(id={self.id!r}, replies={len(self.replies)})"
+
+    @classmethod
+    def from_comment(cls, comment) -> "CommentRecord":
+        """Build a record, and records for its loaded replies, from the data
+        PRAW already holds for a comment, without triggering a fetch."""
+        data = vars(comment)
+        fields = {field: data.get(field) for field in cls.__slots__}
+        fields["author"] = str(data["author"]) if data.get("author") else None
+        fields["subreddit"] = str(data["subreddit"]) if data.get("subreddit") else None
+        # _replies is what came with the response; the replies property may fetch
+        fields["replies"] = comment_records(data.get("_replies") or [])
+        return cls(**fields)
+
+class MoreRecord(Record):
+    """Placeholder for comments Reddit left out of a response.
+
+    children lists the ids of the missing comments. A record with no children
+    stands for a "continue this thread" link, whose replies must be fetched
+    through the parent comment.
+    """
+
+    __slots__ = ("id", "name", "parent_id", "count", "children")
+
+    def __repr__(self):
+        return f"MoreRecord(parent_id={self.parent_id!r}, count={self.count})"
+
+    @property
+    def key(self) -> str:
+        # "continue this thread" stubs all share the id "_"
+        return f"{self.parent_id}/{self.id}"
+
+    @property
+    def is_continue_thread(self) -> bool:
+        return not self.children
+
+    @classmethod
+    def from_more_comments(cls, more) -> "MoreRecord":
+        data = vars(more)
+        return cls(
+            id=data.get("id"),
+            name=data.get("name"),
+            parent_id=data.get("parent_id"),
+            count=data.get("count") or 0,
+            children=tuple(data.get("children") or ()),
+        )
+
+class ProfileRecord(Record):
+    """Immutable snapshot of a redditor's profile."""
+
+    __slots__ = ("id", "name", "created_utc", "link_karma", "comment_karma")
+
+    def __repr__(self):
+        return f"ProfileRecord(name={self.name!r})"
+
+    @property
+    def total_karma(self) -> int:
+        return (self.link_karma or 0) + (self.comment_karma or 0)
+
+    @classmethod
+    def from_redditor(cls, redditor) -> "ProfileRecord":
+        """Build a record from a PRAW Redditor, fetching it if it is lazy."""
+        return cls(**{field: getattr(redditor, field, None) for field in cls.__slots__})
+
+class MessageRecord(Record):
+    """Immutable snapshot of a private message in the inbox."""
+
+    __slots__ = ("id", "name", "author", "dest", "subject", "body", "created_utc", "new")
+
+    def __repr__(self):
+        return f"MessageRecord(id={self.id!r}, subject={self.subject!r})"
+
+    @classmethod
+    def from_message(cls, message) -> "MessageRecord":
+        data = vars(message)
+        fields = {field: data.get(field) for field in cls.__slots__}
+        fields["author"] = str(data["author"]) if data.get("author") else None
+        fields["dest"] = str(data["dest"]) if data.get("dest") else None
+        return cls(**fields)
+
+def comment_records(items) -> tuple:
+    """Convert PRAW comments and MoreComments into records, keeping their order."""
+    records = []
+    for item in items:
+        if isinstance(item, MoreComments):
+            records.append(MoreRecord.from_more_comments(item))
+        else:
+            records.append(CommentRecord.from_comment(item))
+    return tuple(records)
+
+def nest_comments(records, parent_id) -> tuple:
+    """Arrange a flat list of records, as returned by /api/morechildren, into
+    trees. Returns the records whose parent is parent_id, each carrying its
+    replies from the list."""
+    names = {record.name for record in records if isinstance(record, CommentRecord)}
+    children = {}
+    for record in records:
+        # Anything whose parent is not part of the batch hangs off parent_id
+        parent = record.parent_id if record.parent_id in names else parent_id
+        children.setdefault(parent, []).append(record)
+
+    def build(fullname):
+        nodes = []
+        for record in children.get(fullname, ()):
+            if isinstance(record, CommentRecord):
+                record = record.replace(replies=record.replies + build(record.name))
+            nodes.append(record)
+        return tuple(nodes)
+
+    return build(parent_id)
+
+def splice_comments(comments, more, replacement) -> tuple:
+    """Return the comment tree with the MoreRecord more replaced by the
+    records in replacement. Only the branch leading to it is rebuilt."""
+    key = more.key
+    spliced = []
+    for node in comments:
+        if isinstance(node, MoreRecord) and node.key == key:
+            spliced.extend(replacement)
+        elif isinstance(node, CommentRecord) and node.replies:
+            replies = splice_comments(node.replies, more, replacement)
+            spliced.append(node if replies is node.replies else node.replace(replies=replies))
+        else:
+            spliced.append(node)
+    # Keep the original tuple when nothing below changed
+    if len(spliced) == len(comments) and all(a is b for a, b in zip(spliced, comments)):
+        return comments
+    return tuple(spliced)
+
+def comments_to_data(records) -> list:
+    """Convert a comment tree into plain dicts that can be stored as JSON."""
+    data = []
+    for record in records:
+        fields = record.to_dict()
+        if isinstance(record, MoreRecord):
+            fields["children"] = list(record.children)
+            fields["more"] = True
+        else:
+            fields["replies"] = comments_to_data(record.replies)
+        data.append(fields)
+    return data
+
+def comments_from_data(data) -> tuple:
+    """Rebuild a comment tree stored with comments_to_data."""
+    records = []
+    for fields in data:
+        if fields.get("more"):
+            records.append(MoreRecord(**{**fields, "children": tuple(fields.get("children") or ())}))
+        else:
+            records.append(CommentRecord(**{**fields, "replies": comments_from_data(fields.get("replies") or ())}))
+    return tuple(records)
@@ -0,0 +1,225 @@
+import json
+import threading
+import time
+from services.resilience import RedditUnreachableError
+from utils.logger import Logger
+
+VOTE = "vote"
+SAVE = "save"
+HIDE = "hide"
+SUBSCRIBE = "subscribe"
+
+class Mutation:
+    """A change of one piece of state (kind) of one post or subreddit (target).
+
+    value is the state to send to Reddit and original the state it had before
+    the first of the changes that were coalesced into this one. attempts counts
+    the tries Reddit failed since value was last changed.
+    """
+
+    __slots__ = ("account", "kind", "target", "value", "original", "label", "attempts", "due")
+
+    def __init__(self, account, kind, target, value, original=None, label="", attempts=0, due=0.0):
+        self.account = account
+        self.kind = kind
+        self.target = target
+        self.value = value
+        self.original = original
+        self.label = label
+        self.attempts = attempts or 0
+        self.due = due
+
+    @property
+    def key(self) -> tuple:
+        return (self.account, self.kind, self.target)
+
+    def __repr__(self):
+        return f"Mutation({self.kind} {self.target}: {self.original!r} -> {self.value!r})"
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__ if field != "due"}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Mutation":
+        return cls(**{field: data.get(field) for field in cls.__slots__ if field != "due"})
+
+class MutationQueue:
+    """Sends votes, saves, hides and subscriptions to Reddit in the background.
+
+    Mutations wait COALESCE_DELAY seconds before they are sent. A new mutation
+    for a key that is still waiting replaces its value, and one that restores
+    the original value drops it, so upvoting and then clearing the vote sends
+    nothing. Waiting and running mutations are journaled to disk and resumed
+    once their account is active again. All of them set a state rather than
+    toggle it, so sending one twice after a crash is harmless.
+
+    An executor that raises RedditUnreachableError could not reach Reddit at
+    all, e.g. while offline; the mutation is put back to be tried again later
+    instead of failing. Any other ConnectionError, e.g. Reddit answering 5xx or
+    429 or its circuit breaker being open, is retried after RETRY_DELAY,
+    doubling up to MAX_RETRY_DELAY, and fails after MAX_ATTEMPTS tries.
+
+    executor(mutation) performs a mutation and returns whether it succeeded.
+    Listeners are called with (mutation, succeeded) from the queue's thread.
+    """
+
+    COALESCE_DELAY = 1.0
+    # How often to look for work when none is due, e.g. for another account
+    IDLE_WAIT = 5.0
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY = 5.0
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, journal_path, executor, account_getter):
+        self.logger = Logger()
+        self.journal_path = journal_path
+        self.executor = executor
+        self.account_getter = account_getter
+        self._pending = {}
+        self._in_flight = {}
+        self._listeners = []
+        self._cond = threading.Condition()
+        self._shutdown = False
+        self._load_journal()
+        self._thread = threading.Thread(target=self._work_loop, name="reddit-mutations", daemon=True)
+        self._thread.start()
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def enqueue(self, account, kind, target, value, original=None, label=""):
+        """Queue a change. original is the state the UI showed before it."""
+        mutation = Mutation(account, kind, target, value, original, label)
+        with self._cond:
+            pending = self._pending.get(mutation.key)
+            if pending is not None:
+                if value == pending.original:
+                    self.logger.info(f"Dropping {pending}, it was undone before being sent")
+                    del self._pending[mutation.key]
+                else:
+                    pending.value = value
+                    pending.attempts = 0
+                    pending.due = time.monotonic() + self.COALESCE_DELAY
+            else:
+                in_flight = self._in_flight.get(mutation.key)
+                if in_flight is not None:
+                    # Build on the request already on its way
+                    mutation.original = in_flight.value
+                if value == mutation.original:
+                    return
+                mutation.due = time.monotonic() + self.COALESCE_DELAY
+                self._pending[mutation.key] = mutation
+                self.logger.info(f"Queued {mutation}")
+            self._save_journal()
+            self._cond.notify_all()
+
+    def pending_value(self, account, kind, target):
+        """The value a queued or running mutation will set, or None."""
+        key = (account, kind, target)
+        with self._cond:
+            mutation = self._pending.get(key) or self._in_flight.get(key)
+            return None if mutation is None else mutation.value
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending) + len(self._in_flight)
+
+    def wake(self):
+        """Look for work now, e.g. after switching to an account with queued mutations."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def shutdown(self):
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+
+    def _next_due(self):
+        account = self.account_getter()
+        now = time.monotonic()
+        wait = self.IDLE_WAIT
+        for key, mutation in self._pending.items():
+            if mutation.account != account or key in self._in_flight:
+                continue
+            if mutation.due <= now:
+                return mutation, 0
+            wait = min(wait, mutation.due - now)
+        return None, wait
+
+    def _work_loop(self):
+        while True:
+            with self._cond:
+                mutation, wait = self._next_due()
+                while mutation is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait(wait)
+                    mutation, wait = self._next_due()
+                del self._pending[mutation.key]
+                self._in_flight[mutation.key] = mutation
+
+            succeeded = False
+            retry_in = None
+            try:
+                succeeded = bool(self.executor(mutation))
+            except RedditUnreachableError as e:
+                self.logger.warning(f"Could not reach Reddit to send {mutation}, keeping it queued: {str(e)}")
+                retry_in = self.IDLE_WAIT
+            except ConnectionError as e:
+                mutation.attempts += 1
+                if mutation.attempts < self.MAX_ATTEMPTS:
+                    retry_in = min(self.RETRY_DELAY * 2 ** (mutation.attempts - 1), self.MAX_RETRY_DELAY)
+                    self.logger.warning(
+                        f"Could not send {mutation} (attempt {mutation.attempts}), "
+                        f"retrying in {retry_in:.0f}s: {str(e)}"
+                    )
+                else:
+                    self.logger.error(f"Giving up on {mutation} after {mutation.attempts} attempts: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"Error applying {mutation}: {str(e)}", exc_info=True)
+
+            retry = retry_in is not None
+            with self._cond:
+                del self._in_flight[mutation.key]
+                # A newer change of the same state supersedes this one
+                if retry and mutation.key not in self._pending:
+                    mutation.due = time.monotonic() + retry_in
+                    self._pending[mutation.key] = mutation
+                self._save_journal()
+            if retry:
+                continue
+            self.logger.info(f"{'Applied' if succeeded else 'Failed to apply'} {mutation}")
+            for listener in list(self._listeners):
+                try:
+                    listener(mutation, succeeded)
+                except Exception as e:
+                    self.logger.error(f"Error in mutation listener: {str(e)}", exc_info=True)
+
+    def _load_journal(self):
+        if not self.journal_path.exists():
+            return
+        try:
+            with open(self.journal_path, "r") as f:
+                entries = json.load(f)
+            for entry in entries:
+                mutation = Mutation.from_dict(entry)
+                self._pending[mutation.key] = mutation
+            if self._pending:
+                self.logger.info(f"Resuming {len(self._pending)} queued mutations from {self.journal_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to load mutation journal: {str(e)}", exc_info=True)
+
+    def _save_journal(self):
+        # Called with the lock held
+        entries = [m.to_dict() for m in (*self._in_flight.values(), *self._pending.values())]
+        try:
+            tmp_path = self.journal_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(entries, f)
+            tmp_path.replace(self.journal_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save mutation journal: {str(e)}", exc_info=True)
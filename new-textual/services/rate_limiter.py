@@ -0,0 +1,133 @@
+import threading
+import time
+from utils.logger import Logger
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+class RateLimiter:
+    """Token bucket that spreads Reddit's request budget over its window.
+
+    The bucket refills at remaining / seconds-until-reset, using the figures
+    prawcore reads from the x-ratelimit-* headers. Callers block in acquire()
+    until a token is available. Interactive requests always go first: background
+    requests wait while any interactive request is queued, slow down once the
+    budget runs low and pause entirely when it drops to the reserve.
+    """
+
+    WINDOW_SECONDS = 600
+    WINDOW_BUDGET = 600
+
+    def __init__(self, burst: int = 10, background_reserve: int = 60):
+        self.logger = Logger()
+        self.burst = burst
+        self.background_reserve = background_reserve
+        self.remaining = self.WINDOW_BUDGET
+        self.used = 0
+        self.reset_at = time.time() + self._seconds_to_window_end()
+        self.tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+        self.waiting = {INTERACTIVE: 0, BACKGROUND: 0}
+        # Whether the current stretch below the reserve was already logged
+        self._reserve_warned = False
+
+    def _seconds_to_window_end(self) -> float:
+        # Reddit's windows are aligned to the wall clock
+        return self.WINDOW_SECONDS - (time.time() % self.WINDOW_SECONDS)
+
+    def _refill_rate(self) -> float:
+        seconds_left = max(self.reset_at - time.time(), 1.0)
+        return max(self.remaining, 0) / seconds_left
+
+    def _refill(self):
+        now = time.monotonic()
+        if time.time() >= self.reset_at:
+            # A new window started; until headers say otherwise assume a full budget
+            self.remaining = self.WINDOW_BUDGET
+            self.used = 0
+            self.reset_at = time.time() + self._seconds_to_window_end()
+        self.tokens = min(float(self.burst), self.tokens + (now - self._last_refill) * self._refill_rate())
+        self._last_refill = now
+
+    def _can_proceed(self, priority: str) -> bool:
+        if self.remaining <= 0 or self.tokens < 1:
+            return False
+        if priority == INTERACTIVE:
+            return True
+        if self.waiting[INTERACTIVE]:
+            return False
+        if self.remaining <= self.background_reserve:
+            return False
+        if self.remaining <= self.background_reserve * 2:
+            # Keep half the bucket for interactive requests while the budget is low
+            return self.tokens >= 1 + self.burst / 2
+        return True
+
+    def _wait_time(self) -> float:
+        if self.remaining <= 0:
+            return max(self.reset_at - time.time(), 0.1)
+        rate = self._refill_rate()
+        return min(max((1 - self.tokens) / rate, 0.05), 1.0) if rate > 0 else 1.0
+
+    def acquire(self, priority: str = INTERACTIVE):
+        """Block until a request of the given priority may be sent."""
+        with self._cond:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._can_proceed(priority):
+                        # Count the request until the response headers report the real figures
+                        self.tokens -= 1
+                        self.remaining -= 1
+                        self.used += 1
+                        return
+                    self._cond.wait(self._wait_time())
+            finally:
+                self.waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def update(self, remaining=None, used=None, seconds_to_reset=None):
+        """Feed in the latest figures reported by Reddit."""
+        with self._cond:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if used is not None:
+                self.used = int(used)
+            if seconds_to_reset is not None:
+                self.reset_at = time.time() + max(float(seconds_to_reset), 0)
+            if self.remaining > self.background_reserve:
+                self._reserve_warned = False
+            elif not self._reserve_warned:
+                # Once per stretch, not on every response while throttled
+                self._reserve_warned = True
+                self.logger.warning(f"Rate limit budget low ({self.remaining} left), pausing background requests")
+            self._cond.notify_all()
+
+    def update_from_prawcore(self, core_limiter):
+        """Copy the state of prawcore's RateLimiter, which is updated from the
+        response headers of every request PRAW makes."""
+        remaining = getattr(core_limiter, "remaining", None)
+        if remaining is None:
+            return False
+        seconds_to_reset = None
+        reset_timestamp = getattr(core_limiter, "reset_timestamp", None)
+        if reset_timestamp is not None:
+            seconds_to_reset = reset_timestamp - time.time()
+        elif time.time() >= self.reset_at:
+            seconds_to_reset = self._seconds_to_window_end()
+        self.update(remaining, getattr(core_limiter, "used", None), seconds_to_reset)
+        return True
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            self._refill()
+            return {
+                "remaining": self.remaining,
+                "used": self.used,
+                "time_until_reset": max(self.reset_at - time.time(), 0),
+                "tokens": self.tokens,
+                "queued_interactive": self.waiting[INTERACTIVE],
+                "queued_background": self.waiting[BACKGROUND],
+            }
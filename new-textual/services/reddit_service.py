@@ -2,16 +2,108 @@ import praw
 import os
 import json
 import time
+import threading
+import inspect
+from functools import wraps, partial
 from pathlib import Path
 from utils.logger import Logger
+from utils.lru_cache import LRUCache
+from services.listing_cache import ListingCache
+from services.mutation_queue import MutationQueue, VOTE, SAVE, HIDE, SUBSCRIBE
+from services.models import (
+    PostRecord, CommentRecord, MoreRecord, ProfileRecord, MessageRecord,
+    comment_records, nest_comments, comments_to_data, comments_from_data,
+)
+from services.resilience import Resilience, RedditUnavailableError, RedditUnreachableError, NETWORK_ERRORS
+from services.rate_limiter import RateLimiter, INTERACTIVE, BACKGROUND
+from services.request_scheduler import RequestScheduler, LANE_INTERACTIVE, LANE_BACKGROUND
+from services.session_pool import SessionPool
+from services.single_flight import SingleFlight
+from services.token_store import TokenStore
 from praw import Reddit
-from praw.models import Submission
+from praw.models import Submission, Comment, MoreComments, Message
+
+def _normalize_arg(value):
+    """Hashable stand-in for a request argument. Reddit objects are identified
+    by their id, read without triggering one of PRAW's lazy fetches."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_arg(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize_arg(item)) for key, item in value.items()))
+    if isinstance(value, PostRecord):
+        return ("Submission", value.id)
+    data = getattr(value, "__dict__", {})
+    if data.get("id"):
+        return (type(value).__name__, data["id"])
+    # Unknown objects never match another call
+    return ("object", id(value))
+
+def scheduled(default_lane=LANE_INTERACTIVE, shared=False):
+    """Route a RedditService method through the request scheduler.
+
+    Callers may pass lane= to run the call in another lane and cancel_token=
+    to drop it if it is no longer needed by the time it would start. Read-only
+    methods marked shared=True are deduplicated: identical calls made while one
+    is in flight share its result. Only calls in the same lane are shared, an
+    interactive call never waits on a prefetch still queued behind it.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, lane=None, cancel_token=None, **kwargs):
+            def run(token):
+                def call():
+                    previous = getattr(self._request_context, "cancel_token", None)
+                    self._request_context.cancel_token = token
+                    try:
+                        return method(self, *args, **kwargs)
+                    finally:
+                        self._request_context.cancel_token = previous
+                return self.scheduler.run(lane or default_lane, call, token=token)
+
+            # Nested calls already hold a pool thread, waiting on another flight could starve the pool
+            if not shared or self.scheduler.current_lane is not None:
+                return run(cancel_token)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple((name, _normalize_arg(value)) for name, value in list(bound.arguments.items())[1:])
+            key = (method.__name__, lane or default_lane, self.current_account, arguments)
+            return self.single_flight.do(key, run, token=cancel_token)
+        return wrapper
+    return decorator
 
 class RedditService:
+    # Listing cache coordinates (feed, subreddit, sort, time filter) of the app feeds
+    FEED_LISTINGS = {
+        "hot": ("front", "all", "hot", ""),
+        "new": ("front", "all", "new", ""),
+        "top": ("front", "all", "top", "all"),
+        "saved": ("saved", "", "", ""),
+    }
+
+    # Comment sorts offered by the UI and the comment_sort Reddit knows them by
+    COMMENT_SORTS = {
+        "best": "confidence",
+        "top": "top",
+        "new": "new",
+        "controversial": "controversial",
+        "old": "old",
+        "qa": "qa",
+    }
+
+    # Seconds between attempts to reach Reddit again after losing the connection
+    OFFLINE_RETRY_INTERVAL = 30
+    # Most posts kept in the feed snapshot shown at the next start
+    FEED_SNAPSHOT_LIMIT = 200
+
     def __init__(self, client_id="", client_secret="", user_agent="RedditTUI/1.0", username=None, password=None):
         self.logger = Logger()
         self.config_dir = Path.home() / ".config" / "reddit-tui"
         self.accounts_file = self.config_dir / "accounts.jhna"
+        self.feed_snapshot_file = self.config_dir / "feed_snapshot.json"
         self.current_account = None
         self.accounts = {}
         self._ensure_config_dir()
@@ -20,8 +112,35 @@ class RedditService:
         self.rate_limit_reset = 0
         self.rate_limit_used = 0
         self.last_request_time = 0
+        self.rate_limiter = RateLimiter()
+        self.resilience = Resilience()
+        self.scheduler = RequestScheduler()
+        self.single_flight = SingleFlight()
+        self._request_context = threading.local()
+        # offline is set by set_offline() or when Reddit cannot be reached;
+        # _offline_requested only by the former, which automatic retries respect
+        self.offline = False
+        self._offline_requested = False
+        self._offline_retry_at = 0.0
+        self._offline_lock = threading.Lock()
+        self._offline_listeners = []
         
         self.accounts = self.load_accounts()
+        self.sessions = SessionPool(
+            self._create_session,
+            lambda: self.offline,
+            TokenStore(self.config_dir / "tokens.json"),
+        )
+        self.listing_cache = ListingCache(self.config_dir / "listing_cache.db")
+        # Comment trees go stale like listing pages, reopening a post later fetches them again
+        self.comment_cache = LRUCache(max_entries=64, ttl=ListingCache.DEFAULT_TTL)
+        self.mutations = MutationQueue(
+            self.config_dir / "pending_mutations.json",
+            self._apply_mutation,
+            # Mutations wait in the queue while offline
+            lambda: None if self.offline else self.current_account,
+        )
+        self.mutations.add_listener(self._on_mutation_finished)
         
         if client_id and client_secret:
             self.reddit = Reddit(
@@ -66,17 +185,13 @@ class RedditService:
     def add_account(self, username: str, client_id: str, client_secret: str, password: str) -> bool:
         self.logger.info(f"Adding account: {username}")
         try:
-            temp_reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                username=username,
-                password=password,
-                user_agent="RedditTUI/1.0"
-            )
-            user = temp_reddit.user.me()
+            reddit = self._new_reddit(username, client_id, client_secret, password)
+            user = reddit.user.me()
             if user.name != username:
                 self.logger.error(f"Username mismatch: expected {username}, got {user.name}")
                 return False
+            # Keep the authenticated session for switching to the account
+            self.sessions.put(username, reddit, user.name)
             
             self.accounts[username] = {
                 "client_id": client_id,
@@ -97,6 +212,7 @@ class RedditService:
         if username in self.accounts:
             del self.accounts[username]
             self.save_accounts()
+            self.sessions.discard(username)
             if self.current_account == username:
                 self.current_account = None
                 self.reddit = None
@@ -114,20 +230,31 @@ class RedditService:
             self.logger.error(f"Account {username} not found")
             return False
         
-        account_data = self.accounts[username]
         try:
-            self.reddit = praw.Reddit(
-                client_id=account_data["client_id"],
-                client_secret=account_data["client_secret"],
-                username=username,
-                password=account_data["password"],
-                user_agent="RedditTUI/1.0"
-            )
-            user = self.reddit.user.me()
-            self.user = user.name
+            session = self.sessions.get(username)
+            self.reddit = session.reddit
+            if self.offline:
+                # The account was verified when it was added
+                self.logger.info(f"Offline, using account {username} without verifying it")
+                self.user = username
+            elif session.user is None and session.has_token:
+                # A token saved by an earlier run is still valid, so requests can
+                # start right away; confirm the account in the background
+                self.logger.info(f"Using saved token of {username}, verifying it in the background")
+                self.user = username
+                self.sessions.warm([username])
+            else:
+                try:
+                    # Instant when the session was warmed up
+                    self.user = self.sessions.authenticate(username)
+                except NETWORK_ERRORS as e:
+                    self.logger.warning(f"Reddit unreachable while switching to {username}: {str(e)}")
+                    self._set_offline(True)
+                    self.user = username
             self.current_account = username
             self.accounts[username]["last_used"] = time.time()
             self.save_accounts()
+            self.mutations.wake()
             self.logger.info(f"Switched to account: {username}")
             return True
         except Exception as e:
@@ -137,22 +264,76 @@ class RedditService:
     def get_current_account(self) -> str:
         return self.current_account
 
+    def warm_sessions(self):
+        """Authenticate the sessions of the other accounts in the background,
+        so switching to them is instant."""
+        if self.offline:
+            return
+        self.sessions.warm([username for username in self.accounts if username != self.current_account])
+
+    def _create_session(self, username):
+        account_data = self.accounts[username]
+        return self._new_reddit(
+            username, account_data["client_id"], account_data["client_secret"], account_data["password"]
+        )
+
+    def _new_reddit(self, username, client_id, client_secret, password):
+        # No request is made until the session is first used
+        return praw.Reddit(
+            client_id=client_id,
+            client_secret=client_secret,
+            username=username,
+            password=password,
+            user_agent="RedditTUI/1.0"
+        )
+
+    def set_offline(self, offline: bool):
+        """Turn offline mode on or off. While offline no requests are sent:
+        reads are served from the local store and mutations stay queued."""
+        self._offline_requested = offline
+        self._set_offline(offline)
+
+    def add_offline_listener(self, listener):
+        """listener(offline) is called, from any thread, when offline mode changes."""
+        self._offline_listeners.append(listener)
+
+    def _set_offline(self, offline: bool):
+        with self._offline_lock:
+            if offline == self.offline:
+                return
+            self.offline = offline
+            self._offline_retry_at = time.monotonic() + self.OFFLINE_RETRY_INTERVAL
+        if offline:
+            self.logger.warning("Offline, serving saved content")
+        else:
+            self.logger.info("Back online")
+            self.mutations.wake()
+        for listener in list(self._offline_listeners):
+            try:
+                listener(offline)
+            except Exception as e:
+                self.logger.error(f"Error in offline listener: {str(e)}", exc_info=True)
+
+    def _probe_due(self) -> bool:
+        """Whether to let one request through to see if Reddit can be reached
+        again, after going offline on its own."""
+        with self._offline_lock:
+            if self._offline_requested or time.monotonic() < self._offline_retry_at:
+                return False
+            self._offline_retry_at = time.monotonic() + self.OFFLINE_RETRY_INTERVAL
+            return True
+
     def login(self, client_id: str, client_secret: str, username: str, password: str) -> bool:
         self.logger.info("RedditService.login called")
         try:
             self.logger.info("Initializing Reddit instance")
-            self.reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                username=username,
-                password=password,
-                user_agent="RedditTUI/1.0"
-            )
+            self.reddit = self._new_reddit(username, client_id, client_secret, password)
             self.logger.info("Attempting to authenticate with Reddit API...")
             try:
                 user = self.reddit.user.me()
                 self.user = user.name
                 self.current_account = user.name
+                self.sessions.put(user.name, self.reddit, user.name)
                 self.logger.info(f"Reddit authentication successful. Logged in as: {user.name}")
                 self.logger.info("Saving credentials...")
                 self._save_credentials(client_id, client_secret, username, password)
@@ -183,37 +364,92 @@ class RedditService:
             return self.accounts[most_recent]
         return {}
 
-    def auto_login(self) -> bool:
+    def most_recent_account(self):
+        """The account auto_login picks, or None without accounts."""
+        if not self.accounts:
+            return None
+        return max(self.accounts.keys(), key=lambda k: self.accounts[k].get("last_used", 0))
+
+    def save_feed_snapshot(self, feed: str, posts, selected_index: int = 0):
+        """Remember the feed on screen, so the next start can show it before
+        logging in or fetching anything."""
+        posts = list(posts)[:self.FEED_SNAPSHOT_LIMIT]
+        snapshot = {
+            "account": self.current_account,
+            "feed": feed,
+            "posts": [post.to_dict() for post in posts],
+            "selected_index": min(selected_index, max(len(posts) - 1, 0)),
+            "saved_at": time.time(),
+        }
+        try:
+            tmp_path = self.feed_snapshot_file.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f)
+            tmp_path.replace(self.feed_snapshot_file)
+            self.logger.info(f"Saved snapshot of {len(posts)} {feed} posts")
+        except Exception as e:
+            self.logger.error(f"Failed to save feed snapshot: {str(e)}", exc_info=True)
+
+    def load_feed_snapshot(self, account):
+        """The snapshot save_feed_snapshot left for account, with its posts as
+        PostRecords, or None."""
+        if not self.feed_snapshot_file.exists():
+            return None
+        try:
+            with open(self.feed_snapshot_file, "r") as f:
+                snapshot = json.load(f)
+            if snapshot.get("account") != account or not snapshot.get("posts"):
+                return None
+            snapshot["posts"] = [PostRecord.from_dict(record) for record in snapshot["posts"]]
+            return snapshot
+        except Exception as e:
+            self.logger.error(f"Failed to load feed snapshot: {str(e)}", exc_info=True)
+            return None
+
+    def auto_login(self, username: str = None) -> bool:
+        """Log in as username, or the most recently used account without one."""
         self.logger.info("RedditService.auto_login called")
         if not self.accounts:
             self.logger.info("No accounts found for auto-login.")
             return False
         
-        most_recent = max(self.accounts.keys(), key=lambda k: self.accounts[k].get("last_used", 0))
-        self.logger.info(f"Attempting auto-login with most recent account: {most_recent}")
-        return self.switch_account(most_recent)
+        if username is None:
+            username = self.most_recent_account()
+            self.logger.info(f"Attempting auto-login with most recent account: {username}")
+        else:
+            self.logger.info(f"Attempting auto-login with account: {username}")
+        if not self.switch_account(username):
+            return False
+        self.warm_sessions()
+        return True
 
-    def get_hot_posts(self, limit: int = 25):
+    @scheduled(shared=True)
+    def get_hot_posts(self, limit: int = 25, after: str = None):
         if not self.reddit:
             self.logger.error("Cannot get hot posts: Reddit instance not initialized")
             return []
         try:
-            self.logger.info(f"Fetching {limit} hot posts from Reddit front page")
+            self.logger.info(f"Fetching {limit} hot posts from Reddit front page (after={after})")
             self.logger.info(f"Reddit instance: {self.reddit}")
             self.logger.info(f"Current user: {self.user}")
-            self._check_rate_limit()
-            response = self.reddit.subreddit("all").hot(limit=limit)
-            self.logger.info(f"Reddit API response type: {type(response)}")
-            self.logger.info("Reddit API call completed, converting to list")
-            posts = list(response)
+            key = self._listing_key(*self.FEED_LISTINGS["hot"], after=after)
+            cached = self._get_cached_posts(key, limit)
+            if cached is not None:
+                self.logger.info(f"Serving {len(cached)} hot posts from cache")
+                return cached
+            posts, ended = self._fetch_listing(
+                lambda: self.reddit.subreddit("all").hot(limit=limit, params=self._listing_params(after)), limit
+            )
+            self.logger.info("Reddit API call completed")
             self.logger.info(f"Retrieved {len(posts)} hot posts")
+            self._cache_posts(key, posts, ended)
             if len(posts) == 0:
                 self.logger.warning("No posts retrieved - this might indicate an API issue")
-            self._update_rate_limit(response)
+            self._update_rate_limit()
             return posts
         except ConnectionError as e:
             self.logger.error(f"Network connection error getting hot posts: {str(e)}", exc_info=True)
-            raise
+            return self._stale_posts(key, limit, e)
         except TimeoutError as e:
             self.logger.error(f"Request timeout getting hot posts: {str(e)}", exc_info=True)
             raise
@@ -221,22 +457,29 @@ class RedditService:
             self.logger.error(f"Error getting hot posts: {str(e)}", exc_info=True)
             return []
 
-    def get_new_posts(self, limit: int = 25):
+    @scheduled(shared=True)
+    def get_new_posts(self, limit: int = 25, after: str = None):
         if not self.reddit:
             self.logger.error("Cannot get new posts: Reddit instance not initialized")
             return []
         try:
-            self.logger.info(f"Fetching {limit} new posts from Reddit front page")
-            self._check_rate_limit()
-            response = self.reddit.subreddit("all").new(limit=limit)
-            self.logger.info("Reddit API call completed, converting to list")
-            posts = list(response)
+            self.logger.info(f"Fetching {limit} new posts from Reddit front page (after={after})")
+            key = self._listing_key(*self.FEED_LISTINGS["new"], after=after)
+            cached = self._get_cached_posts(key, limit)
+            if cached is not None:
+                self.logger.info(f"Serving {len(cached)} new posts from cache")
+                return cached
+            posts, ended = self._fetch_listing(
+                lambda: self.reddit.subreddit("all").new(limit=limit, params=self._listing_params(after)), limit
+            )
+            self.logger.info("Reddit API call completed")
             self.logger.info(f"Retrieved {len(posts)} new posts")
-            self._update_rate_limit(response)
+            self._cache_posts(key, posts, ended)
+            self._update_rate_limit()
             return posts
         except ConnectionError as e:
             self.logger.error(f"Network connection error getting new posts: {str(e)}", exc_info=True)
-            raise
+            return self._stale_posts(key, limit, e)
         except TimeoutError as e:
             self.logger.error(f"Request timeout getting new posts: {str(e)}", exc_info=True)
             raise
@@ -244,22 +487,29 @@ class RedditService:
             self.logger.error(f"Error getting new posts: {str(e)}", exc_info=True)
             return []
 
-    def get_top_posts(self, limit: int = 25):
+    @scheduled(shared=True)
+    def get_top_posts(self, limit: int = 25, after: str = None):
         if not self.reddit:
             self.logger.error("Cannot get top posts: Reddit instance not initialized")
             return []
         try:
-            self.logger.info(f"Fetching {limit} top posts from Reddit front page")
-            self._check_rate_limit()
-            response = self.reddit.subreddit("all").top(limit=limit)
-            self.logger.info("Reddit API call completed, converting to list")
-            posts = list(response)
+            self.logger.info(f"Fetching {limit} top posts from Reddit front page (after={after})")
+            key = self._listing_key(*self.FEED_LISTINGS["top"], after=after)
+            cached = self._get_cached_posts(key, limit)
+            if cached is not None:
+                self.logger.info(f"Serving {len(cached)} top posts from cache")
+                return cached
+            posts, ended = self._fetch_listing(
+                lambda: self.reddit.subreddit("all").top(limit=limit, params=self._listing_params(after)), limit
+            )
+            self.logger.info("Reddit API call completed")
             self.logger.info(f"Retrieved {len(posts)} top posts")
-            self._update_rate_limit(response)
+            self._cache_posts(key, posts, ended)
+            self._update_rate_limit()
             return posts
         except ConnectionError as e:
             self.logger.error(f"Network connection error getting top posts: {str(e)}", exc_info=True)
-            raise
+            return self._stale_posts(key, limit, e)
         except TimeoutError as e:
             self.logger.error(f"Request timeout getting top posts: {str(e)}", exc_info=True)
             raise
@@ -267,120 +517,402 @@ class RedditService:
             self.logger.error(f"Error getting top posts: {str(e)}", exc_info=True)
             return []
 
-    def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25):
+    @scheduled(shared=True)
+    def get_subreddit_posts(self, subreddit: str, sort: str = "hot", limit: int = 25, after: str = None):
         if not self.reddit:
             return []
         try:
-            self._check_rate_limit()
+            key = self._listing_key("subreddit", subreddit.lower(), sort, "", after)
+            cached = self._get_cached_posts(key, limit)
+            if cached is not None:
+                return cached
             sub = self.reddit.subreddit(subreddit)
-            if sort == "hot":
-                response = sub.hot(limit=limit)
-            elif sort == "new":
-                response = sub.new(limit=limit)
+            params = self._listing_params(after)
+            if sort == "new":
+                listing = partial(sub.new, limit=limit, params=params)
             elif sort == "top":
-                response = sub.top(limit=limit)
+                listing = partial(sub.top, limit=limit, params=params)
             else:
-                response = sub.hot(limit=limit)
-            posts = list(response)
-            self._update_rate_limit(response)
+                listing = partial(sub.hot, limit=limit, params=params)
+            posts, ended = self._fetch_listing(listing, limit)
+            self._update_rate_limit()
+            self._cache_posts(key, posts, ended)
             return posts
+        except ConnectionError as e:
+            self.logger.error(f"Network connection error getting subreddit posts: {str(e)}", exc_info=True)
+            return self._stale_posts(key, limit, e)
         except Exception as e:
             self.logger.error(f"Error getting subreddit posts: {str(e)}", exc_info=True)
             return []
 
+    def _fetch(self, endpoint, fn, idempotent=True):
+        """Run the request fn, waiting for the rate limiter before every attempt,
+        with retries and the endpoint's circuit breaker. Failing to reach Reddit
+        at all switches to offline mode, which the next request after
+        OFFLINE_RETRY_INTERVAL tries to leave again."""
+        probe = self.offline and self._probe_due()
+        if self.offline and not probe:
+            raise RedditUnreachableError("Offline, only saved content is available")
+
+        def attempt():
+            self._check_rate_limit()
+            return fn()
+
+        self._request_context.probing = probe
+        try:
+            result = self.resilience.call(endpoint, attempt, idempotent=idempotent)
+        except RedditUnavailableError as e:
+            if isinstance(e.__cause__, NETWORK_ERRORS):
+                self._set_offline(True)
+            raise
+        finally:
+            self._request_context.probing = False
+        if self.offline and not self._offline_requested:
+            self._set_offline(False)
+        return result
+
+    def _document_key(self, kind, name):
+        return ListingCache.make_document_key(self.current_account, kind, name)
+
+    def _store(self, kind, name, data):
+        """Keep what Reddit returned in the local store for offline use."""
+        self.listing_cache.put_document(self._document_key(kind, name), data)
+
+    def _stored(self, kind, name, error):
+        """What an earlier fetch kept in the local store, to show while Reddit
+        cannot be reached. Re-raises error when there is nothing."""
+        entry = self.listing_cache.get_document(self._document_key(kind, name))
+        if entry is None:
+            raise error
+        data, fetched_at = entry
+        self.logger.warning(f"Reddit unavailable, serving saved {kind} from {time.time() - fetched_at:.0f}s ago")
+        return data
+
+    def _stale_posts(self, key, limit, error):
+        """Cached posts, however old, to show while Reddit cannot be reached.
+        Re-raises error when there are none."""
+        entry = self.listing_cache.get(key, allow_stale=True)
+        if entry is None:
+            raise error
+        records, fetched_at, is_fresh, ended = entry
+        if not records and not ended:
+            raise error
+        self.logger.warning(f"Reddit unavailable, serving cached posts from {time.time() - fetched_at:.0f}s ago")
+        return self._from_cached_records(records[:limit])
+
+    def _listing_key(self, feed, subreddit="", sort="", time_filter="", after=None):
+        return ListingCache.make_key(self.current_account, feed, subreddit, sort, time_filter, after)
+
+    def _fetch_listing(self, listing, limit):
+        """Fetch a page of the PRAW listing listing() returns. Returns (posts,
+        ended), ended telling whether Reddit has nothing after the page."""
+        items = self._fetch("listing", lambda: list(listing()))
+        # The listing keeps requesting until it has limit items or runs out
+        return self._to_records(items), len(items) < limit
+
+    def _to_records(self, items):
+        """Convert a PRAW listing into PostRecords, skipping non-submissions."""
+        return [PostRecord.from_submission(item) for item in items if isinstance(item, Submission)]
+
+    def _message(self, message):
+        """PRAW Message to act on, built from the record without a request."""
+        if isinstance(message, Message):
+            return message
+        return Message(self.reddit, _data={"id": message.id, "name": message.name})
+
+    def _submission(self, post):
+        """PRAW Submission to run mutations against. Built lazily from the id, so
+        no request is made until the mutation itself."""
+        if isinstance(post, Submission):
+            return post
+        return self.reddit.submission(id=post.id)
+
+    def _comment(self, comment):
+        """PRAW Comment to run mutations against, like _submission."""
+        if isinstance(comment, Comment):
+            return comment
+        return self.reddit.comment(id=comment.id)
+
+    def _get_cached_posts(self, key, limit, allow_stale=False):
+        entry = self.listing_cache.get(key, allow_stale=allow_stale)
+        if entry is None:
+            return None
+        records, fetched_at, is_fresh, ended = entry
+        # A short page is only complete if it is the end of the listing
+        if len(records) < limit and not ended:
+            return None
+        return self._from_cached_records(records[:limit])
+
+    def _from_cached_records(self, records):
+        # Posts hidden since the page was fetched stay in it, marked hidden
+        return [PostRecord.from_dict(record) for record in records if not record.get("hidden")]
+
+    def _cache_posts(self, key, posts, ended=False):
+        self.listing_cache.put(key, [post.to_dict() for post in posts], ended=ended)
+
+    def peek_feed_posts(self, feed: str, limit: int = 25):
+        """Return (posts, is_fresh) for the first page of a feed from the cache
+        without touching the network, or (None, False) if nothing is cached."""
+        key = self._listing_key(*self.FEED_LISTINGS[feed])
+        entry = self.listing_cache.get(key, allow_stale=True)
+        if entry is None:
+            return None, False
+        records, fetched_at, is_fresh, ended = entry
+        self.logger.info(f"Found cached {feed} feed from {time.time() - fetched_at:.0f}s ago (fresh={is_fresh})")
+        return self._from_cached_records(records[:limit]), is_fresh and (len(records) >= limit or ended)
+
+    # Most fullnames /api/info accepts in one request
+    INFO_BATCH_SIZE = 100
+
+    @scheduled(default_lane=LANE_BACKGROUND, shared=True)
+    def refresh_posts(self, fullnames):
+        """Fetch the current state of the given posts through /api/info, one
+        request per 100 fullnames. Returns {id: PostRecord} for the posts Reddit
+        still returned."""
+        if not self.reddit:
+            return {}
+        fullnames = list(dict.fromkeys(fullnames))
+        refreshed = {}
+        try:
+            for start in range(0, len(fullnames), self.INFO_BATCH_SIZE):
+                batch = fullnames[start:start + self.INFO_BATCH_SIZE]
+                for post in self._fetch("info", lambda: self._to_records(self.reddit.info(fullnames=batch))):
+                    refreshed[post.id] = post
+                self._update_rate_limit()
+            self.logger.info(f"Refreshed {len(refreshed)} of {len(fullnames)} posts")
+            return {post_id: self._with_pending_mutations(post) for post_id, post in refreshed.items()}
+        except Exception as e:
+            self.logger.error(f"Error refreshing posts: {str(e)}", exc_info=True)
+            return refreshed
+
+    VOTE_DIRECTIONS = {1: "upvote", -1: "downvote", 0: "clear"}
+
+    def queue_mutation(self, kind: str, target: str, value, original=None, label: str = ""):
+        """Queue a vote, save, hide or subscription to be sent in the background.
+        target is a post id, or a subreddit name for subscriptions."""
+        self.mutations.enqueue(self.current_account, kind, target, value, original, label)
+        self._patch_cached_listings(self.current_account, kind, target, value)
+
+    def _patch_cached_listings(self, account, kind, post_id, value):
+        """Show a hide or save in the cached pages right away, so reloading a
+        feed before they expire does not bring back the old state."""
+        if kind == HIDE:
+            self.listing_cache.update_post(account, post_id, {"hidden": bool(value)})
+        elif kind == SAVE:
+            self.listing_cache.update_post(account, post_id, {"saved": bool(value)})
+            # Where the post goes in the saved listing is up to Reddit
+            self.listing_cache.invalidate(account, self.FEED_LISTINGS["saved"][0])
+
+    def _on_mutation_finished(self, mutation, succeeded):
+        # Called from the mutation queue's thread
+        if mutation.kind == SAVE and succeeded:
+            # Pages fetched while the save was queued do not have it yet
+            self.listing_cache.invalidate(mutation.account, self.FEED_LISTINGS["saved"][0])
+        elif not succeeded and self.mutations.pending_value(mutation.account, mutation.kind, mutation.target) is None:
+            self._patch_cached_listings(mutation.account, mutation.kind, mutation.target, mutation.original)
+
+    def add_mutation_listener(self, listener):
+        self.mutations.add_listener(listener)
+
+    def _apply_mutation(self, mutation):
+        if self.offline:
+            # Went offline after the queue picked it up; MutationQueue retries it later
+            raise RedditUnreachableError("Offline")
+        post = PostRecord(id=mutation.target, title=mutation.label)
+        if mutation.kind == VOTE:
+            return self.vote_post(post, self.VOTE_DIRECTIONS[mutation.value])
+        if mutation.kind == SAVE:
+            return self.save_post(post) if mutation.value else self.unsave_post(post)
+        if mutation.kind == HIDE:
+            return self.hide_post(post) if mutation.value else self.unhide_post(post)
+        if mutation.kind == SUBSCRIBE:
+            if mutation.value:
+                return self.subscribe_subreddit(mutation.target)
+            return self.unsubscribe_subreddit(mutation.target)
+        self.logger.error(f"Unknown mutation kind: {mutation.kind}")
+        return False
+
+    def _with_pending_mutations(self, post):
+        """Overlay the votes and saves still waiting to be sent, so refreshed
+        data does not undo what the UI already shows."""
+        vote = self.mutations.pending_value(self.current_account, VOTE, post.id)
+        saved = self.mutations.pending_value(self.current_account, SAVE, post.id)
+        if vote is None and saved is None:
+            return post
+        changes = {}
+        if vote is not None:
+            changes["likes"] = {1: True, -1: False, 0: None}[vote]
+        if saved is not None:
+            changes["saved"] = saved
+        return post.replace(**changes)
+
+    def _listing_params(self, after):
+        """Listing query params that continue a listing after the given fullname.
+        Always a dict, top() adds its time filter to it."""
+        return {"after": after} if after else {}
+
+    @scheduled(shared=True)
     def search_posts(self, query: str, sort: str = "relevance", time_filter: str = "all", limit: int = 25):
         if not self.reddit:
             return []
         try:
-            self._check_rate_limit()
             self.logger.info(f"Searching posts with query: {query}, sort: {sort}, time: {time_filter}")
-            response = self.reddit.subreddit("all").search(
+            posts = self._fetch("search", lambda: self._to_records(self.reddit.subreddit("all").search(
                 query,
                 sort=sort,
                 time_filter=time_filter,
                 limit=limit
-            )
-            posts = list(response)
-            self._update_rate_limit(response)
+            )))
+            self._update_rate_limit()
             return posts
         except Exception as e:
             self.logger.error(f"Error searching posts: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_post_comments(self, post, sort="best", limit=100):
         try:
             if not self.reddit:
                 self.logger.error("Reddit instance not initialized")
                 return []
 
-            self._check_rate_limit()
-            self.logger.info(f"Getting comments for post: {post.id}")
-            post.comments.replace_more(limit=0)
-            comments = list(post.comments)
-            self._update_rate_limit(post.comments)
-            
-            if sort == "best":
-                comments.sort(key=lambda x: x.score, reverse=True)
-            elif sort == "top":
-                comments.sort(key=lambda x: x.score, reverse=True)
-            elif sort == "new":
-                comments.sort(key=lambda x: x.created_utc, reverse=True)
-            elif sort == "controversial":
-                comments.sort(key=lambda x: abs(x.score), reverse=True)
-            elif sort == "old":
-                comments.sort(key=lambda x: x.created_utc)
-            elif sort == "qa":
-                comments.sort(key=lambda x: x.score, reverse=True)
-            
-            self.logger.info(f"Retrieved {len(comments)} comments")
-            return comments[:limit]
+            key = self._comment_cache_key(post, sort)
+            cached = self.comment_cache.get(key)
+            if cached is not None:
+                self.logger.info(f"Serving comments for post {post.id} sorted by {sort} from cache")
+                return list(cached)
+
+            self.logger.info(f"Getting comments for post: {post.id} (sort={sort})")
+
+            def fetch():
+                submission = self._submission(post)
+                # Reddit sorts the tree, including the batches behind MoreComments
+                submission.comment_sort = self.COMMENT_SORTS.get(sort, sort)
+                # Keep the MoreComments stubs, the UI expands them on demand
+                return comment_records(submission.comments)
+
+            try:
+                nodes = self._fetch("comments", fetch)
+            except ConnectionError as e:
+                self.logger.error(f"Network connection error getting comments: {str(e)}")
+                # Not put in the comment cache, so the next visit online fetches them
+                return list(comments_from_data(self._stored("comments", f"{post.id}/{sort}", e)))
+            self._update_rate_limit()
+            comments = [node for node in nodes if isinstance(node, CommentRecord)]
+            more = [node for node in nodes if isinstance(node, MoreRecord)]
+
+            self.logger.info(f"Retrieved {len(comments)} comments, {sum(m.count for m in more)} more to load")
+            comments = comments[:limit] + more
+            self.comment_cache.put(key, tuple(comments))
+            self._store("comments", f"{post.id}/{sort}", comments_to_data(comments))
+            return comments
         except Exception as e:
             self.logger.error(f"Error getting comments: {str(e)}", exc_info=True)
             return []
 
+    def cache_comments(self, post, sort, comments):
+        """Store a comment tree the UI has expanded, so returning to the post or
+        sort later shows the loaded batches too."""
+        self.comment_cache.put(self._comment_cache_key(post, sort), tuple(comments))
+        self._store("comments", f"{post.id}/{sort}", comments_to_data(comments))
+
+    def _comment_cache_key(self, post, sort):
+        return (self.current_account, post.id, sort)
+
+    @scheduled()
+    def load_more_comments(self, post, more, sort="best"):
+        """Fetch the comments behind a MoreRecord of the given post. Returns
+        the records that take its place in the tree, or None on failure."""
+        if not self.reddit:
+            self.logger.error("Cannot load more comments: Reddit instance not initialized")
+            return None
+        try:
+            self.logger.info(f"Loading {more.count} more comments under {more.parent_id}")
+
+            def fetch():
+                stub = MoreComments(self.reddit, _data={
+                    "id": more.id,
+                    "name": more.name,
+                    "parent_id": more.parent_id,
+                    "count": more.count,
+                    "children": list(more.children),
+                })
+                stub.submission = self._submission(post)
+                stub.submission.comment_sort = self.COMMENT_SORTS.get(sort, sort)
+                return comment_records(stub.comments(update=False))
+
+            # /api/morechildren is a POST, but only reads
+            loaded = self._fetch("comments", fetch)
+            self._update_rate_limit()
+            if more.is_continue_thread:
+                # Continued threads come back as the replies of the parent comment
+                return loaded
+            # /api/morechildren returns the comments flat, each with its parent_id
+            return nest_comments(loaded, more.parent_id)
+        except Exception as e:
+            self.logger.error(f"Error loading more comments: {str(e)}", exc_info=True)
+            return None
+
+    @scheduled(shared=True)
     def get_user_profile(self, username: str):
         if not self.reddit:
             self.logger.error("Cannot get user profile: Reddit instance not initialized")
             return None
         try:
-            self._check_rate_limit()
-            response = self.reddit.redditor(username)
-            self._update_rate_limit(response)
-            return response
+            try:
+                profile = self._fetch("user", lambda: ProfileRecord.from_redditor(self.reddit.redditor(username)))
+            except ConnectionError as e:
+                self.logger.error(f"Network connection error getting user profile: {str(e)}")
+                return ProfileRecord(**self._stored("profile", username.lower(), e))
+            self._update_rate_limit()
+            self._store("profile", username.lower(), profile.to_dict())
+            return profile
         except Exception as e:
             self.logger.error(f"Error getting user profile: {str(e)}", exc_info=True)
             return None
 
+    @scheduled(shared=True)
     def get_user_posts(self, username: str, limit: int = 25):
         if not self.reddit:
             self.logger.error("Cannot get user posts: Reddit instance not initialized")
             return []
         try:
-            self._check_rate_limit()
-            user = self.reddit.redditor(username)
-            response = user.submissions.new(limit=limit)
-            posts = list(response)
-            self._update_rate_limit(response)
+            try:
+                posts = self._fetch("user", lambda: self._to_records(
+                    self.reddit.redditor(username).submissions.new(limit=limit)
+                ))
+            except ConnectionError as e:
+                self.logger.error(f"Network connection error getting user posts: {str(e)}")
+                records = self._stored("user_posts", username.lower(), e)
+                return [PostRecord.from_dict(record) for record in records[:limit]]
+            self._update_rate_limit()
+            self._store("user_posts", username.lower(), [post.to_dict() for post in posts])
             return posts
         except Exception as e:
             self.logger.error(f"Error getting user posts: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_user_comments(self, username: str, limit: int = 25):
         if not self.reddit:
             self.logger.error("Cannot get user comments: Reddit instance not initialized")
             return []
         try:
-            self._check_rate_limit()
-            user = self.reddit.redditor(username)
-            response = user.comments.new(limit=limit)
-            comments = list(response)
-            self._update_rate_limit(response)
+            try:
+                comments = self._fetch("user", lambda: list(comment_records(
+                    self.reddit.redditor(username).comments.new(limit=limit)
+                )))
+            except ConnectionError as e:
+                self.logger.error(f"Network connection error getting user comments: {str(e)}")
+                return list(comments_from_data(self._stored("user_comments", username.lower(), e)))[:limit]
+            self._update_rate_limit()
+            self._store("user_comments", username.lower(), comments_to_data(comments))
             return comments
         except Exception as e:
             self.logger.error(f"Error getting user comments: {str(e)}", exc_info=True)
             return []
 
+    @scheduled()
     def submit_comment(self, post, body: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot submit comment: Reddit instance not initialized")
@@ -388,7 +920,7 @@ class RedditService:
         try:
             self._check_rate_limit()
             self.logger.info(f"Submitting comment to post: {post.title}")
-            response = post.reply(body)
+            response = self._submission(post).reply(body)
             self._update_rate_limit(response)
             self.logger.info(f"Comment submitted successfully: {response.id}")
             return True
@@ -396,154 +928,230 @@ class RedditService:
             self.logger.error(f"Error submitting comment: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def save_post(self, post) -> bool:
         if not self.reddit:
             self.logger.error("Cannot save post: Reddit instance not initialized")
             return False
         try:
-            self._check_rate_limit()
             self.logger.info(f"Saving post: {post.title}")
-            response = post.save()
-            self._update_rate_limit(response)
+            self._fetch("mutation", self._submission(post).save)
+            self._update_rate_limit()
             self.logger.info("Post saved successfully")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error saving post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def unsave_post(self, post) -> bool:
         if not self.reddit:
             self.logger.error("Cannot unsave post: Reddit instance not initialized")
             return False
         try:
-            self._check_rate_limit()
             self.logger.info(f"Unsaving post: {post.title}")
-            response = post.unsave()
-            self._update_rate_limit(response)
+            self._fetch("mutation", self._submission(post).unsave)
+            self._update_rate_limit()
             self.logger.info("Post unsaved successfully")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error unsaving post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def hide_post(self, post) -> bool:
         if not self.reddit:
             self.logger.error("Cannot hide post: Reddit instance not initialized")
             return False
         try:
-            self._check_rate_limit()
             self.logger.info(f"Hiding post: {post.title}")
-            response = post.hide()
-            self._update_rate_limit(response)
+            self._fetch("mutation", self._submission(post).hide)
+            self._update_rate_limit()
             self.logger.info("Post hidden successfully")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error hiding post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def unhide_post(self, post) -> bool:
         if not self.reddit:
             self.logger.error("Cannot unhide post: Reddit instance not initialized")
             return False
         try:
-            self._check_rate_limit()
             self.logger.info(f"Unhiding post: {post.title}")
-            response = post.unhide()
-            self._update_rate_limit(response)
+            self._fetch("mutation", self._submission(post).unhide)
+            self._update_rate_limit()
             self.logger.info("Post unhidden successfully")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error unhiding post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
+    def vote_post(self, post, direction: str) -> bool:
+        """Vote on a post ("upvote", "downvote" or "clear")."""
+        if not self.reddit:
+            self.logger.error("Cannot vote on post: Reddit instance not initialized")
+            return False
+        try:
+            submission = self._submission(post)
+            if direction == "upvote":
+                vote = submission.upvote
+            elif direction == "downvote":
+                vote = submission.downvote
+            elif direction == "clear":
+                vote = submission.clear_vote
+            else:
+                return False
+            self._fetch("mutation", vote)
+            self._update_rate_limit()
+            self.logger.info(f"Voted on post {post.id}: {direction}")
+            return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
+        except Exception as e:
+            self.logger.error(f"Error voting on post: {str(e)}", exc_info=True)
+            return False
+
+    @scheduled()
+    def report_post(self, post, reason: str) -> bool:
+        if not self.reddit:
+            self.logger.error("Cannot report post: Reddit instance not initialized")
+            return False
+        try:
+            self._check_rate_limit()
+            self._submission(post).report(reason)
+            self.logger.info(f"Reported post {post.id} for {reason}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error reporting post: {str(e)}", exc_info=True)
+            return False
+
+    @scheduled()
     def subscribe_subreddit(self, subreddit_name: str) -> bool:
         """Subscribe to a subreddit."""
         try:
             if not self.reddit or not self.user:
                 return False
             
-            subreddit = self.reddit.subreddit(subreddit_name)
-            subreddit.subscribe()
+            self._fetch("mutation", self.reddit.subreddit(subreddit_name).subscribe)
+            self._update_rate_limit()
             self.logger.info(f"Subscribed to r/{subreddit_name}")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error subscribing to r/{subreddit_name}: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def unsubscribe_subreddit(self, subreddit_name: str) -> bool:
         """Unsubscribe from a subreddit."""
         try:
             if not self.reddit or not self.user:
                 return False
             
-            subreddit = self.reddit.subreddit(subreddit_name)
-            subreddit.unsubscribe()
+            self._fetch("mutation", self.reddit.subreddit(subreddit_name).unsubscribe)
+            self._update_rate_limit()
             self.logger.info(f"Unsubscribed from r/{subreddit_name}")
             return True
+        except NETWORK_ERRORS:
+            # Left to MutationQueue, which keeps the change queued and retries it
+            raise
         except Exception as e:
             self.logger.error(f"Error unsubscribing from r/{subreddit_name}: {str(e)}", exc_info=True)
             return False
 
+    @scheduled(shared=True)
     def get_subreddit_info(self, subreddit_name: str):
         """Get information about a subreddit."""
         try:
             if not self.reddit:
                 return None
             
-            subreddit = self.reddit.subreddit(subreddit_name)
-            return {
-                'display_name': subreddit.display_name,
-                'title': subreddit.title,
-                'description': subreddit.description,
-                'subscribers': subreddit.subscribers,
-                'active_user_count': subreddit.active_user_count,
-                'created_utc': subreddit.created_utc,
-                'over18': subreddit.over18,
-                'public_description': subreddit.public_description,
-                'url': subreddit.url
-            }
+            def fetch():
+                # Reading the first attribute fetches the subreddit
+                subreddit = self.reddit.subreddit(subreddit_name)
+                return {
+                    'display_name': subreddit.display_name,
+                    'title': subreddit.title,
+                    'description': subreddit.description,
+                    'subscribers': subreddit.subscribers,
+                    'active_user_count': subreddit.active_user_count,
+                    'created_utc': subreddit.created_utc,
+                    'over18': subreddit.over18,
+                    'public_description': subreddit.public_description,
+                    'url': subreddit.url
+                }
+
+            info = self._fetch("subreddit", fetch)
+            self._update_rate_limit()
+            return info
         except Exception as e:
             self.logger.error(f"Error getting subreddit info for r/{subreddit_name}: {str(e)}", exc_info=True)
             return None
 
+    @scheduled(shared=True)
     def search_subreddits(self, query: str, limit: int = 10):
         """Search for subreddits."""
         try:
             if not self.reddit:
                 return []
             
-            subreddits = self.reddit.subreddits.search(query, limit=limit)
-            return list(subreddits)
+            subreddits = self._fetch("search", lambda: list(self.reddit.subreddits.search(query, limit=limit)))
+            self._update_rate_limit()
+            return subreddits
         except Exception as e:
             self.logger.error(f"Error searching subreddits: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def search_users(self, query: str, limit: int = 10):
         """Search for users."""
         try:
             if not self.reddit:
                 return []
             
-            users = self.reddit.redditors.search(query, limit=limit)
-            return list(users)
+            users = self._fetch("search", lambda: list(self.reddit.redditors.search(query, limit=limit)))
+            self._update_rate_limit()
+            return users
         except Exception as e:
             self.logger.error(f"Error searching users: {str(e)}", exc_info=True)
             return []
 
+    @scheduled()
     def vote_comment(self, comment, vote_type: str) -> bool:
         """Vote on a comment (upvote, downvote, or clear vote)."""
         try:
             if not self.reddit or not self.user:
                 return False
             
+            if vote_type not in ("upvote", "downvote", "clear"):
+                return False
+            target = self._comment(comment)
             if vote_type == "upvote":
-                comment.upvote()
+                vote = target.upvote
             elif vote_type == "downvote":
-                comment.downvote()
-            elif vote_type == "clear":
-                comment.clear_vote()
+                vote = target.downvote
             else:
-                return False
+                vote = target.clear_vote
+            self._fetch("mutation", vote)
+            self._update_rate_limit()
             
             self.logger.info(f"Voted on comment {comment.id}: {vote_type}")
             return True
@@ -551,60 +1159,79 @@ class RedditService:
             self.logger.error(f"Error voting on comment: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def reply_to_comment(self, comment, reply_text: str) -> bool:
         """Reply to a comment."""
         try:
             if not self.reddit or not self.user:
                 return False
             
-            comment.reply(reply_text)
+            # A retried reply could be posted twice
+            self._fetch("mutation", lambda: self._comment(comment).reply(reply_text), idempotent=False)
+            self._update_rate_limit()
             self.logger.info(f"Replied to comment {comment.id}")
             return True
         except Exception as e:
             self.logger.error(f"Error replying to comment: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def edit_comment(self, comment, new_text: str) -> bool:
         """Edit a comment."""
         try:
             if not self.reddit or not self.user:
                 return False
             
-            comment.edit(new_text)
+            self._fetch("mutation", lambda: self._comment(comment).edit(new_text))
+            self._update_rate_limit()
             self.logger.info(f"Edited comment {comment.id}")
             return True
         except Exception as e:
             self.logger.error(f"Error editing comment: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def delete_comment(self, comment) -> bool:
         """Delete a comment."""
         try:
             if not self.reddit or not self.user:
                 return False
             
-            comment.delete()
+            self._fetch("mutation", self._comment(comment).delete)
+            self._update_rate_limit()
             self.logger.info(f"Deleted comment {comment.id}")
             return True
         except Exception as e:
             self.logger.error(f"Error deleting comment: {str(e)}", exc_info=True)
             return False
 
-    def get_saved_posts(self, limit: int = 25):
+    @scheduled(shared=True)
+    def get_saved_posts(self, limit: int = 25, after: str = None):
         if not self.reddit:
             self.logger.error("Cannot get saved posts: Reddit instance not initialized")
             return []
         try:
-            self._check_rate_limit()
+            key = self._listing_key(*self.FEED_LISTINGS["saved"], after=after)
+            cached = self._get_cached_posts(key, limit)
+            if cached is not None:
+                self.logger.info(f"Serving {len(cached)} saved posts from cache")
+                return cached
             self.logger.info("Fetching saved posts")
-            response = self.reddit.user.me().saved(limit=limit)
-            posts = list(response)
-            self._update_rate_limit(response)
+            # Saved items include comments, which the post list cannot show
+            posts, ended = self._fetch_listing(
+                lambda: self.reddit.user.me().saved(limit=limit, params=self._listing_params(after)), limit
+            )
+            self._update_rate_limit()
+            self._cache_posts(key, posts, ended)
             return posts
+        except ConnectionError as e:
+            self.logger.error(f"Network connection error fetching saved posts: {str(e)}", exc_info=True)
+            return self._stale_posts(key, limit, e)
         except Exception as e:
             self.logger.error(f"Error fetching saved posts: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_subscribed_subreddits(self):
         if not self.reddit:
             self.logger.error("Cannot get subscribed subreddits: Reddit instance not initialized")
@@ -620,6 +1247,7 @@ class RedditService:
             self.logger.error(f"Error fetching subscribed subreddits: {str(e)}", exc_info=True)
             return []
 
+    @scheduled()
     def submit_text_post(self, subreddit, title, content, flair_id=None, nsfw=False, spoiler=False):
         try:
             self._check_rate_limit()
@@ -638,6 +1266,7 @@ class RedditService:
             self.logger.error(f"Error submitting text post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def submit_link_post(self, subreddit, title, url, flair_id=None, nsfw=False, spoiler=False):
         try:
             self._check_rate_limit()
@@ -656,6 +1285,7 @@ class RedditService:
             self.logger.error(f"Error submitting link post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def submit_image_post(self, subreddit, title, image_path, flair_id=None, nsfw=False, spoiler=False):
         try:
             self._check_rate_limit()
@@ -674,6 +1304,7 @@ class RedditService:
             self.logger.error(f"Error submitting image post: {str(e)}", exc_info=True)
             return False
 
+    @scheduled(shared=True)
     def get_subreddit_flairs(self, subreddit):
         if not self.reddit:
             self.logger.error("Cannot get subreddit flairs: Reddit instance not initialized")
@@ -688,67 +1319,69 @@ class RedditService:
             self.logger.error(f"Error getting subreddit flairs: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_trending_subreddits(self, limit: int = 10):
         """Get trending subreddits."""
         try:
             if not self.reddit:
                 return []
             
-            trending = self.reddit.trending_subreddits()
-            return list(trending)[:limit]
+            trending = self._fetch("subreddit", lambda: list(self.reddit.trending_subreddits()))
+            self._update_rate_limit()
+            return trending[:limit]
         except Exception as e:
             self.logger.error(f"Error getting trending subreddits: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_popular_subreddits(self, limit: int = 25):
         """Get popular subreddits."""
         try:
             if not self.reddit:
                 return []
             
-            popular = self.reddit.subreddits.popular(limit=limit)
-            return list(popular)
+            popular = self._fetch("subreddit", lambda: list(self.reddit.subreddits.popular(limit=limit)))
+            self._update_rate_limit()
+            return popular
         except Exception as e:
             self.logger.error(f"Error getting popular subreddits: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_new_subreddits(self, limit: int = 25):
         """Get new subreddits."""
         try:
             if not self.reddit:
                 return []
             
-            new_subs = self.reddit.subreddits.new(limit=limit)
-            return list(new_subs)
+            new_subs = self._fetch("subreddit", lambda: list(self.reddit.subreddits.new(limit=limit)))
+            self._update_rate_limit()
+            return new_subs
         except Exception as e:
             self.logger.error(f"Error getting new subreddits: {str(e)}", exc_info=True)
             return []
 
-    def _update_rate_limit(self, response):
+    def _update_rate_limit(self, response=None):
+        """Sync the limiter with prawcore's RateLimiter, which PRAW updates from
+        the x-ratelimit-* headers of every response. The response argument is
+        accepted for the existing call sites but is not needed."""
         try:
-            if hasattr(response, '_response'):
-                headers = response._response.headers
-                self.logger.info(f"Rate limit headers: {headers}")
-                self.rate_limit_remaining = int(float(headers.get('x-ratelimit-remaining', self.rate_limit_remaining)))
-                self.rate_limit_reset = int(float(headers.get('x-ratelimit-reset', self.rate_limit_reset)))
-                self.rate_limit_used = int(float(headers.get('x-ratelimit-used', self.rate_limit_used)))
-                self.last_request_time = time.time()
-                self.logger.info(f"Rate limit updated - Remaining: {self.rate_limit_remaining}, Reset: {self.rate_limit_reset}, Used: {self.rate_limit_used}")
+            core_limiter = self.reddit._core._rate_limiter if self.reddit else None
+            if core_limiter is None or not self.rate_limiter.update_from_prawcore(core_limiter):
+                return
+            self.rate_limit_remaining = self.rate_limiter.remaining
+            self.rate_limit_used = self.rate_limiter.used
+            self.rate_limit_reset = int(max(self.rate_limiter.reset_at - time.time(), 0))
+            self.last_request_time = time.time()
         except Exception as e:
             self.logger.error(f"Error updating rate limit: {str(e)}", exc_info=True)
 
     def get_rate_limit_info(self):
         try:
-            current_time = time.time()
-            time_since_last_request = current_time - self.last_request_time
-            time_until_reset = max(0, self.rate_limit_reset - time_since_last_request)
-            
-            return {
-                'remaining': self.rate_limit_remaining,
-                'used': self.rate_limit_used,
-                'time_until_reset': time_until_reset,
-                'last_request': self.last_request_time
-            }
+            self._update_rate_limit()
+            info = self.rate_limiter.snapshot()
+            info['last_request'] = self.last_request_time
+            return info
         except Exception as e:
             self.logger.error(f"Error getting rate limit info: {str(e)}", exc_info=True)
             return {
@@ -758,13 +1391,35 @@ class RedditService:
                 'last_request': 0
             }
 
+    def has_prefetch_budget(self):
+        """Whether the rate limit budget leaves room for speculative requests."""
+        return self.rate_limiter.remaining > self.rate_limiter.background_reserve * 2
+
+    def get_circuit_breaker_stats(self):
+        return self.resilience.stats()
+
+    def get_scheduler_stats(self):
+        return self.scheduler.stats()
+
+    def get_single_flight_stats(self):
+        return self.single_flight.stats()
+
     def _check_rate_limit(self):
-        if self.rate_limit_remaining <= 0:
-            current_time = time.time()
-            time_since_last_request = current_time - self.last_request_time
-            if time_since_last_request < self.rate_limit_reset:
-                raise Exception(f"Rate limit exceeded. Please wait {int(self.rate_limit_reset - time_since_last_request)} seconds.")
+        """Wait until the rate limiter lets a request of the current lane through.
+        Raises RequestCancelled if the caller cancelled the request meanwhile, and
+        RedditUnreachableError while offline."""
+        if self.offline and not getattr(self._request_context, "probing", False):
+            raise RedditUnreachableError("Offline, only saved content is available")
+        cancel_token = getattr(self._request_context, "cancel_token", None)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        self._update_rate_limit()
+        lane = self.scheduler.current_lane or LANE_INTERACTIVE
+        self.rate_limiter.acquire(INTERACTIVE if lane == LANE_INTERACTIVE else BACKGROUND)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
 
+    @scheduled()
     def block_user(self, username: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot block user: Reddit instance not initialized")
@@ -779,6 +1434,7 @@ class RedditService:
             self.logger.error(f"Error blocking user: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def unblock_user(self, username: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot unblock user: Reddit instance not initialized")
@@ -793,6 +1449,7 @@ class RedditService:
             self.logger.error(f"Error unblocking user: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def follow_user(self, username: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot follow user: Reddit instance not initialized")
@@ -807,6 +1464,7 @@ class RedditService:
             self.logger.error(f"Error following user: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def unfollow_user(self, username: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot unfollow user: Reddit instance not initialized")
@@ -821,6 +1479,7 @@ class RedditService:
             self.logger.error(f"Error unfollowing user: {str(e)}", exc_info=True)
             return False
 
+    @scheduled(shared=True)
     def get_followed_users(self):
         if not self.reddit:
             self.logger.error("Cannot get followed users: Reddit instance not initialized")
@@ -835,6 +1494,7 @@ class RedditService:
             self.logger.error(f"Error fetching followed users: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_blocked_users(self):
         if not self.reddit:
             self.logger.error("Cannot get blocked users: Reddit instance not initialized")
@@ -849,20 +1509,28 @@ class RedditService:
             self.logger.error(f"Error fetching blocked users: {str(e)}", exc_info=True)
             return []
 
+    @scheduled(shared=True)
     def get_messages(self, limit: int = 25):
         if not self.reddit:
             self.logger.error("Cannot get messages: Reddit instance not initialized")
             return []
         try:
-            self._check_rate_limit()
             self.logger.info("Fetching messages")
-            messages = list(self.reddit.inbox.messages(limit=limit))
-            self._update_rate_limit(messages)
+            try:
+                messages = self._fetch("inbox", lambda: [
+                    MessageRecord.from_message(message) for message in self.reddit.inbox.messages(limit=limit)
+                ])
+            except ConnectionError as e:
+                self.logger.error(f"Network connection error fetching messages: {str(e)}")
+                return [MessageRecord(**record) for record in self._stored("inbox", "messages", e)[:limit]]
+            self._update_rate_limit()
+            self._store("inbox", "messages", [message.to_dict() for message in messages])
             return messages
         except Exception as e:
             self.logger.error(f"Error fetching messages: {str(e)}", exc_info=True)
             return []
 
+    @scheduled()
     def send_message(self, username: str, subject: str, message: str) -> bool:
         if not self.reddit:
             self.logger.error("Cannot send message: Reddit instance not initialized")
@@ -877,6 +1545,7 @@ class RedditService:
             self.logger.error(f"Error sending message: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def mark_message_read(self, message) -> bool:
         if not self.reddit:
             self.logger.error("Cannot mark message as read: Reddit instance not initialized")
@@ -884,13 +1553,14 @@ class RedditService:
         try:
             self._check_rate_limit()
             self.logger.info(f"Marking message as read: {message.id}")
-            message.mark_read()
+            self._message(message).mark_read()
             self.logger.info("Message marked as read successfully")
             return True
         except Exception as e:
             self.logger.error(f"Error marking message as read: {str(e)}", exc_info=True)
             return False
 
+    @scheduled()
     def mark_message_unread(self, message) -> bool:
         if not self.reddit:
             self.logger.error("Cannot mark message as unread: Reddit instance not initialized")
@@ -898,7 +1568,7 @@ class RedditService:
         try:
             self._check_rate_limit()
             self.logger.info(f"Marking message as unread: {message.id}")
-            message.mark_unread()
+            self._message(message).mark_unread()
             self.logger.info("Message marked as unread successfully")
             return True
         except Exception as e:
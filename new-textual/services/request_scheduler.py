@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from utils.logger import Logger
+
+LANE_INTERACTIVE = "interactive"
+LANE_PREFETCH = "visible-prefetch"
+LANE_BACKGROUND = "background"
+
+# Lanes in the order they are served
+LANES = (LANE_INTERACTIVE, LANE_PREFETCH, LANE_BACKGROUND)
+
+class RequestCancelled(Exception):
+    pass
+
+class CancellationToken:
+    """Shared flag a caller can set to drop requests it no longer needs."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise RequestCancelled()
+
+class _Request:
+    __slots__ = ("lane", "fn", "token", "future", "enqueued_at")
+
+    def __init__(self, lane, fn, token):
+        self.lane = lane
+        self.fn = fn
+        self.token = token
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+class RequestScheduler:
+    """Runs Reddit requests on a bounded pool of threads, one queue per lane.
+
+    Workers always take the oldest request of the highest-priority lane that is
+    below its concurrency cap, so interactive requests never wait behind
+    prefetch or background traffic. Requests whose cancellation token is set
+    are dropped before they start.
+    """
+
+    DEFAULT_LANE_LIMITS = {
+        LANE_INTERACTIVE: 4,
+        LANE_PREFETCH: 2,
+        LANE_BACKGROUND: 1,
+    }
+
+    def __init__(self, lane_limits: dict = None):
+        self.logger = Logger()
+        self.lane_limits = {**self.DEFAULT_LANE_LIMITS, **(lane_limits or {})}
+        self._queues = {lane: deque() for lane in LANES}
+        self._active = {lane: 0 for lane in LANES}
+        self._completed = {lane: 0 for lane in LANES}
+        self._total_wait = {lane: 0.0 for lane in LANES}
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._shutdown = False
+        # One thread per concurrency slot, so a full lane never blocks another
+        self._threads = []
+        for i in range(sum(self.lane_limits.values())):
+            thread = threading.Thread(target=self._work_loop, name=f"reddit-request-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def current_lane(self):
+        """Lane of the request running on this thread, or None outside the pool."""
+        return getattr(self._local, "lane", None)
+
+    def submit(self, lane: str, fn, token: CancellationToken = None) -> Future:
+        if lane not in self._queues:
+            raise ValueError(f"Unknown request lane: {lane}")
+        request = _Request(lane, fn, token)
+        with self._cond:
+            self._queues[lane].append(request)
+            self._cond.notify_all()
+        return request.future
+
+    def run(self, lane: str, fn, token: CancellationToken = None):
+        """Run fn in the given lane and wait for its result.
+
+        Calls made from inside a pool thread run inline, so a request that
+        issues another request cannot deadlock the pool.
+        """
+        if self.current_lane is not None:
+            if token is not None:
+                token.raise_if_cancelled()
+            return fn()
+        return self.submit(lane, fn, token).result()
+
+    def _next_request(self):
+        for lane in LANES:
+            queue = self._queues[lane]
+            while queue and queue[0].token is not None and queue[0].token.cancelled:
+                queue.popleft().future.set_exception(RequestCancelled())
+            if queue and self._active[lane] < self.lane_limits[lane]:
+                return queue.popleft()
+        return None
+
+    def _work_loop(self):
+        while True:
+            with self._cond:
+                request = self._next_request()
+                while request is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    request = self._next_request()
+                self._active[request.lane] += 1
+                self._completed[request.lane] += 1
+                self._total_wait[request.lane] += time.monotonic() - request.enqueued_at
+
+            self._local.lane = request.lane
+            try:
+                if request.future.set_running_or_notify_cancel():
+                    try:
+                        request.future.set_result(request.fn())
+                    except BaseException as e:
+                        request.future.set_exception(e)
+            finally:
+                self._local.lane = None
+                with self._cond:
+                    self._active[request.lane] -= 1
+                    self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Queue depth, running requests and wait times for every lane."""
+        now = time.monotonic()
+        with self._cond:
+            return {
+                lane: {
+                    "queued": len(self._queues[lane]),
+                    "active": self._active[lane],
+                    "limit": self.lane_limits[lane],
+                    "avg_wait": self._total_wait[lane] / self._completed[lane] if self._completed[lane] else 0.0,
+                    "oldest_wait": now - self._queues[lane][0].enqueued_at if self._queues[lane] else 0.0,
+                }
+                for lane in LANES
+            }
+
+    def shutdown(self):
+        with self._cond:
+            self._shutdown = True
+            for queue in self._queues.values():
+                while queue:
+                    queue.popleft().future.set_exception(RequestCancelled())
+            self._cond.notify_all()
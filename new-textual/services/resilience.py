@@ -0,0 +1,172 @@
+import random
+import threading
+import time
+from prawcore.exceptions import RequestException, ResponseException, ServerError, TooManyRequests
+from prawcore.sessions import Session
+from utils.logger import Logger
+
+class RedditUnavailableError(ConnectionError):
+    """Reddit could not be reached: retries ran out or the endpoint's circuit
+    breaker is open."""
+
+class RedditUnreachableError(RedditUnavailableError):
+    """The request never got an answer: the app is offline or the connection
+    failed, rather than Reddit failing or refusing it."""
+
+# Failures worth retrying; anything else (404, 403, bad input) will fail again
+TRANSIENT_ERRORS = (ServerError, TooManyRequests, RequestException, ConnectionError, TimeoutError)
+# Failures that mean Reddit could not be reached at all, rather than answered badly
+NETWORK_ERRORS = (RequestException, ConnectionError, TimeoutError)
+
+def retried_by_prawcore(error) -> bool:
+    """Whether prawcore's Session already retried the request before raising
+    error: it does so for 5xx responses and dropped or timed out connections."""
+    if isinstance(error, ServerError):
+        return True
+    return isinstance(error, RequestException) and isinstance(error.original_exception, Session.RETRY_EXCEPTIONS)
+
+class CircuitBreaker:
+    """Stops calls to an endpoint after failure_threshold transient failures in
+    a row. Once reset_timeout seconds have passed, one trial call is let
+    through; its outcome closes the breaker again or restarts the timeout."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def retry_in(self) -> float:
+        return max(self.opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() >= self.opened_at + self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                Logger().info(f"Circuit breaker for {self.name} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    Logger().warning(f"Circuit breaker for {self.name} opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a trial call that neither proved nor disproved the endpoint works."""
+        with self._lock:
+            self._trial_running = False
+
+class Resilience:
+    """Retries and per-endpoint circuit breakers for Reddit requests.
+
+    Idempotent requests that fail with a transient error are retried up to
+    max_attempts times with jittered exponential backoff, or after the delay a
+    429 response asks for in Retry-After. Errors prawcore already retried are
+    not retried again, that would multiply the attempts. When the retries run out, or the
+    endpoint's breaker is open, RedditUnavailableError is raised so callers can
+    fall back to cached data instead of waiting out another timeout.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.logger = Logger()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+            return self._breakers[endpoint]
+
+    def call(self, endpoint: str, fn, idempotent: bool = True):
+        breaker = self.breaker(endpoint)
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise RedditUnavailableError(
+                    f"Reddit is not responding to {endpoint} requests, trying again in {breaker.retry_in:.0f}s"
+                )
+            attempt += 1
+            try:
+                result = fn()
+            except RedditUnavailableError:
+                # Refused before reaching Reddit, e.g. while offline
+                breaker.release()
+                raise
+            except TRANSIENT_ERRORS as e:
+                breaker.record_failure()
+                # Once the breaker has opened, further attempts would only be refused
+                retry = idempotent and breaker.state != CircuitBreaker.OPEN and not retried_by_prawcore(e)
+                delay = self._retry_delay(attempt, e) if retry else None
+                if delay is None:
+                    error = RedditUnreachableError if isinstance(e, NETWORK_ERRORS) else RedditUnavailableError
+                    raise error(f"Reddit {endpoint} request failed: {str(e)}") from e
+                self.logger.warning(
+                    f"{endpoint} request failed ({type(e).__name__}), retry {attempt} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                continue
+            except ResponseException:
+                # Reddit answered, it just did not like the request
+                breaker.record_success()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    def _retry_delay(self, attempt: int, error):
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt >= self.max_attempts:
+            return None
+        try:
+            retry_after = float(getattr(error, "retry_after", None) or "")
+        except ValueError:
+            retry_after = None
+        if retry_after is not None:
+            # Waiting minutes in a worker would only hold up the queue
+            return retry_after if retry_after <= self.max_delay else None
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        # Equal jitter: spread retries of concurrent requests apart
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def stats(self) -> dict:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {
+            breaker.name: {"state": breaker.state, "failures": breaker.failures, "retry_in": breaker.retry_in}
+            for breaker in breakers
+        }
@@ -0,0 +1,198 @@
+import threading
+import time
+import prawcore
+from utils.logger import Logger
+
+def _supports_token_reuse(version) -> bool:
+    """Reading and restoring tokens relies on how prawcore's authorizers track
+    expiry (_expiration_timestamp_ns), which it has done since 3.0."""
+    try:
+        return int(version.split(".")[0]) >= 3
+    except (AttributeError, ValueError):
+        return False
+
+def _authorizers_support_token_reuse(auth) -> bool:
+    """Whether the authorizers in prawcore's auth module have what reusing and
+    refreshing tokens touches: refresh(), and expiry kept in
+    _expiration_timestamp_ns. That attribute is only set once a token was
+    requested, so it is looked up in is_valid(), which reads it."""
+    authorizers = [getattr(auth, name, None) for name in ("Authorizer", "ScriptAuthorizer", "ReadOnlyAuthorizer")]
+    is_valid = getattr(getattr(auth, "BaseAuthorizer", None), "is_valid", None)
+    return (
+        all(hasattr(authorizer, "refresh") for authorizer in authorizers)
+        and "_expiration_timestamp_ns" in getattr(getattr(is_valid, "__code__", None), "co_names", ())
+    )
+
+TOKEN_REUSE = (
+    _supports_token_reuse(getattr(prawcore, "__version__", None))
+    and _authorizers_support_token_reuse(getattr(prawcore, "auth", None))
+)
+
+class Session:
+    """A praw.Reddit instance of one account, with its own HTTP connection and
+    OAuth token. user is the account name Reddit confirmed, or None until the
+    session has authenticated."""
+
+    __slots__ = ("username", "reddit", "user", "lock")
+
+    def __init__(self, username, reddit, user=None):
+        self.username = username
+        self.reddit = reddit
+        self.user = user
+        self.lock = threading.Lock()
+
+    @property
+    def _authorizer(self):
+        if not TOKEN_REUSE:
+            return None
+        return getattr(self.reddit._core, "_authorizer", None)
+
+    @property
+    def token_expires_in(self):
+        """Seconds until the access token expires, or None without a token."""
+        authorizer = self._authorizer
+        if authorizer is None or authorizer.access_token is None:
+            return None
+        return (getattr(authorizer, "_expiration_timestamp_ns", 0) - time.monotonic_ns()) / 1e9
+
+    @property
+    def has_token(self) -> bool:
+        expires_in = self.token_expires_in
+        return expires_in is not None and expires_in > 0
+
+    def token(self):
+        """Return (access_token, expires_at) with expires_at as a wall-clock
+        timestamp, or None without a token."""
+        expires_in = self.token_expires_in
+        if expires_in is None:
+            return None
+        return self._authorizer.access_token, time.time() + expires_in
+
+    def restore_token(self, access_token, expires_at) -> bool:
+        """Use a token saved by an earlier run. prawcore replaces it with a
+        password grant once it expires or Reddit rejects it. Returns False when
+        the token cannot be used, the session then logs in normally."""
+        authorizer = self._authorizer
+        if authorizer is None:
+            return False
+        authorizer.access_token = access_token
+        # prawcore tracks the expiry on the monotonic clock
+        authorizer._expiration_timestamp_ns = time.monotonic_ns() + int((expires_at - time.time()) * 1e9)
+        return True
+
+class SessionPool:
+    """Authenticated PRAW sessions, one per account.
+
+    factory(username) builds a praw.Reddit for an account without touching the
+    network. Warming a session authenticates it (a token grant and user.me())
+    in the background, so switching to the account later costs no round-trip
+    and reuses the connection that is already open. Tokens about to expire are
+    refreshed in the background while is_offline() is false.
+
+    With a token_store, new sessions start with the account's saved token and
+    tokens are saved whenever they change, so the next run can skip the grant.
+    """
+
+    # Refresh tokens this many seconds before they expire
+    REFRESH_MARGIN = 300
+    REFRESH_CHECK_INTERVAL = 60
+
+    def __init__(self, factory, is_offline=lambda: False, token_store=None):
+        self.logger = Logger()
+        self.factory = factory
+        self.is_offline = is_offline
+        self.token_store = token_store
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._refresher = None
+
+    def get(self, username) -> Session:
+        """The account's session, created (but not authenticated) if needed."""
+        with self._lock:
+            session = self._sessions.get(username)
+            if session is None:
+                session = Session(username, self.factory(username))
+                saved = self.token_store.get(username) if self.token_store else None
+                if saved is not None:
+                    if session.restore_token(*saved):
+                        self.logger.info(f"Reusing saved token of {username}")
+                    else:
+                        self.logger.info(f"prawcore {prawcore.__version__} cannot reuse saved tokens, logging in {username} normally")
+                self._sessions[username] = session
+            return session
+
+    def put(self, username, reddit, user=None) -> Session:
+        """Adopt a praw.Reddit that was authenticated elsewhere, e.g. at login."""
+        session = Session(username, reddit, user)
+        with self._lock:
+            self._sessions[username] = session
+        self._save_token(session)
+        self._start_refresher()
+        return session
+
+    def discard(self, username):
+        with self._lock:
+            self._sessions.pop(username, None)
+        if self.token_store:
+            self.token_store.remove(username)
+
+    def authenticate(self, username) -> str:
+        """Authenticate the account's session if it has not been yet and return
+        the account name Reddit confirmed. Raises what PRAW raises."""
+        session = self.get(username)
+        # Waits for a warm-up of the same account that is already running
+        with session.lock:
+            if session.user is None:
+                started = time.monotonic()
+                session.user = session.reddit.user.me().name
+                self.logger.info(f"Session for {username} authenticated in {time.monotonic() - started:.2f}s")
+        self._save_token(session)
+        self._start_refresher()
+        return session.user
+
+    def warm(self, usernames):
+        """Authenticate the sessions of usernames in a background thread."""
+        usernames = [username for username in usernames if self.get(username).user is None]
+        if not usernames:
+            return
+        threading.Thread(target=self._warm, args=(usernames,), name="reddit-session-warmup", daemon=True).start()
+
+    def _warm(self, usernames):
+        for username in usernames:
+            if self.is_offline():
+                return
+            try:
+                self.authenticate(username)
+            except Exception as e:
+                self.logger.warning(f"Could not warm up session for {username}: {str(e)}")
+
+    def _save_token(self, session):
+        token = session.token()
+        if self.token_store and token is not None:
+            self.token_store.put(session.username, *token)
+
+    def _start_refresher(self):
+        with self._lock:
+            if self._refresher is not None:
+                return
+            self._refresher = threading.Thread(target=self._refresh_loop, name="reddit-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(self.REFRESH_CHECK_INTERVAL)
+            if self.is_offline():
+                continue
+            with self._lock:
+                sessions = [session for session in self._sessions.values() if session.user is not None]
+            for session in sessions:
+                expires_in = session.token_expires_in
+                if expires_in is not None and expires_in <= self.REFRESH_MARGIN:
+                    try:
+                        with session.lock:
+                            session.reddit._core._authorizer.refresh()
+                        self.logger.info(f"Refreshed token of {session.username}")
+                    except Exception as e:
+                        self.logger.warning(f"Could not refresh token of {session.username}: {str(e)}")
+                # prawcore also renews tokens on its own when a request needs it
+                self._save_token(session)
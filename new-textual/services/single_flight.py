@@ -0,0 +1,93 @@
+import threading
+from concurrent.futures import Future
+from services.request_scheduler import RequestCancelled
+from utils.logger import Logger
+
+class SharedCancellationToken:
+    """Cancellation token of a request shared by several callers.
+
+    The request is only cancelled once every caller has cancelled; a caller
+    that joined without a token keeps it alive for good.
+    """
+
+    def __init__(self):
+        self._tokens = []
+        self._cancellable = True
+
+    def add(self, token):
+        if token is None:
+            self._cancellable = False
+        else:
+            self._tokens.append(token)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancellable and all(token.cancelled for token in self._tokens)
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise RequestCancelled()
+
+class _Flight:
+    __slots__ = ("future", "token", "callers")
+
+    def __init__(self):
+        self.future = Future()
+        self.token = SharedCancellationToken()
+        self.callers = 1
+
+class SingleFlight:
+    """Collapses identical concurrent requests into one.
+
+    The first caller of a key runs the request; callers arriving while it is
+    in flight wait for the same result instead of sending their own.
+    """
+
+    def __init__(self):
+        self.logger = Logger()
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.shared_count = 0
+
+    def do(self, key, fn, token=None):
+        """Run fn(shared_token) for key, or join the call already in flight."""
+        with self._lock:
+            flight = self._flights.get(key)
+            # A flight whose callers all gave up may already be unwinding, start afresh
+            if flight is not None and not flight.token.cancelled:
+                flight.token.add(token)
+                flight.callers += 1
+                self.shared_count += 1
+                leader = False
+            else:
+                flight = _Flight()
+                flight.token.add(token)
+                self._flights[key] = flight
+                leader = True
+
+        if not leader:
+            self.logger.debug(f"Joining in-flight request {key[0]}")
+            result = flight.future.result()
+            # Callers may extend the lists they get back, so each gets its own
+            return list(result) if isinstance(result, list) else result
+
+        try:
+            result = fn(flight.token)
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        else:
+            flight.future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "waiting": sum(flight.callers - 1 for flight in self._flights.values()),
+                "shared": self.shared_count,
+            }
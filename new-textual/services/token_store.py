@@ -0,0 +1,62 @@
+import json
+import os
+import threading
+import time
+from utils.logger import Logger
+
+class TokenStore:
+    """OAuth access tokens of the accounts, kept between runs so startup can
+    reuse a token instead of doing a password grant.
+
+    Tokens are stored with their expiry as a wall-clock timestamp in a JSON file
+    only the user can read. Tokens with less than min_lifetime seconds left are
+    treated as missing.
+    """
+
+    def __init__(self, path, min_lifetime: float = 60.0):
+        self.logger = Logger()
+        self.path = path
+        self.min_lifetime = min_lifetime
+        self._lock = threading.Lock()
+        self._tokens = self._load()
+
+    def get(self, username):
+        """Return (access_token, expires_at) for username, or None."""
+        with self._lock:
+            entry = self._tokens.get(username)
+        if entry is None or entry["expires_at"] - time.time() < self.min_lifetime:
+            return None
+        return entry["access_token"], entry["expires_at"]
+
+    def put(self, username, access_token, expires_at):
+        with self._lock:
+            if self._tokens.get(username, {}).get("access_token") == access_token:
+                return
+            self._tokens[username] = {"access_token": access_token, "expires_at": expires_at}
+            self._save()
+
+    def remove(self, username):
+        with self._lock:
+            if self._tokens.pop(username, None) is not None:
+                self._save()
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load saved tokens: {str(e)}", exc_info=True)
+            return {}
+
+    def _save(self):
+        # Called with the lock held
+        try:
+            tmp_path = self.path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._tokens, f)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            self.logger.error(f"Failed to save tokens: {str(e)}", exc_info=True)
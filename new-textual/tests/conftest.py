@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+import praw
+import pytest
+from praw.models import Submission
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The logger writes to ./logs and the app to ~/.config, keep both out of the checkout
+_scratch = tempfile.mkdtemp(prefix="reddit-tui-tests-")
+os.environ["HOME"] = _scratch
+os.chdir(_scratch)
+
+from services.reddit_service import RedditService
+
+def post_data(i, prefix="p"):
+    return {
+        "id": f"{prefix}{i}", "name": f"t3_{prefix}{i}", "title": f"Post {prefix}{i}",
+        "subreddit": "python", "author": "alice", "score": i, "num_comments": i * 2,
+        "created_utc": time.time() - 3600, "permalink": f"/r/python/comments/{prefix}{i}/",
+        "url": "https://example.com", "selftext": "", "is_self": True, "over_18": False,
+    }
+
+class FakeReddit(praw.Reddit):
+    """praw.Reddit whose listings are served from memory. Every listing
+    request is recorded in calls. Posts whose id is in hidden are left out, as
+    Reddit leaves out the posts a user hid, and the saved listing holds the
+    posts numbered in saved_ids."""
+
+    def __init__(self):
+        super().__init__(client_id="id", client_secret="secret", user_agent="RedditTUI tests")
+        self.calls = []
+        self.hidden = set()
+        self.saved_ids = []
+        self.user.me = lambda: self
+        # praw.Reddit sets subreddit on the instance
+        self.subreddit = self._subreddit
+
+    def _listing(self, name, limit=25, params=None, **kwargs):
+        self.calls.append(name)
+        posts = [post_data(i) for i in range(limit + len(self.hidden))]
+        posts = [data for data in posts if data["id"] not in self.hidden][:limit]
+        return iter(Submission(self, _data=data) for data in posts)
+
+    def _subreddit(self, display_name):
+        return type("FakeSubreddit", (), {
+            "hot": lambda _, **kwargs: self._listing(f"{display_name}/hot", **kwargs),
+            "new": lambda _, **kwargs: self._listing(f"{display_name}/new", **kwargs),
+            "top": lambda _, **kwargs: self._listing(f"{display_name}/top", **kwargs),
+        })()
+
+    def saved(self, limit=25, params=None):
+        self.calls.append("saved")
+        return iter(Submission(self, _data=post_data(i)) for i in self.saved_ids[:limit])
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    service = RedditService()
+    service.current_account = "alice"
+    service.reddit = FakeReddit()
+    # Mutations are recorded instead of sent
+    service.applied = []
+    service.mutations.executor = lambda mutation: service.applied.append(mutation) or True
+    yield service
+    service.mutations.shutdown()
+    service.scheduler.shutdown()
@@ -0,0 +1,76 @@
+import sqlite3
+import time
+from services.listing_cache import ListingCache
+from services.mutation_queue import HIDE, SAVE, Mutation
+
+def test_hidden_post_stays_hidden_after_reload(service):
+    posts = service.get_hot_posts(limit=5)
+    hidden = posts[1]
+
+    service.queue_mutation(HIDE, hidden.id, True, original=False, label=hidden.title)
+    reloaded = service.get_hot_posts(limit=5)
+
+    assert service.reddit.calls == ["all/hot"]
+    assert [post.id for post in reloaded] == [post.id for post in posts if post.id != hidden.id]
+    posts_after_restart, _ = service.peek_feed_posts("hot", limit=5)
+    assert hidden.id not in [post.id for post in posts_after_restart]
+
+def test_unhiding_brings_the_post_back(service):
+    posts = service.get_new_posts(limit=5)
+
+    service.queue_mutation(HIDE, posts[0].id, True, original=False)
+    service.queue_mutation(HIDE, posts[0].id, False, original=True)
+
+    assert [post.id for post in service.get_new_posts(limit=5)] == [post.id for post in posts]
+
+def test_failed_hide_is_rolled_back_in_the_cache(service):
+    posts = service.get_hot_posts(limit=5)
+    service.queue_mutation(HIDE, posts[0].id, True, original=False)
+    # Drop the queued hide as if it had been sent, then report it failed
+    mutation = Mutation("alice", HIDE, posts[0].id, True, original=False)
+    service.mutations._pending.clear()
+
+    service._on_mutation_finished(mutation, False)
+
+    assert [post.id for post in service.get_hot_posts(limit=5)] == [post.id for post in posts]
+
+def test_saving_marks_cached_posts_and_refetches_saved_listing(service):
+    assert service.get_saved_posts(limit=5) == []
+    posts = service.get_top_posts(limit=5)
+
+    service.queue_mutation(SAVE, posts[2].id, True, original=False)
+    service.reddit.saved_ids.append(2)
+
+    assert service.get_top_posts(limit=5)[2].saved is True
+    assert [post.id for post in service.get_saved_posts(limit=5)] == [posts[2].id]
+    assert service.reddit.calls == ["saved", "all/top", "saved"]
+
+def test_short_last_page_and_empty_listing_are_served_from_cache(service):
+    service.reddit.saved_ids = [0, 1]
+    assert len(service.get_saved_posts(limit=5)) == 2
+    assert len(service.get_saved_posts(limit=5)) == 2
+
+    service.reddit.saved_ids = []
+    assert service.get_saved_posts(limit=5, after="t3_p1") == []
+    assert service.get_saved_posts(limit=5, after="t3_p1") == []
+
+    assert service.reddit.calls == ["saved", "saved"]
+
+def test_cache_written_before_pages_recorded_their_end_still_opens(tmp_path):
+    db_path = tmp_path / "listings.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE listings (account TEXT NOT NULL, feed TEXT NOT NULL, subreddit TEXT NOT NULL, "
+        "sort TEXT NOT NULL, time_filter TEXT NOT NULL, after TEXT NOT NULL, records TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL, ttl REAL NOT NULL, "
+        "PRIMARY KEY (account, feed, subreddit, sort, time_filter, after))"
+    )
+    conn.execute("INSERT INTO listings VALUES ('alice', 'hot', '', '', '', '', '[]', ?, 300)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+    cache = ListingCache(db_path)
+    key = ListingCache.make_key("alice", "hot")
+    assert cache.get(key)[3] is False
+    cache.put(key, [], ended=True)
+    assert cache.get(key)[3] is True
@@ -0,0 +1,84 @@
+import threading
+import pytest
+import requests
+from prawcore.exceptions import RequestException
+from services.models import CommentRecord, PostRecord
+from services.mutation_queue import SAVE, Mutation, MutationQueue
+from services.resilience import RedditUnavailableError, RedditUnreachableError
+
+def unreachable(*args, **kwargs):
+    raise RequestException(requests.exceptions.ConnectionError("down"), args, kwargs)
+
+def test_network_errors_reach_the_mutation_queue(service):
+    service.reddit.post = unreachable
+
+    with pytest.raises(RedditUnreachableError):
+        service._apply_mutation(Mutation("alice", SAVE, "p1", True, original=False))
+
+    assert service.offline
+
+def test_mutations_are_not_sent_while_offline(service):
+    service.reddit.post = unreachable
+    service.set_offline(True)
+
+    with pytest.raises(RedditUnavailableError):
+        service.vote_post(PostRecord(id="p1", title="Post p1"), "upvote")
+
+def test_comment_records_are_resolved_before_mutating(service):
+    sent = []
+    service.reddit.post = lambda path, data=None, **kwargs: sent.append((path, data))
+    service.user = service.reddit.user.me()
+    comment = CommentRecord(id="c1", name="t1_c1", body="Hi", replies=[])
+
+    assert service.vote_comment(comment, "upvote")
+    assert service.delete_comment(comment)
+
+    assert sent == [("api/vote/", {"dir": "1", "id": "t1_c1"}), ("api/del/", {"id": "t1_c1"})]
+
+def test_subreddit_and_user_lookups_respect_offline_mode(service):
+    calls = []
+    service.reddit.redditors.search = lambda *args, **kwargs: calls.append(args) or iter(())
+    service.reddit.subreddits.popular = lambda *args, **kwargs: calls.append(args) or iter(())
+    service.set_offline(True)
+
+    assert service.search_users("alice") == []
+    assert service.get_popular_subreddits() == []
+    assert calls == []
+
+def run_queue(tmp_path, error, attempts):
+    """Queue a save whose executor raises error, and return (tries, results
+    passed to listeners, mutations left) once the queue gave up on it or tried
+    it attempts times."""
+    tried = []
+    finished = threading.Event()
+    results = []
+
+    def executor(mutation):
+        tried.append(mutation.attempts)
+        if len(tried) >= attempts:
+            finished.set()
+        raise error
+
+    queue = MutationQueue(tmp_path / "journal.json", executor, lambda: "alice")
+    queue.COALESCE_DELAY = queue.RETRY_DELAY = queue.IDLE_WAIT = 0.01
+    queue.add_listener(lambda mutation, succeeded: (results.append(succeeded), finished.set()))
+    try:
+        queue.enqueue("alice", SAVE, "p1", True, original=False)
+        assert finished.wait(5)
+        return len(tried), results, queue.pending_count()
+    finally:
+        queue.shutdown()
+
+def test_failing_mutations_are_given_up_after_max_attempts(tmp_path):
+    tried, results, pending = run_queue(tmp_path, RedditUnavailableError("503"), MutationQueue.MAX_ATTEMPTS + 1)
+
+    assert tried == MutationQueue.MAX_ATTEMPTS
+    assert results == [False]
+    assert pending == 0
+
+def test_mutations_stay_queued_while_reddit_is_unreachable(tmp_path):
+    tried, results, pending = run_queue(tmp_path, RedditUnreachableError("Offline"), MutationQueue.MAX_ATTEMPTS * 2)
+
+    assert tried >= MutationQueue.MAX_ATTEMPTS * 2
+    assert results == []
+    assert pending == 1
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from textual.app import App
+from components.post_list import PostList
+from services.models import PostRecord
+from conftest import post_data
+
+MOVES = 200
+
+class PostListApp(App):
+    def __init__(self, posts):
+        super().__init__()
+        self.posts = posts
+
+    def compose(self):
+        yield PostList(posts=self.posts)
+
+def measure_cursor_moves(count):
+    """(seconds, posts rendered) per cursor move over a list of count posts,
+    drawing every row in view after each move as a repaint would."""
+    posts = [PostRecord.from_dict(post_data(i)) for i in range(count)]
+
+    async def run():
+        app = PostListApp(posts)
+        async with app.run_test(size=(100, 30)) as pilot:
+            post_list = app.query_one(PostList)
+            post_list.focus()
+            await pilot.pause()
+            height = post_list.scrollable_content_region.height
+            for y in range(height):
+                post_list.render_line(y)
+
+            rendered = [0]
+            render_post = post_list._render_post
+
+            def counting_render_post(*args):
+                rendered[0] += 1
+                return render_post(*args)
+            post_list._render_post = counting_render_post
+
+            started = time.perf_counter()
+            for _ in range(MOVES):
+                post_list.action_cursor_down()
+                for y in range(height):
+                    post_list.render_line(y)
+            return (time.perf_counter() - started) / MOVES, rendered[0] / MOVES
+    return asyncio.run(run())
+
+def test_cursor_move_cost_stays_flat_as_the_list_grows():
+    small_cost, small_rendered = measure_cursor_moves(300)
+    large_cost, large_rendered = measure_cursor_moves(5000)
+    print(f"\n300 posts: {small_cost * 1000:.2f} ms, {small_rendered:.1f} posts rendered per move")
+    print(f"5000 posts: {large_cost * 1000:.2f} ms, {large_rendered:.1f} posts rendered per move")
+
+    # The two posts whose selection changed, and at most one scrolled into view
+    assert small_rendered <= 3 and large_rendered <= 3
+    # Allow for noise, a cost that grew with the list would be ~17x
+    assert large_cost < small_cost * 3
+
+def measure_width_change(count):
+    """(seconds, posts rendered) for narrowing a list of count posts, which
+    measures every post again, and the posts in view whose rendered rows do
+    not match their measured height."""
+    posts = [PostRecord.from_dict(post_data(i)) for i in range(count)]
+
+    async def run():
+        app = PostListApp(posts)
+        async with app.run_test(size=(100, 30)) as pilot:
+            post_list = app.query_one(PostList)
+            await pilot.pause()
+
+            rendered = [0]
+            render_post = post_list._render_post
+
+            def counting_render_post(*args):
+                rendered[0] += 1
+                return render_post(*args)
+            post_list._render_post = counting_render_post
+
+            elapsed = [0.0]
+            rebuild_rows = post_list._rebuild_rows
+
+            def timed_rebuild_rows():
+                started = time.perf_counter()
+                rebuild_rows()
+                elapsed[0] += time.perf_counter() - started
+            post_list._rebuild_rows = timed_rebuild_rows
+
+            await pilot.resize_terminal(40, 30)
+            await pilot.pause()
+            width = post_list._rows_width
+            assert width < 100
+            mismatched = [
+                post.id for post in posts[:20]
+                if len(post_list._post_strips(post, False, width)) != post_list._post_height(post)
+            ]
+            return elapsed[0], rendered[0], mismatched
+    return asyncio.run(run())
+
+def test_width_change_measures_without_rendering():
+    small_cost, small_rendered, small_mismatched = measure_width_change(300)
+    large_cost, large_rendered, large_mismatched = measure_width_change(5000)
+    print(f"\n300 posts: {small_cost * 1000:.2f} ms, {small_rendered} posts rendered per width change")
+    print(f"5000 posts: {large_cost * 1000:.2f} ms, {large_rendered} posts rendered per width change")
+
+    assert not small_mismatched and not large_mismatched
+    # Only the posts in view are drawn at the new width, not the whole list
+    assert small_rendered <= 30 and large_rendered <= 30
+    # Rendering every post took ~2 s at 5000 posts
+    assert large_cost < 0.5
@@ -0,0 +1,33 @@
+import pytest
+import requests
+from prawcore.exceptions import RequestException, TooManyRequests
+from services.resilience import Resilience, RedditUnavailableError
+
+def failing(error):
+    calls = []
+
+    def fn():
+        calls.append(error)
+        raise error
+    return fn, calls
+
+def test_errors_prawcore_retried_are_not_retried_again():
+    resilience = Resilience(base_delay=0)
+    fn, calls = failing(RequestException(requests.exceptions.ConnectionError("down"), (), {}))
+
+    with pytest.raises(RedditUnavailableError):
+        resilience.call("listing", fn)
+
+    assert len(calls) == 1
+
+def test_other_transient_errors_are_retried():
+    resilience = Resilience(base_delay=0)
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["retry-after"] = "0"
+    fn, calls = failing(TooManyRequests(response))
+
+    with pytest.raises(RedditUnavailableError):
+        resilience.call("listing", fn)
+
+    assert len(calls) == resilience.max_attempts
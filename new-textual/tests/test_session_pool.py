@@ -0,0 +1,53 @@
+import time
+import types
+import praw
+import prawcore
+from services import session_pool
+from services.session_pool import Session
+
+def script_session():
+    reddit = praw.Reddit(client_id="id", client_secret="secret", user_agent="RedditTUI tests",
+                         username="alice", password="hunter2")
+    return Session("alice", reddit)
+
+def test_saved_token_is_restored():
+    session = script_session()
+
+    assert session.restore_token("token", time.time() + 600)
+
+    assert session.has_token
+    access_token, expires_at = session.token()
+    assert access_token == "token"
+    assert abs(expires_at - (time.time() + 600)) < 1
+
+def test_unsupported_prawcore_logs_in_normally(monkeypatch):
+    monkeypatch.setattr(session_pool, "TOKEN_REUSE", False)
+    session = script_session()
+
+    assert not session.restore_token("token", time.time() + 600)
+
+    assert session.token() is None
+    assert not session.has_token
+
+def test_prawcore_versions():
+    assert session_pool._supports_token_reuse("4.0.0")
+    assert session_pool._supports_token_reuse("3.0.0")
+    assert not session_pool._supports_token_reuse("2.4.0")
+    assert not session_pool._supports_token_reuse(None)
+
+def test_prawcore_authorizers():
+    assert session_pool.TOKEN_REUSE
+    assert session_pool._authorizers_support_token_reuse(prawcore.auth)
+
+    class OldAuthorizer:
+        def is_valid(self):
+            return self._expiration_timestamp > time.time()
+
+        def refresh(self):
+            pass
+    old_auth = types.SimpleNamespace(
+        BaseAuthorizer=OldAuthorizer, Authorizer=OldAuthorizer,
+        ScriptAuthorizer=OldAuthorizer, ReadOnlyAuthorizer=OldAuthorizer,
+    )
+    assert not session_pool._authorizers_support_token_reuse(old_auth)
+    assert not session_pool._authorizers_support_token_reuse(None)
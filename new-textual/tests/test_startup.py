@@ -0,0 +1,43 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds importing main may take, measured with -X importtime. Generous, it
+# guards against a heavy import slipping back in, not against a slow machine.
+IMPORT_BUDGET = 1.5
+# Only needed once the user opens the screen that uses them
+LAZY_MODULES = {
+    "qrcode", "PIL", "pyperclip",
+    "components.account_management_screen", "components.advanced_search_screen",
+    "components.comment_screen", "components.credits_screen", "components.help_screen",
+    "components.messages_screen", "components.post_creation_screen", "components.qr_screen",
+    "components.rate_limit_screen", "components.settings_screen",
+    "components.subreddit_management_screen", "components.subreddit_screen",
+    "components.theme_creation_screen", "components.user_profile_screen",
+}
+
+def import_times(tmp_path):
+    """{module: cumulative seconds} from importing main in a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": str(APP_DIR), "HOME": str(tmp_path)}
+    # Run elsewhere so the logger does not write into the checkout
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$", line)
+        if match:
+            times[match.group(2)] = int(match.group(1)) / 1e6
+    return times
+
+def test_startup_imports_stay_within_budget(tmp_path):
+    times = import_times(tmp_path)
+
+    assert sorted(LAZY_MODULES & times.keys()) == []
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[1:6]
+    assert times["main"] <= IMPORT_BUDGET, f"importing main took {times['main']:.2f}s, slowest: {slowest}"
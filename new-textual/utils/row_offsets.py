@@ -0,0 +1,77 @@
+class RowOffsets:
+    """Heights of the entries of a list and their prefix sums, in a Fenwick
+    tree, so the first row of an entry and the entry on a row are O(log n)
+    lookups and changing or appending a height is O(log n) as well.
+
+    Inserting or removing an entry in the middle rebuilds the tree from the
+    stored heights in O(n), without measuring anything again.
+    """
+
+    def __init__(self, heights=()):
+        self.reset(heights)
+
+    def reset(self, heights):
+        self._heights = list(heights)
+        self._tree = [0] * (len(self._heights) + 1)
+        for i, height in enumerate(self._heights, 1):
+            self._tree[i] += height
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self):
+        return len(self._heights)
+
+    def height(self, index):
+        return self._heights[index]
+
+    def offset(self, index):
+        """First row of the entry at index, the sum of the heights before it."""
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    @property
+    def total(self):
+        return self.offset(len(self._heights))
+
+    def find(self, row):
+        """Index of the entry row falls in, clamped to the entries."""
+        if not self._heights:
+            return 0
+        index = 0
+        step = 1 << (len(self._heights).bit_length() - 1)
+        while step:
+            if index + step <= len(self._heights) and self._tree[index + step] <= row:
+                index += step
+                row -= self._tree[index]
+            step >>= 1
+        return min(index, len(self._heights) - 1)
+
+    def set(self, index, height):
+        delta = height - self._heights[index]
+        if not delta:
+            return
+        self._heights[index] = height
+        index += 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def append(self, height):
+        self._heights.append(height)
+        i = len(self._heights)
+        # The new node covers the entries (i - lowbit(i), i]
+        self._tree.append(height + self.offset(i - 1) - self.offset(i - (i & -i)))
+
+    def insert(self, index, height):
+        heights = self._heights
+        heights.insert(index, height)
+        self.reset(heights)
+
+    def delete(self, index):
+        heights = self._heights
+        del heights[index]
+        self.reset(heights)